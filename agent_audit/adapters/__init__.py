@@ -2,26 +2,32 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from agent_audit.adapters.base import AgentAdapter
-from agent_audit.adapters.claude_code import ClaudeCodeAdapter
-from agent_audit.adapters.codex import CodexAdapter
-from agent_audit.adapters.mcp_generic import MCPGenericAdapter
-from agent_audit.adapters.nanobot import NanobotAdapter
-from agent_audit.adapters.openclaw import OpenClawAdapter
+from agent_audit.adapters.base import AdapterMatch, AgentAdapter
+from agent_audit.adapters.registry import AdapterRegistry, AdapterSpec, Signature, default_registry
+
+__all__ = [
+    "AdapterMatch",
+    "AdapterRegistry",
+    "AdapterSpec",
+    "AgentAdapter",
+    "Signature",
+    "all_adapters",
+    "default_registry",
+    "detect_adapter",
+    "match_adapter",
+]
 
 
 def all_adapters() -> list[AgentAdapter]:
-    return [
-        OpenClawAdapter(),
-        NanobotAdapter(),
-        ClaudeCodeAdapter(),
-        CodexAdapter(),
-        MCPGenericAdapter(),
-    ]
+    return default_registry().adapters()
+
+
+def match_adapter(path: Path) -> AdapterMatch:
+    match = default_registry().match(path)
+    if match is None:
+        raise ValueError(f"Could not detect supported agent at {path}")
+    return match
 
 
 def detect_adapter(path: Path) -> AgentAdapter:
-    for adapter in all_adapters():
-        if adapter.detect(path):
-            return adapter
-    raise ValueError(f"Could not detect supported agent at {path}")
+    return match_adapter(path).adapter
@@ -9,6 +9,11 @@ from agent_audit.types import AgentConfig, Skill
 
 class AgentAdapter(Protocol):
     name: str
+    # Relative paths and filename globs the adapter reads; used to map changed files onto
+    # agent roots (`scan --changed-since`).
+    _config_candidates: list[str]
+    _skills_candidates: list[str]
+    _detect_globs: list[str]
 
     def detect(self, path: Path) -> bool:
         """Return True if this adapter matches the path."""
@@ -27,3 +32,5 @@ class AgentAdapter(Protocol):
 class AdapterMatch:
     adapter: AgentAdapter
     path: Path
+    # 1.0 for an exact config signature, lower for generic names and fuzzy probes.
+    confidence: float = 1.0
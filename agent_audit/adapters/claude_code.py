@@ -3,11 +3,12 @@ from __future__ import annotations
 from pathlib import Path
 
 from agent_audit.adapters.helpers import (
+    extract_endpoints,
     first_existing,
-    flatten_endpoint_values,
     flatten_skills,
     list_of_strings,
     read_json,
+    skill_path,
 )
 from agent_audit.types import AgentConfig, Skill
 
@@ -19,6 +20,8 @@ class ClaudeCodeAdapter:
         ".claude/settings.json",
         "claude-code.json",
     ]
+    _skills_candidates = [".claude/skills.json", "claude-skills.json"]
+    _detect_globs: list[str] = []
 
     def detect(self, path: Path) -> bool:
         return first_existing(path, self._config_candidates) is not None
@@ -27,6 +30,7 @@ class ClaudeCodeAdapter:
         config_path = first_existing(path, self._config_candidates)
         payload = read_json(config_path) if config_path else {}
         permissions = payload.get("permissions", {}) if isinstance(payload.get("permissions"), dict) else {}
+        endpoints = extract_endpoints(payload.get("mcpServers", {}), "mcpServers")
 
         return AgentConfig(
             agent_name="Claude Code",
@@ -35,14 +39,18 @@ class ClaudeCodeAdapter:
             allowed_paths=list_of_strings(permissions.get("allow", payload.get("allow", []))),
             blocked_paths=list_of_strings(permissions.get("deny", payload.get("deny", []))),
             shell_mode=str(permissions.get("shell", payload.get("shell", "unknown"))).lower(),
-            endpoints=flatten_endpoint_values(payload.get("mcpServers", {})),
+            endpoints=[endpoint.value for endpoint in endpoints],
+            endpoint_sources=endpoints,
             env_var_refs=list_of_strings(payload.get("env", [])),
             hardcoded_secrets=list_of_strings(payload.get("secrets", [])),
-            metadata={"config_path": str(config_path) if config_path else ""},
+            metadata={
+                "config_path": str(config_path) if config_path else "",
+                "config_file": config_path,
+            },
         )
 
     def get_skills(self, path: Path) -> list[Skill]:
-        skills_path = first_existing(path, [".claude/skills.json", "claude-skills.json"])
+        skills_path = first_existing(path, self._skills_candidates)
         payload = read_json(skills_path) if skills_path else {}
         skills_payload = flatten_skills(payload.get("skills", payload))
         return [
@@ -50,6 +58,7 @@ class ClaudeCodeAdapter:
                 name=str(item.get("name", "unknown")),
                 permissions=list_of_strings(item.get("permissions", [])),
                 source=str(skills_path) if skills_path else "",
+                path=skill_path(item),
             )
             for item in skills_payload
         ]
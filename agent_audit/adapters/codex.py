@@ -3,12 +3,13 @@ from __future__ import annotations
 from pathlib import Path
 
 from agent_audit.adapters.helpers import (
+    extract_endpoints,
     first_existing,
-    flatten_endpoint_values,
     flatten_skills,
     list_of_strings,
     read_json,
     read_toml,
+    skill_path,
 )
 from agent_audit.types import AgentConfig, Skill
 
@@ -21,6 +22,8 @@ class CodexAdapter:
         "codex.toml",
         "codex.json",
     ]
+    _skills_candidates = [".codex/skills.json", "skills.json"]
+    _detect_globs: list[str] = []
 
     def detect(self, path: Path) -> bool:
         return first_existing(path, self._config_candidates) is not None
@@ -45,7 +48,8 @@ class CodexAdapter:
             permissions.get("shell", payload.get("shell", sandbox.get("shell", "unknown")))
         ).lower()
 
-        endpoints = flatten_endpoint_values(payload.get("network", payload.get("endpoints", [])))
+        network_key = "network" if "network" in payload else "endpoints"
+        endpoints = extract_endpoints(payload.get(network_key, []), network_key)
 
         return AgentConfig(
             agent_name="Codex",
@@ -54,14 +58,18 @@ class CodexAdapter:
             allowed_paths=allowed_paths,
             blocked_paths=blocked_paths,
             shell_mode=shell_mode,
-            endpoints=endpoints,
+            endpoints=[endpoint.value for endpoint in endpoints],
+            endpoint_sources=endpoints,
             env_var_refs=list_of_strings(payload.get("env", payload.get("env_vars", []))),
             hardcoded_secrets=list_of_strings(payload.get("hardcoded_secrets", [])),
-            metadata={"config_path": str(config_path) if config_path else ""},
+            metadata={
+                "config_path": str(config_path) if config_path else "",
+                "config_file": config_path,
+            },
         )
 
     def get_skills(self, path: Path) -> list[Skill]:
-        skills_path = first_existing(path, [".codex/skills.json", "skills.json"])
+        skills_path = first_existing(path, self._skills_candidates)
         payload = read_json(skills_path) if skills_path else {}
         skills_payload = flatten_skills(payload.get("skills", payload))
         return [
@@ -69,6 +77,7 @@ class CodexAdapter:
                 name=str(item.get("name", "unknown")),
                 permissions=list_of_strings(item.get("permissions", [])),
                 source=str(skills_path) if skills_path else "",
+                path=skill_path(item),
             )
             for item in skills_payload
         ]
@@ -1,21 +1,86 @@
 from __future__ import annotations
 
+import fnmatch
 import json
-import tomllib
+import os
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
 from pathlib import Path
 from typing import Any
 
+from agent_audit.types import Endpoint
+from agent_audit.utils.netclass import WILDCARD_HOSTS
+from agent_audit.utils.profiling import count_read, count_stat
+
+
+class ParseCache:
+    """LRU of parsed config files keyed by (path, mtime_ns, size).
+
+    Only enabled in long-lived processes (`agent-audit serve`). Cached payloads are shared
+    between scans, so callers must treat them as read-only.
+    """
+
+    def __init__(self, max_entries: int = 4096) -> None:
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple[str, int, int], dict[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def load(self, path: Path, parse: Callable[[str], Any]) -> dict[str, Any]:
+        stat = path.stat()
+        count_stat()
+        key = (str(path), stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return cached
+        payload = parse(_read_text(path))
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = payload
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return payload
+
+
+_parse_cache: ParseCache | None = None
+
+
+def enable_parse_cache(max_entries: int = 4096) -> ParseCache:
+    global _parse_cache
+    _parse_cache = ParseCache(max_entries)
+    return _parse_cache
+
+
+def _read_text(path: Path) -> str:
+    text = path.read_text(encoding="utf-8")
+    count_read(len(text))
+    return text
+
+
+def _load(path: Path, parse: Callable[[str], Any]) -> Any:
+    if _parse_cache is not None:
+        return _parse_cache.load(path, parse)
+    return parse(_read_text(path))
+
 
 def read_json(path: Path) -> dict[str, Any]:
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        return _load(path, json.loads)
     except (OSError, ValueError):
         return {}
 
 
 def read_toml(path: Path) -> dict[str, Any]:
+    import tomllib  # only codex configs are TOML
+
     try:
-        return tomllib.loads(path.read_text(encoding="utf-8"))
+        return _load(path, tomllib.loads)
     except (OSError, tomllib.TOMLDecodeError):
         return {}
 
@@ -23,11 +88,25 @@ def read_toml(path: Path) -> dict[str, Any]:
 def first_existing(base: Path, candidates: list[str]) -> Path | None:
     for candidate in candidates:
         full = base / candidate
-        if full.exists() and full.is_file():
+        count_stat()
+        if full.is_file():
             return full
     return None
 
 
+def find_files(base: Path, pattern: str) -> Iterator[Path]:
+    """Files anywhere under `base` whose name matches `pattern`, like `base.glob("**/" + pattern)`.
+
+    Every directory entry visited is counted as stat'ed, matched or not.
+    """
+    walk = os.walk(base) if isinstance(base, Path) else base.walk()
+    for current, dirnames, filenames in walk:
+        count_stat(len(dirnames) + len(filenames))
+        directory = Path(current) if isinstance(current, str) else current
+        for name in fnmatch.filter(filenames, pattern):
+            yield directory / name
+
+
 def list_of_strings(value: Any) -> list[str]:
     if isinstance(value, list):
         return [str(item) for item in value if item is not None]
@@ -36,16 +115,77 @@ def list_of_strings(value: Any) -> list[str]:
     return []
 
 
-def flatten_endpoint_values(value: Any) -> list[str]:
-    endpoints: list[str] = []
-    if isinstance(value, str):
-        endpoints.append(value)
-    elif isinstance(value, list):
-        for item in value:
-            endpoints.extend(flatten_endpoint_values(item))
-    elif isinstance(value, dict):
-        for dict_value in value.values():
-            endpoints.extend(flatten_endpoint_values(dict_value))
+_COMMAND_KEYS = frozenset({"command", "args", "cmd", "argv"})
+_ENV_KEYS = frozenset({"env", "environment", "headers"})
+_IDENTIFIER = re.compile(r"[A-Za-z_][A-Za-z0-9_\-]*")
+
+# URLs, IPv4 addresses and host:port pairs embedded anywhere in a string.
+_EMBEDDED_ENDPOINT = re.compile(
+    r"[A-Za-z][A-Za-z0-9+.\-]*://[^\s\"'<>]+"
+    r"|\b(?:\d{1,3}\.){3}\d{1,3}(?::\d{1,5})?\b"
+    r"|\b(?:localhost|[A-Za-z0-9\-]+(?:\.[A-Za-z0-9\-]+)+):\d{1,5}\b"
+)
+# A whole config value naming a host: dotted name ending in an alphabetic label, optionally with
+# port and path, localhost, or a bracketed IPv6 address.
+_BARE_HOST = re.compile(
+    r"(?:\*\.)?(?:[A-Za-z0-9\-]+\.)+[A-Za-z][A-Za-z0-9\-]*(?::\d{1,5})?(?:/\S*)?"
+    r"|localhost(?::\d{1,5})?"
+    r"|\[[0-9A-Fa-f:.]+\](?::\d{1,5})?"
+)
+_TRAILING = ".,;:)]}'\""
+
+
+def _child_origin(key: str, origin: str) -> str:
+    lowered = key.lower()
+    if lowered in _COMMAND_KEYS:
+        return "command"
+    if lowered in _ENV_KEYS:
+        return "env"
+    return origin
+
+
+def _key_path(path: str, key: str) -> str:
+    if _IDENTIFIER.fullmatch(key):
+        return f"{path}.{key}" if path else key
+    return f"{path}[{json.dumps(key)}]"
+
+
+def _string_endpoints(text: str, path: str, origin: str) -> list[Endpoint]:
+    value = text.strip()
+    # A config value that is itself a host or wildcard counts whole; command lines and env
+    # values only contribute the URLs and addresses embedded in them.
+    if origin == "url" and (value in WILDCARD_HOSTS or _BARE_HOST.fullmatch(value)):
+        return [Endpoint(value, path, origin)]
+    return [
+        Endpoint(match.group(0).rstrip(_TRAILING), path, origin)
+        for match in _EMBEDDED_ENDPOINT.finditer(value)
+    ]
+
+
+def extract_endpoints(value: Any, path: str = "", origin: str = "url") -> list[Endpoint]:
+    """Endpoints found under `value`, in document order, tagged with JSON path and origin.
+
+    Walks the tree with an explicit stack, so deeply nested configs cannot hit the recursion
+    limit. Values under `command`/`args` are tagged "command" and under `env`/`headers` "env";
+    in those only embedded URLs, IPs and host:port pairs count, so `npx` or `--port` are not
+    mistaken for hosts.
+    """
+    endpoints: list[Endpoint] = []
+    stack: list[tuple[Any, str, str]] = [(value, path, origin)]
+    while stack:
+        node, node_path, node_origin = stack.pop()
+        if isinstance(node, str):
+            endpoints.extend(_string_endpoints(node, node_path, node_origin))
+        elif isinstance(node, dict):
+            stack.extend(
+                (child, _key_path(node_path, str(key)), _child_origin(str(key), node_origin))
+                for key, child in reversed(node.items())
+            )
+        elif isinstance(node, list):
+            stack.extend(
+                (node[index], f"{node_path}[{index}]", node_origin)
+                for index in range(len(node) - 1, -1, -1)
+            )
     return endpoints
 
 
@@ -60,3 +200,12 @@ def flatten_skills(value: Any) -> list[dict[str, Any]]:
                 results.append(current)
         return results
     return []
+
+
+def skill_path(item: dict[str, Any]) -> str:
+    """Explicit skill directory declared in a skills manifest entry, if any."""
+    for key in ("path", "dir", "directory"):
+        value = item.get(key)
+        if isinstance(value, str) and value.strip():
+            return value.strip()
+    return ""
@@ -3,32 +3,41 @@ from __future__ import annotations
 from pathlib import Path
 
 from agent_audit.adapters.helpers import (
+    extract_endpoints,
+    find_files,
     first_existing,
-    flatten_endpoint_values,
     list_of_strings,
     read_json,
 )
 from agent_audit.types import AgentConfig, Skill
 
 
+def has_mcp_servers(path: Path) -> bool:
+    payload = read_json(path)
+    return "mcpServers" in payload or "mcp_servers" in payload
+
+
 class MCPGenericAdapter:
     name = "mcp_generic"
 
     _config_candidates = ["mcp.json", ".mcp/config.json", "mcp-servers.json"]
+    _skills_candidates: list[str] = []
+    # Any JSON file declaring MCP servers; see _detect_file().
+    _detect_globs = ["*.json"]
+
+    def _detect_file(self, path: Path) -> bool:
+        return has_mcp_servers(path)
 
     def detect(self, path: Path) -> bool:
         if first_existing(path, self._config_candidates):
             return True
-        for candidate in path.glob("**/*.json"):
-            payload = read_json(candidate)
-            if "mcpServers" in payload or "mcp_servers" in payload:
-                return True
-        return False
+        return any(has_mcp_servers(candidate) for candidate in find_files(path, "*.json"))
 
     def get_config(self, path: Path) -> AgentConfig:
         config_path = first_existing(path, self._config_candidates)
         payload = read_json(config_path) if config_path else {}
-        servers = payload.get("mcpServers", payload.get("mcp_servers", {}))
+        servers_key = "mcpServers" if "mcpServers" in payload else "mcp_servers"
+        endpoints = extract_endpoints(payload.get(servers_key, {}), servers_key)
 
         return AgentConfig(
             agent_name="MCP",
@@ -37,10 +46,14 @@ class MCPGenericAdapter:
             allowed_paths=list_of_strings(payload.get("allowedPaths", [])),
             blocked_paths=list_of_strings(payload.get("blockedPaths", [])),
             shell_mode=str(payload.get("shell", "unknown")).lower(),
-            endpoints=flatten_endpoint_values(servers),
+            endpoints=[endpoint.value for endpoint in endpoints],
+            endpoint_sources=endpoints,
             env_var_refs=list_of_strings(payload.get("env", [])),
             hardcoded_secrets=list_of_strings(payload.get("secrets", [])),
-            metadata={"config_path": str(config_path) if config_path else ""},
+            metadata={
+                "config_path": str(config_path) if config_path else "",
+                "config_file": config_path,
+            },
         )
 
     def get_skills(self, path: Path) -> list[Skill]:
@@ -3,11 +3,13 @@ from __future__ import annotations
 from pathlib import Path
 
 from agent_audit.adapters.helpers import (
+    extract_endpoints,
+    find_files,
     first_existing,
-    flatten_endpoint_values,
     flatten_skills,
     list_of_strings,
     read_json,
+    skill_path,
 )
 from agent_audit.types import AgentConfig, Skill
 
@@ -16,18 +18,22 @@ class NanobotAdapter:
     name = "nanobot"
 
     _config_candidates = ["nanobot.json", ".nanobot/config.json", "config.json"]
+    _skills_candidates = ["nanobot-skills.json", ".nanobot/skills.json"]
+    _detect_globs = ["*nanobot*.json"]
 
     def detect(self, path: Path) -> bool:
         config = first_existing(path, self._config_candidates)
         if config:
             payload = read_json(config)
             return str(payload.get("agent", "")).lower() in {"nanobot", ""}
-        return any(path.glob("**/*nanobot*.json"))
+        return any(find_files(path, "*nanobot*.json"))
 
     def get_config(self, path: Path) -> AgentConfig:
         config_path = first_existing(path, self._config_candidates)
         payload = read_json(config_path) if config_path else {}
         perms = payload.get("permissions", {}) if isinstance(payload.get("permissions"), dict) else {}
+        network_key = "network" if "network" in payload else "endpoints"
+        endpoints = extract_endpoints(payload.get(network_key, []), network_key)
 
         return AgentConfig(
             agent_name="Nanobot",
@@ -36,14 +42,18 @@ class NanobotAdapter:
             allowed_paths=list_of_strings(payload.get("allowed_paths", perms.get("filesystem", []))),
             blocked_paths=list_of_strings(payload.get("blocked_paths", [])),
             shell_mode=str(perms.get("shell", payload.get("shell", "unknown"))).lower(),
-            endpoints=flatten_endpoint_values(payload.get("network", payload.get("endpoints", []))),
+            endpoints=[endpoint.value for endpoint in endpoints],
+            endpoint_sources=endpoints,
             env_var_refs=list_of_strings(payload.get("env_refs", [])),
             hardcoded_secrets=list_of_strings(payload.get("hardcoded_secrets", [])),
-            metadata={"config_path": str(config_path) if config_path else ""},
+            metadata={
+                "config_path": str(config_path) if config_path else "",
+                "config_file": config_path,
+            },
         )
 
     def get_skills(self, path: Path) -> list[Skill]:
-        skills_path = first_existing(path, ["nanobot-skills.json", ".nanobot/skills.json"])
+        skills_path = first_existing(path, self._skills_candidates)
         payload = read_json(skills_path) if skills_path else {}
         skills_payload = flatten_skills(payload.get("skills", payload))
         return [
@@ -51,6 +61,7 @@ class NanobotAdapter:
                 name=str(item.get("name", "unknown")),
                 permissions=list_of_strings(item.get("permissions", [])),
                 source=str(skills_path) if skills_path else "",
+                path=skill_path(item),
             )
             for item in skills_payload
         ]
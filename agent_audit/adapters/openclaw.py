@@ -3,11 +3,13 @@ from __future__ import annotations
 from pathlib import Path
 
 from agent_audit.adapters.helpers import (
+    extract_endpoints,
+    find_files,
     first_existing,
-    flatten_endpoint_values,
     flatten_skills,
     list_of_strings,
     read_json,
+    skill_path,
 )
 from agent_audit.types import AgentConfig, Skill
 
@@ -20,12 +22,14 @@ class OpenClawAdapter:
         ".openclaw/config.json",
         "config/openclaw.json",
     ]
+    _skills_candidates = ["skills.json", ".openclaw/skills.json"]
+    _detect_globs = ["*openclaw*.json"]
 
     def detect(self, path: Path) -> bool:
         config = first_existing(path, self._config_candidates)
         if config:
             return True
-        return any(path.glob("**/*openclaw*.json"))
+        return any(find_files(path, "*openclaw*.json"))
 
     def get_config(self, path: Path) -> AgentConfig:
         config_path = first_existing(path, self._config_candidates)
@@ -34,8 +38,8 @@ class OpenClawAdapter:
         permissions = payload.get("permissions", {}) if isinstance(payload.get("permissions"), dict) else {}
         shell_mode = str(permissions.get("shell", payload.get("shell", "unknown"))).lower()
 
-        endpoints = flatten_endpoint_values(payload.get("endpoints", []))
-        endpoints.extend(flatten_endpoint_values(payload.get("mcpServers", {})))
+        endpoints = extract_endpoints(payload.get("endpoints", []), "endpoints")
+        endpoints.extend(extract_endpoints(payload.get("mcpServers", {}), "mcpServers"))
 
         return AgentConfig(
             agent_name="OpenClaw",
@@ -44,14 +48,18 @@ class OpenClawAdapter:
             allowed_paths=list_of_strings(payload.get("allowedPaths", permissions.get("allowedPaths", []))),
             blocked_paths=list_of_strings(payload.get("blockedPaths", permissions.get("blockedPaths", []))),
             shell_mode=shell_mode,
-            endpoints=endpoints,
+            endpoints=[endpoint.value for endpoint in endpoints],
+            endpoint_sources=endpoints,
             env_var_refs=list_of_strings(payload.get("env", [])),
             hardcoded_secrets=list_of_strings(payload.get("hardcodedSecrets", [])),
-            metadata={"config_path": str(config_path) if config_path else ""},
+            metadata={
+                "config_path": str(config_path) if config_path else "",
+                "config_file": config_path,
+            },
         )
 
     def get_skills(self, path: Path) -> list[Skill]:
-        skills_path = first_existing(path, ["skills.json", ".openclaw/skills.json"])
+        skills_path = first_existing(path, self._skills_candidates)
         payload = read_json(skills_path) if skills_path else {}
         skills_payload = flatten_skills(payload.get("skills", payload))
 
@@ -62,6 +70,7 @@ class OpenClawAdapter:
                     name=str(item.get("name", "unknown")),
                     permissions=list_of_strings(item.get("permissions", [])),
                     source=str(skills_path) if skills_path else "",
+                    path=skill_path(item),
                 )
             )
         return skills
@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+import importlib
+import os
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path, PurePosixPath
+from typing import TYPE_CHECKING, Any
+
+from agent_audit.adapters.base import AdapterMatch, AgentAdapter
+from agent_audit.utils.profiling import count_stat, stage
+
+if TYPE_CHECKING:
+    from agent_audit.utils.vfs import VirtualPath
+
+ENTRY_POINT_GROUP = "agent_audit.adapters"
+
+# Signatures at or above this confidence identify an adapter without loading it; weaker ones
+# (generic names such as `config.json`) are confirmed with the adapter's own detect().
+EXACT_CONFIDENCE = 0.9
+FUZZY_CONFIDENCE = 0.5
+
+
+@dataclass(slots=True, frozen=True)
+class Signature:
+    path: str
+    confidence: float = 1.0
+
+
+@dataclass(slots=True)
+class AdapterSpec:
+    """Lazily loaded adapter: `target` is "module:Class", imported on first use."""
+
+    name: str
+    target: str
+    signatures: tuple[Signature, ...] = ()
+    _adapter: AgentAdapter | None = field(default=None, repr=False, compare=False)
+
+    def load(self) -> AgentAdapter:
+        if self._adapter is None:
+            module_name, _, attribute = self.target.partition(":")
+            factory = getattr(importlib.import_module(module_name), attribute)
+            self._adapter = factory()
+        return self._adapter
+
+
+def _spec(name: str, target: str, *signatures: tuple[str, float]) -> AdapterSpec:
+    return AdapterSpec(
+        name=name,
+        target=target,
+        signatures=tuple(Signature(path, confidence) for path, confidence in signatures),
+    )
+
+
+# Order breaks confidence ties and is the fuzzy probe order.
+BUILTIN_SPECS = (
+    _spec(
+        "openclaw",
+        "agent_audit.adapters.openclaw:OpenClawAdapter",
+        ("openclaw.json", 1.0),
+        (".openclaw/config.json", 1.0),
+        ("config/openclaw.json", 1.0),
+    ),
+    _spec(
+        "nanobot",
+        "agent_audit.adapters.nanobot:NanobotAdapter",
+        ("nanobot.json", 1.0),
+        (".nanobot/config.json", 1.0),
+        ("config.json", 0.6),
+    ),
+    _spec(
+        "claude_code",
+        "agent_audit.adapters.claude_code:ClaudeCodeAdapter",
+        (".claude/settings.json", 1.0),
+        ("claude-code.json", 1.0),
+    ),
+    _spec(
+        "codex",
+        "agent_audit.adapters.codex:CodexAdapter",
+        (".codex/config.toml", 1.0),
+        ("codex.toml", 1.0),
+        ("codex.json", 1.0),
+    ),
+    _spec(
+        "mcp_generic",
+        "agent_audit.adapters.mcp_generic:MCPGenericAdapter",
+        ("mcp.json", 0.9),
+        (".mcp/config.json", 0.9),
+        ("mcp-servers.json", 0.9),
+    ),
+)
+
+
+def _entry_point_specs() -> list[AdapterSpec]:
+    """Third-party adapters from the `agent_audit.adapters` entry point group.
+
+    An entry point may name an `AdapterSpec` (signatures available without importing the
+    adapter) or an adapter class (fuzzy detection only).
+    """
+    from importlib.metadata import entry_points
+
+    specs: list[AdapterSpec] = []
+    for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+        try:
+            loaded: Any = entry_point.load()
+        except Exception:  # noqa: BLE001 - a broken plugin must not break scanning
+            continue
+        if isinstance(loaded, AdapterSpec):
+            specs.append(loaded)
+        elif isinstance(loaded, type):
+            specs.append(AdapterSpec(name=entry_point.name, target=entry_point.value))
+    return specs
+
+
+def _list_directory(directory: Path | VirtualPath) -> dict[str, bool]:
+    if isinstance(directory, Path):
+        with os.scandir(directory) as scanner:
+            entries = {entry.name: entry.is_file() for entry in scanner}
+    else:
+        entries = {entry.name: entry.is_file() for entry in directory.iterdir()}
+    count_stat(len(entries))
+    return entries
+
+
+def _skip(message: str, *args: object) -> None:
+    import logging  # only needed once a plugin is broken; kept off the scan startup path
+
+    logging.getLogger(__name__).warning("Skipping adapter " + message, *args, exc_info=True)
+
+
+def _load(spec: AdapterSpec) -> AgentAdapter | None:
+    try:
+        with stage("adapter.import"):
+            return spec.load()
+    except Exception:  # noqa: BLE001 - a broken plugin must not break scanning
+        _skip("%s (%s): failed to load", spec.name, spec.target)
+        return None
+
+
+def _detects(spec: AdapterSpec, adapter: AgentAdapter, path: Path | VirtualPath) -> bool:
+    try:
+        with stage(f"detect.{spec.name}"):
+            return bool(adapter.detect(path))
+    except Exception:  # noqa: BLE001 - a broken plugin must not break scanning
+        _skip("%s: detect() failed on %s", spec.name, path)
+        return False
+
+
+def _existing_files(root: Path | VirtualPath, relative_paths: Iterable[str]) -> set[str]:
+    """Which of `relative_paths` are files under `root`, listing each parent directory once."""
+    listings: dict[str, dict[str, bool] | None] = {}
+
+    def listing(directory: str) -> dict[str, bool] | None:
+        if directory not in listings:
+            entries: dict[str, bool] | None = None
+            parent, _, name = directory.rpartition("/")
+            if not directory or (listing(parent) or {}).get(name) is False:
+                try:
+                    entries = _list_directory(root / directory)
+                except OSError:
+                    entries = None
+            listings[directory] = entries
+        return listings[directory]
+
+    found: set[str] = set()
+    for relative in relative_paths:
+        pure = PurePosixPath(relative)
+        parent = "" if str(pure.parent) == "." else str(pure.parent)
+        if (listing(parent) or {}).get(pure.name):
+            found.add(relative)
+    return found
+
+
+class AdapterRegistry:
+    def __init__(
+        self, specs: Iterable[AdapterSpec] = BUILTIN_SPECS, entry_points: bool = True
+    ) -> None:
+        self._specs = list(specs)
+        self._entry_points = entry_points
+        self._lock = threading.Lock()
+
+    @property
+    def specs(self) -> list[AdapterSpec]:
+        if self._entry_points:
+            with self._lock:
+                if self._entry_points:
+                    known = {spec.name for spec in self._specs}
+                    with stage("detect.entry_points"):
+                        plugins = _entry_point_specs()
+                    self._specs.extend(spec for spec in plugins if spec.name not in known)
+                    self._entry_points = False
+        return self._specs
+
+    def register(self, spec: AdapterSpec) -> None:
+        self.specs.append(spec)
+
+    def adapters(self) -> list[AgentAdapter]:
+        return [adapter for spec in self.specs if (adapter := _load(spec)) is not None]
+
+    def match(self, path: Path | VirtualPath) -> AdapterMatch | None:
+        if self._entry_points:
+            # Confidence tops out at 1.0 and ties go to the earlier (built-in) spec, so a full
+            # confidence built-in hit cannot be outranked; plugin discovery (and the
+            # importlib.metadata import) is skipped for it.
+            found = self._match_signatures(path, self._specs)
+            if found is not None and found.confidence >= 1.0:
+                return found
+        specs = self.specs
+        found = self._match_signatures(path, specs)
+        if found is not None:
+            return found
+
+        for spec in specs:
+            adapter = _load(spec)
+            if adapter is not None and _detects(spec, adapter, path):
+                return AdapterMatch(adapter=adapter, path=path, confidence=FUZZY_CONFIDENCE)
+        return None
+
+    def _match_signatures(
+        self, path: Path | VirtualPath, specs: list[AdapterSpec]
+    ) -> AdapterMatch | None:
+        signatures = {signature.path for spec in specs for signature in spec.signatures}
+        with stage("detect.signatures"):
+            existing = _existing_files(path, signatures)
+
+        hits = [
+            (signature.confidence, -order, spec)
+            for order, spec in enumerate(specs)
+            for signature in spec.signatures
+            if signature.path in existing
+        ]
+        hits.sort(key=lambda hit: (hit[0], hit[1]), reverse=True)
+        for confidence, _, spec in hits:
+            adapter = _load(spec)
+            if adapter is None:
+                continue
+            if confidence >= EXACT_CONFIDENCE or _detects(spec, adapter, path):
+                return AdapterMatch(adapter=adapter, path=path, confidence=confidence)
+        return None
+
+
+@lru_cache(maxsize=1)
+def default_registry() -> AdapterRegistry:
+    return AdapterRegistry()
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
-from pathlib import Path
-
 from agent_audit.types import AgentConfig, CheckResult
-from agent_audit.utils.paths import is_unrestricted_path, normalize_path, references_sensitive_location
+from agent_audit.utils.paths import (
+    PathResolver,
+    build_scope_trie,
+    is_unrestricted_path,
+    is_within,
+    references_sensitive_location,
+)
 
 
-def evaluate_filesystem(config: AgentConfig) -> CheckResult:
+def evaluate_filesystem(config: AgentConfig, resolver: PathResolver | None = None) -> CheckResult:
     key = "filesystem"
     title = "File System Access"
     details: list[str] = []
@@ -22,27 +26,35 @@ def evaluate_filesystem(config: AgentConfig) -> CheckResult:
             details=["Declare explicit allowed paths in agent config."],
         )
 
+    resolver = resolver or PathResolver()
+    root = resolver.root(config.root_path)
+    trie, resolved_allowed = build_scope_trie(allowed_paths, config.blocked_paths, root, resolver)
+
+    shadowed: set[str] = set()
+    for raw_path, resolved in resolved_allowed.items():
+        blocker = trie.covering(resolved, "deny")
+        if blocker is not None:
+            shadowed.add(raw_path)
+            details.append(
+                f"Allowed path shadowed by blocked path: {raw_path} (blocked by {blocker})"
+            )
+
     unrestricted = any(is_unrestricted_path(path) for path in allowed_paths)
     if unrestricted:
         details.extend([f"Unrestricted path detected: {path}" for path in allowed_paths if is_unrestricted_path(path)])
 
-    sensitive_hits = [path for path in allowed_paths if references_sensitive_location(path)]
+    sensitive_hits = [
+        path
+        for path in allowed_paths
+        if path not in shadowed and references_sensitive_location(path)
+    ]
     details.extend([f"Sensitive location accessible: {path}" for path in sensitive_hits])
 
-    root = normalize_path(config.root_path)
-    out_of_scope: list[str] = []
-    for raw_path in allowed_paths:
-        if is_unrestricted_path(raw_path):
-            continue
-        candidate = Path(raw_path).expanduser()
-        if not candidate.is_absolute():
-            candidate = (root / candidate).resolve()
-        else:
-            candidate = candidate.resolve()
-        try:
-            candidate.relative_to(root)
-        except ValueError:
-            out_of_scope.append(raw_path)
+    out_of_scope = [
+        raw_path
+        for raw_path, resolved in resolved_allowed.items()
+        if raw_path not in shadowed and not is_within(root, resolved)
+    ]
 
     if out_of_scope:
         details.extend([f"Path exceeds project scope: {path}" for path in out_of_scope])
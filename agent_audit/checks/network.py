@@ -1,25 +1,20 @@
 from __future__ import annotations
 
-from urllib.parse import urlparse
+from collections.abc import Sequence
 
-from agent_audit.types import CheckResult
+from agent_audit.types import CheckResult, Endpoint
+from agent_audit.utils.netclass import NetworkClassifier, load_network_classifier
 
+# Labels from the network rule file (agent_audit/rules/network.json) and how they score.
+TRUSTED_LABELS = {"allow"}
+RISKY_LABELS = {"deny", "metadata"}
+INTERNAL_LABELS = {"loopback", "private", "link_local"}
 
-KNOWN_API_DOMAINS = {
-    "api.openai.com",
-    "api.anthropic.com",
-    "api.github.com",
-}
 
-RISKY_DOMAINS = {
-    "raw.githubusercontent.com",
-    "pastebin.com",
-    "ngrok.io",
-    "ngrok-free.app",
-}
-
-
-def evaluate_network(endpoints: list[str]) -> CheckResult:
+def evaluate_network(
+    endpoints: Sequence[str | Endpoint],
+    classifier: NetworkClassifier | None = None,
+) -> CheckResult:
     key = "network"
     title = "Network Egress"
 
@@ -33,26 +28,39 @@ def evaluate_network(endpoints: list[str]) -> CheckResult:
             details=[],
         )
 
+    classifier = classifier or load_network_classifier()
     details: list[str] = []
     has_http = False
     unknown_domains: set[str] = set()
     risky_domains: set[str] = set()
+    internal_hosts: set[str] = set()
     wildcard = False
 
-    for endpoint in endpoints:
-        value = endpoint.strip()
-        if any(token in value for token in {"*", "0.0.0.0", "any"}):
-            wildcard = True
-        parsed = urlparse(value if "://" in value else f"https://{value}")
-        domain = parsed.netloc or parsed.path
-        if parsed.scheme == "http":
+    for item in endpoints:
+        # The JSON path stays out of details: it is positional and details are fingerprinted.
+        endpoint = item.value if isinstance(item, Endpoint) else item
+        endpoint_class = classifier.classify(endpoint)
+        host = endpoint_class.host
+        label = endpoint_class.label
+        if endpoint_class.scheme == "http":
             has_http = True
             details.append(f"Non-TLS endpoint: {endpoint}")
-        if domain in RISKY_DOMAINS:
-            risky_domains.add(domain)
-            details.append(f"Code-fetch/exfil domain configured: {domain}")
-        if domain and domain not in KNOWN_API_DOMAINS and domain not in RISKY_DOMAINS:
-            unknown_domains.add(domain)
+        if label == "wildcard":
+            wildcard = True
+            details.append(f"Wildcard endpoint: {endpoint}")
+        elif label == "metadata":
+            risky_domains.add(host)
+            details.append(f"Cloud metadata endpoint configured: {host}")
+        elif label in RISKY_LABELS:
+            risky_domains.add(host)
+            details.append(f"Code-fetch/exfil domain configured: {host}")
+        elif label in INTERNAL_LABELS:
+            internal_hosts.add(host)
+        elif host and label not in TRUSTED_LABELS:
+            unknown_domains.add(host)
+
+    if internal_hosts:
+        details.append(f"Internal network endpoints: {', '.join(sorted(internal_hosts))}")
 
     if has_http or wildcard:
         score = 10.0
@@ -2,8 +2,13 @@ from __future__ import annotations
 
 import re
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from agent_audit.types import AgentConfig, CheckResult
+from agent_audit.utils.profiling import count_read, count_stat
+
+if TYPE_CHECKING:
+    from agent_audit.utils.vfs import VirtualPath
 
 
 SECRET_PATTERNS = [
@@ -12,13 +17,15 @@ SECRET_PATTERNS = [
 ]
 
 
-def _scan_file_for_hardcoded_secrets(path: Path) -> list[str]:
+def _scan_file_for_hardcoded_secrets(path: Path | VirtualPath) -> list[str]:
+    count_stat()
     if not path.exists() or not path.is_file():
         return []
     try:
         text = path.read_text(encoding="utf-8")
     except OSError:
         return []
+    count_read(len(text))
 
     hits: list[str] = []
     for pattern in SECRET_PATTERNS:
@@ -37,9 +44,13 @@ def evaluate_secrets(config: AgentConfig) -> CheckResult:
     title = "Secrets Exposure"
 
     file_hits: list[str] = []
-    config_path = config.metadata.get("config_path", "") if isinstance(config.metadata, dict) else ""
-    if config_path:
-        file_hits = _scan_file_for_hardcoded_secrets(Path(config_path))
+    metadata = config.metadata if isinstance(config.metadata, dict) else {}
+    # Adapters pass the path object so configs inside archives are read from the archive.
+    config_file = metadata.get("config_file") or (
+        Path(metadata["config_path"]) if metadata.get("config_path") else None
+    )
+    if config_file is not None:
+        file_hits = _scan_file_for_hardcoded_secrets(config_file)
 
     hardcoded = sorted(set(config.hardcoded_secrets + file_hits))
     env_refs = sorted(set(config.env_var_refs))
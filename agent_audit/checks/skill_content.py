@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import os
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from agent_audit.types import Skill
+from agent_audit.utils.profiling import count_read, count_stat
+
+if TYPE_CHECKING:
+    from agent_audit.core.cache import ContentCache
+    from agent_audit.utils.vfs import VirtualPath
+
+# Bump when rules change so cached analyses of unchanged skills are recomputed.
+ANALYZER_VERSION = 1
+
+SCANNED_SUFFIXES = {
+    ".md",
+    ".txt",
+    ".sh",
+    ".bash",
+    ".zsh",
+    ".py",
+    ".js",
+    ".mjs",
+    ".cjs",
+    ".ts",
+    ".ps1",
+    ".rb",
+}
+SKIPPED_DIRS = {".git", "node_modules", "__pycache__", ".venv", "venv"}
+MAX_FILES = 256
+MAX_FILE_BYTES = 512 * 1024
+MAX_FINDINGS = 50
+
+# (category, severity, pattern); compiled on first use by _compiled_rules().
+_RULES: tuple[tuple[str, str, str], ...] = (
+    ("dangerous_command", "high", r"\brm\s+-(?:[a-zA-Z]*r[a-zA-Z]*f|[a-zA-Z]*f[a-zA-Z]*r)\b"),
+    ("dangerous_command", "high", r"\bsudo\s"),
+    ("dangerous_command", "high", r"\bchmod\s+(?:-R\s+)?[0-7]?777\b"),
+    ("dangerous_command", "high", r"\b(?:curl|wget)\b[^\n|]*\|\s*(?:sudo\s+)?(?:ba|z)?sh\b"),
+    ("dangerous_command", "high", r"\bbase64\s+(?:-d|--decode)\b[^\n]*\|\s*(?:ba|z)?sh\b"),
+    ("dangerous_command", "high", r"\b(?:mkfs(?:\.\w+)?|dd\s+if=)"),
+    ("dangerous_command", "high", r"\bos\.system\(|\bshell\s*=\s*True\b|\bchild_process\b"),
+    ("network_fetch", "medium", r"\b(?:curl|wget)\s"),
+    ("network_fetch", "medium", r"\b(?:requests|httpx)\.(?:get|post|put|patch|delete|request)\("),
+    ("network_fetch", "medium", r"\burllib\.request\b|\burlopen\("),
+    ("network_fetch", "medium", r"\bfetch\(\s*['\"`]https?://"),
+    ("network_fetch", "medium", r"\b(?:nc|ncat|netcat)\s+-"),
+    (
+        "secret_access",
+        "high",
+        r"~/\.ssh\b|\.ssh/id_|\.aws/credentials|\.netrc\b|\.gnupg\b|/etc/shadow",
+    ),
+    ("secret_access", "high", r"(?<![\w.])\.env\b"),
+    (
+        "secret_access",
+        "high",
+        r"(?:os\.environ|os\.getenv|process\.env|\$\{?)[\[\(.'\"]*[A-Z0-9_]*"
+        r"(?:API_KEY|SECRET|TOKEN|PASSWORD)",
+    ),
+    ("secret_access", "high", r"security\s+find-(?:generic|internet)-password"),
+)
+
+
+@lru_cache(maxsize=1)
+def _compiled_rules() -> list[tuple[str, str, re.Pattern[str]]]:
+    return [(category, severity, re.compile(pattern)) for category, severity, pattern in _RULES]
+
+
+@dataclass(slots=True, frozen=True)
+class ContentFinding:
+    severity: str
+    category: str
+    file: str
+    line: int
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "severity": self.severity,
+            "category": self.category,
+            "file": self.file,
+            "line": self.line,
+        }
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> ContentFinding:
+        return cls(
+            severity=str(payload["severity"]),
+            category=str(payload["category"]),
+            file=str(payload["file"]),
+            line=int(payload["line"]),
+        )
+
+
+def _manifest_dir(skill: Skill, root: Path | VirtualPath) -> Path | VirtualPath:
+    if not skill.source:
+        return root
+    if not isinstance(root, Path):
+        manifest = root.fs.path_from_str(skill.source)
+        return manifest.parent if manifest is not None else root
+    return Path(skill.source).parent
+
+
+def _contained(candidate: Path | VirtualPath, bases: list[Path | VirtualPath]) -> bool:
+    """Whether `candidate`, with symlinks and `..` resolved, lies under one of `bases`."""
+    if not isinstance(candidate, Path):
+        inside = candidate.resolve().member_path
+        return any(
+            not isinstance(base, Path) and inside.is_relative_to(base.resolve().member_path)
+            for base in bases
+        )
+    try:
+        resolved = candidate.resolve()
+    except (OSError, RuntimeError):
+        return False
+    return any(
+        isinstance(base, Path) and resolved.is_relative_to(base.resolve()) for base in bases
+    )
+
+
+def locate_skill_dir(skill: Skill, root: Path | VirtualPath) -> Path | VirtualPath | None:
+    """Explicit manifest path first, then `skills/<name>` next to the manifest or the root.
+
+    Candidates must stay inside the agent root or the manifest's directory, so a manifest cannot
+    point the scanner (or a daemon serving it) at arbitrary host directories.
+    """
+    manifest_dir = _manifest_dir(skill, root)
+    candidates: list[Path | VirtualPath] = []
+    if skill.path:
+        if not isinstance(root, Path):
+            # Absolute paths inside an archive are relative to the image root.
+            candidates.append(manifest_dir / skill.path)
+        else:
+            explicit = Path(skill.path).expanduser()
+            candidates.append(explicit if explicit.is_absolute() else manifest_dir / explicit)
+    if skill.name and skill.name not in {".", ".."} and "/" not in skill.name:
+        candidates.append(manifest_dir / "skills" / skill.name)
+        candidates.append(root / "skills" / skill.name)
+    bases = [root, manifest_dir]
+    for candidate in candidates:
+        count_stat()
+        if candidate.is_dir() and _contained(candidate, bases):
+            return candidate
+    return None
+
+
+def _skill_files(directory: Path | VirtualPath) -> list[tuple[str, bytes]]:
+    files: list[tuple[str, bytes]] = []
+    walk = os.walk(directory) if isinstance(directory, Path) else directory.walk()
+    for current, dirnames, filenames in walk:
+        # Each entry listed counts as stat'ed, so the size check below is not counted again.
+        count_stat(len(dirnames) + len(filenames))
+        dirnames[:] = sorted(name for name in dirnames if name not in SKIPPED_DIRS)
+        for filename in sorted(filenames):
+            path = (Path(current) if isinstance(current, str) else current) / filename
+            if path.suffix.lower() not in SCANNED_SUFFIXES:
+                continue
+            try:
+                if path.stat().st_size > MAX_FILE_BYTES:
+                    continue
+                data = path.read_bytes()
+            except OSError:
+                continue
+            count_read(len(data))
+            files.append((path.relative_to(directory).as_posix(), data))
+            if len(files) >= MAX_FILES:
+                return files
+    return files
+
+
+def content_digest(files: list[tuple[str, bytes]]) -> str:
+    import hashlib  # only skills with a directory are hashed; kept off the scan startup path
+
+    digest = hashlib.sha256(f"agent-audit-skill-v{ANALYZER_VERSION}".encode())
+    for name, data in files:
+        digest.update(name.encode("utf-8"))
+        digest.update(len(data).to_bytes(8, "little"))
+        digest.update(data)
+    return digest.hexdigest()
+
+
+def analyze_files(files: list[tuple[str, bytes]]) -> list[ContentFinding]:
+    rules = _compiled_rules()
+    findings: list[ContentFinding] = []
+    for name, data in files:
+        text = data.decode("utf-8", errors="replace")
+        for number, line in enumerate(text.splitlines(), start=1):
+            matched: set[str] = set()
+            for category, severity, pattern in rules:
+                if category in matched or not pattern.search(line):
+                    continue
+                matched.add(category)
+                findings.append(
+                    ContentFinding(severity=severity, category=category, file=name, line=number)
+                )
+                if len(findings) >= MAX_FINDINGS:
+                    return findings
+    return findings
+
+
+def analyze_skill_dir(
+    directory: Path | VirtualPath, cache: ContentCache | None = None
+) -> list[ContentFinding]:
+    files = _skill_files(directory)
+    if not files:
+        return []
+    digest = content_digest(files)
+    if cache is not None:
+        cached = cache.get(digest)
+        if cached is not None:
+            return [ContentFinding.from_dict(item) for item in cached]
+    findings = analyze_files(files)
+    if cache is not None:
+        cache.put(digest, [finding.to_dict() for finding in findings])
+    return findings
+
+
+def analyze_skills(
+    skills: list[Skill], root: Path | VirtualPath, cache: ContentCache | None = None
+) -> list[list[ContentFinding]]:
+    """Content findings per skill, aligned with `skills`; skills without a directory get []."""
+    results: list[list[ContentFinding]] = []
+    for skill in skills:
+        directory = locate_skill_dir(skill, root)
+        results.append(analyze_skill_dir(directory, cache) if directory is not None else [])
+    return results
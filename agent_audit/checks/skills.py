@@ -1,6 +1,13 @@
 from __future__ import annotations
 
+from collections import Counter
+from typing import TYPE_CHECKING
+
 from agent_audit.types import CheckResult, Skill
+from agent_audit.utils.permissions import PermissionVocabulary, default_vocabulary
+
+if TYPE_CHECKING:
+    from agent_audit.checks.skill_content import ContentFinding
 
 
 HIGH_RISK_PERMISSIONS = {
@@ -18,7 +25,14 @@ MEDIUM_RISK_PERMISSIONS = {
 }
 
 
-def evaluate_skills(skills: list[Skill]) -> CheckResult:
+CONTENT_DETAIL_LIMIT = 5
+
+
+def evaluate_skills(
+    skills: list[Skill],
+    vocabulary: PermissionVocabulary | None = None,
+    content: list[list[ContentFinding]] | None = None,
+) -> CheckResult:
     key = "skills"
     title = "Skills / Plugins"
 
@@ -32,18 +46,32 @@ def evaluate_skills(skills: list[Skill]) -> CheckResult:
             details=[],
         )
 
+    vocabulary = vocabulary or default_vocabulary()
+    high_mask = vocabulary.covering(HIGH_RISK_PERMISSIONS)
+    medium_mask = vocabulary.covering(MEDIUM_RISK_PERMISSIONS)
+
     high_count = 0
     medium_count = 0
     details: list[str] = []
+    declared_counts: Counter[int] = Counter()
+    unknown_counts: Counter[str] = Counter()
 
-    for skill in skills:
-        perms = {perm.lower() for perm in skill.permissions}
-        if perms & HIGH_RISK_PERMISSIONS:
+    for index, skill in enumerate(skills):
+        declared, unknown = vocabulary.declared(skill.permissions)
+        declared_counts[declared] += 1
+        unknown_counts.update(set(unknown))
+        implied = vocabulary.implied(declared)
+        findings = content[index] if content else []
+        content_severities = {finding.severity for finding in findings}
+        if implied & high_mask or "high" in content_severities:
             high_count += 1
-            details.append(f"High-risk skill: {skill.name} ({', '.join(sorted(perms))})")
-        elif perms & MEDIUM_RISK_PERMISSIONS:
+            description = _describe(vocabulary, declared, unknown, findings)
+            details.append(f"High-risk skill: {skill.name} ({description})")
+        elif implied & medium_mask or "medium" in content_severities:
             medium_count += 1
-            details.append(f"Medium-risk skill: {skill.name} ({', '.join(sorted(perms))})")
+            description = _describe(vocabulary, declared, unknown, findings)
+            details.append(f"Medium-risk skill: {skill.name} ({description})")
+        details.extend(_content_details(skill, findings))
 
     if high_count:
         score = 9.0
@@ -56,8 +84,13 @@ def evaluate_skills(skills: list[Skill]) -> CheckResult:
     else:
         score = 2.0
         severity = "low"
-        summary = "Installed skills appear low risk from declared permissions."
+        summary = "Installed skills appear low risk from declared permissions and content."
 
+    counts = permission_counts(vocabulary, declared_counts, unknown_counts)
+    if counts:
+        details.append(
+            "Permission counts: " + ", ".join(f"{name}={count}" for name, count in counts.items())
+        )
     details.append(f"Total installed skills: {len(skills)}")
     return CheckResult(
         key=key,
@@ -67,3 +100,46 @@ def evaluate_skills(skills: list[Skill]) -> CheckResult:
         summary=summary,
         details=details,
     )
+
+
+def _describe(
+    vocabulary: PermissionVocabulary,
+    declared: int,
+    unknown: list[str],
+    findings: list[ContentFinding],
+) -> str:
+    description = ", ".join(sorted({*vocabulary.iter_names(declared), *unknown}))
+    if findings:
+        categories = ", ".join(sorted({finding.category for finding in findings}))
+        description = (
+            f"{description}; content: {categories}" if description else f"content: {categories}"
+        )
+    return description
+
+
+def _content_details(skill: Skill, findings: list[ContentFinding]) -> list[str]:
+    lines = [
+        f"Skill content: {skill.name} {finding.file}:{finding.line} "
+        f"{finding.category} ({finding.severity})"
+        for finding in findings[:CONTENT_DETAIL_LIMIT]
+    ]
+    if len(findings) > CONTENT_DETAIL_LIMIT:
+        lines.append(
+            f"Skill content: {skill.name} +{len(findings) - CONTENT_DETAIL_LIMIT} more finding(s)"
+        )
+    return lines
+
+
+def permission_counts(
+    vocabulary: PermissionVocabulary,
+    declared_counts: Counter[int],
+    unknown_counts: Counter[str],
+) -> dict[str, int]:
+    """Number of skills declaring each canonical permission, most common first."""
+    totals: Counter[str] = Counter(unknown_counts)
+    # Skills sharing a declared mask are counted together, so marketplaces with thousands
+    # of similar skills only decode each distinct mask once.
+    for mask, count in declared_counts.items():
+        for name in vocabulary.iter_names(mask):
+            totals[name] += count
+    return dict(sorted(totals.items(), key=lambda item: (-item[1], item[0])))
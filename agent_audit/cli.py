@@ -1,16 +1,20 @@
 from __future__ import annotations
 
-import json
-import subprocess
+import sys
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Literal
+from typing import TYPE_CHECKING, Any, Literal
 
 import typer
 
 from agent_audit import __version__
-from agent_audit.core.monitor import ProcessMonitor
-from agent_audit.core.reporter import render
-from agent_audit.core.scanner import Scanner
+
+if TYPE_CHECKING:
+    from agent_audit.utils.profiling import ScanProfile
+
+# Command bodies import their dependencies lazily so that `version` and
+# machine-readable output formats stay cheap to start; see benchmarks/startup.py.
 
 app = typer.Typer(add_completion=False, no_args_is_help=True)
 
@@ -20,6 +24,39 @@ def _fail(message: str, code: int = 2) -> None:
     raise typer.Exit(code=code)
 
 
+SOCKET_OPTION = typer.Option(
+    None,
+    "--socket",
+    envvar="AGENT_AUDIT_SOCKET",
+    help="Forward to an `agent-audit serve` daemon listening on this socket, if it exists",
+)
+
+
+def _forward(socket_path: Path | None, payload: dict[str, Any]) -> bool:
+    """Run the request on the daemon when available; False means handle it locally."""
+    if socket_path is None:
+        return False
+    from agent_audit.core.client import try_forward
+
+    response = try_forward(socket_path, payload)
+    if response is None:
+        return False
+    if not response.get("ok"):
+        _fail(
+            str(response.get("error", "daemon request failed")), code=int(response.get("code", 2))
+        )
+    typer.echo(response["output"])
+    return True
+
+
+HISTORY_OPTION = typer.Option(
+    None,
+    "--history",
+    envvar="AGENT_AUDIT_HISTORY",
+    help="Record results in this SQLite history database (see `agent-audit history`)",
+)
+
+
 @app.command()
 def version() -> None:
     """Print version."""
@@ -28,87 +65,319 @@ def version() -> None:
 
 @app.command()
 def scan(
-    path: Path = typer.Argument(Path("."), help="Agent directory to scan"),
-    output_format: Literal["table", "json", "markdown"] = typer.Option(
+    paths: list[Path] | None = typer.Argument(None, help="Agent directories to scan (default: .)"),
+    output_format: Literal["table", "json", "markdown", "ndjson", "sarif"] = typer.Option(
         "table", "--format", help="Output format"
     ),
+    network_rules: Path | None = typer.Option(
+        None,
+        "--network-rules",
+        help="JSON rule file with extra domain/CIDR labels merged over the built-in rules",
+    ),
+    fields: list[str] | None = typer.Option(
+        None,
+        "--fields",
+        help=(
+            "Comma-separated fields for json/ndjson/sarif "
+            "(e.g. 'risk_score,checks.severity' or '-checks.details')"
+        ),
+    ),
+    changed_since: str | None = typer.Option(
+        None,
+        "--changed-since",
+        help="Only scan agent roots whose config or skills files changed since this git revision",
+    ),
+    baseline: Path | None = typer.Option(
+        None,
+        "--baseline",
+        help="Saved results (json, ndjson or archive) to diff against; exits 1 on new risk",
+    ),
+    profile: bool = typer.Option(
+        False,
+        "--profile",
+        help=(
+            "Time each scan stage and count files stat'ed/read "
+            "(added to json output, else stderr)"
+        ),
+    ),
+    profile_out: Path | None = typer.Option(
+        None,
+        "--profile-out",
+        help="Also write cProfile stats to this file for pstats/snakeviz (implies --profile)",
+    ),
+    skill_cache: bool = typer.Option(
+        False,
+        "--skill-cache/--no-skill-cache",
+        help="Cache skill content analyses on disk under $AGENT_AUDIT_CACHE_DIR",
+    ),
+    socket_path: Path | None = SOCKET_OPTION,
+    history: Path | None = HISTORY_OPTION,
 ) -> None:
-    """Statically scan an agent configuration."""
-    scanner = Scanner()
+    """Statically scan one or more agent configurations."""
+    targets = paths or [Path(".")]
+    if fields and output_format in {"table", "markdown"}:
+        raise typer.BadParameter("--fields only applies to json, ndjson and sarif output.")
+    if baseline is not None and (fields or output_format in {"ndjson", "sarif"}):
+        raise typer.BadParameter(
+            "--baseline supports table, json and markdown output without --fields."
+        )
+
+    if changed_since is not None:
+        targets = _changed_targets(targets, changed_since)
+        if not targets:
+            typer.echo(
+                f"No agent configuration changes since {changed_since}; skipping scan.",
+                err=True,
+            )
+            return
+
+    previous = _load_baseline(baseline) if baseline is not None else None
+    profile = profile or profile_out is not None
+
+    forwardable = (
+        network_rules is None
+        and history is None
+        and previous is None
+        and not profile
+        and not skill_cache
+    )
+    if socket_path is not None and forwardable:
+        from agent_audit.core.client import absolute_paths
+
+        request = {
+            "op": "scan",
+            "paths": absolute_paths(targets),
+            "format": output_format,
+            "fields": fields,
+        }
+        if _forward(socket_path, request):
+            return
+
+    from contextlib import ExitStack, nullcontext
+
+    from agent_audit.core.scanner import Scanner
+    from agent_audit.utils.profiling import stage
+
+    with _profiled(profile_out) if profile else nullcontext() as session:
+        try:
+            with ExitStack() as stack:
+                record = _history_recorder(stack, history)
+                cache = None
+                if skill_cache:
+                    from agent_audit.core.cache import ContentCache
+
+                    cache = ContentCache.default("skills")
+                scanner = Scanner(network_rules=network_rules, skill_cache=cache)
+                if output_format in {"ndjson", "sarif"}:
+                    from agent_audit.core.streaming import open_writer
+
+                    with open_writer(output_format, sys.stdout, fields) as writer:
+                        for target in targets:
+                            result = scanner.scan_path(target)
+                            record(result)
+                            with stage("render"):
+                                writer.write(result)
+                    _echo_profile(session, "markdown")
+                    return
+                results = []
+                for target in targets:
+                    results.append(scanner.scan_path(target))
+                    record(results[-1])
+        except ValueError as exc:
+            _fail(str(exc))
+
+        if previous is not None:
+            from agent_audit.core.baseline import diff_results
+            from agent_audit.core.reporter import render_baseline_diff
+
+            diff = diff_results(previous, results)
+            with stage("render"):
+                typer.echo(render_baseline_diff(diff, output_format))
+            _echo_profile(session, output_format)
+            if diff.introduces_risk:
+                raise typer.Exit(code=1)
+            return
+
+        from agent_audit.core.reporter import render_many
+
+        with stage("render"):
+            rendered = render_many(results, output_format=output_format, fields=fields)
+        if session is not None and output_format == "json":
+            import json
+
+            payload = {"results": json.loads(rendered), "profile": session.to_dict()}
+            typer.echo(json.dumps(payload, indent=2))
+            return
+        typer.echo(rendered)
+        _echo_profile(session, output_format)
+
+
+@contextmanager
+def _profiled(pstats_path: Path | None) -> Iterator[ScanProfile]:
+    """Collect stage timings for the block, under cProfile when `pstats_path` is given."""
+    from agent_audit.utils.profiling import ScanProfile, profiling
+
+    with profiling(ScanProfile()) as session:
+        if pstats_path is None:
+            yield session
+            return
+        import cProfile
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield session
+        finally:
+            profiler.disable()
+            try:
+                profiler.dump_stats(str(pstats_path.expanduser()))
+            except OSError as exc:
+                _fail(f"Could not write profile {pstats_path}: {exc}")
+
+
+def _echo_profile(session: ScanProfile | None, output_format: str) -> None:
+    if session is None:
+        return
+    from agent_audit.core.reporter import render_profile
+
+    fmt = output_format if output_format in {"table", "markdown", "json"} else "markdown"
+    typer.echo(render_profile(session, fmt), err=True)  # type: ignore[arg-type]
+
+
+def _load_baseline(path: Path) -> Any:
+    from agent_audit.core.serialize import load_results
+
+    try:
+        return load_results(path.expanduser())
+    except (OSError, ValueError, KeyError) as exc:
+        _fail(f"Could not load baseline {path}: {exc}")
+
+
+def _history_recorder(stack: Any, history: Path | None) -> Any:
+    """`record(result)` writing to the history database in batches, or a no-op."""
+    if history is None:
+        return lambda result: None
+    import sqlite3
+
+    from agent_audit.core.history import HistoryStore
+
+    try:
+        store = stack.enter_context(HistoryStore(history.expanduser()))
+    except sqlite3.Error as exc:
+        raise ValueError(f"Could not open history database {history}: {exc}") from exc
+    return stack.enter_context(store.batch())
+
+
+def _changed_targets(paths: list[Path], rev: str) -> list[Path]:
+    from agent_audit.adapters import detect_adapter
+    from agent_audit.core.changes import affected_roots, changed_files
+
+    targets: dict[Path, None] = {}
     try:
-        result = scanner.scan_path(path)
+        for path in paths:
+            changed = changed_files(path.expanduser().resolve(), rev)
+            targets.update(dict.fromkeys(affected_roots(changed, path.expanduser())))
     except ValueError as exc:
         _fail(str(exc))
-    typer.echo(render(result, output_format=output_format))
+
+    scannable: list[Path] = []
+    for target in targets:
+        try:
+            if target.is_dir():
+                detect_adapter(target)
+                scannable.append(target)
+        except ValueError:
+            # The change removed the agent config; nothing is left to scan at this root.
+            typer.echo(f"No supported agent remains at {target}; skipping.", err=True)
+    return scannable
 
 
 @app.command()
 def compare(
-    path_one: Path = typer.Argument(..., help="First agent path"),
-    path_two: Path = typer.Argument(..., help="Second agent path"),
+    paths: list[Path] = typer.Argument(..., help="Two or more agent paths"),
     output_format: Literal["table", "json", "markdown"] = typer.Option(
         "table", "--format", help="Output format"
     ),
+    workers: int = typer.Option(8, "--workers", min=1, help="Maximum concurrent scans"),
+    socket_path: Path | None = SOCKET_OPTION,
 ) -> None:
-    """Compare two agent scan results."""
-    scanner = Scanner()
+    """Compare scan results of two or more agents side by side."""
+    if len(paths) < 2:
+        raise typer.BadParameter("Provide at least two paths to compare.")
+
+    if socket_path is not None:
+        from agent_audit.core.client import absolute_paths
+
+        request = {"op": "compare", "paths": absolute_paths(paths), "format": output_format}
+        if _forward(socket_path, request):
+            return
+
+    from agent_audit.core.compare import compare_paths
+    from agent_audit.core.reporter import render_comparison
+
     try:
-        first = scanner.scan_path(path_one)
-        second = scanner.scan_path(path_two)
+        comparison = compare_paths(paths, max_workers=workers)
     except ValueError as exc:
         _fail(str(exc))
+    typer.echo(render_comparison(comparison, output_format=output_format))
 
-    payload = {
-        "left": {
-            "path": str(path_one),
-            "name": first.agent_name,
-            "adapter": first.adapter_name,
-            "risk_score": first.risk_score,
-            "risk_tier": first.risk_tier,
-            "checks": {key: check.severity for key, check in first.checks.items()},
-        },
-        "right": {
-            "path": str(path_two),
-            "name": second.agent_name,
-            "adapter": second.adapter_name,
-            "risk_score": second.risk_score,
-            "risk_tier": second.risk_tier,
-            "checks": {key: check.severity for key, check in second.checks.items()},
-        },
-    }
-
-    if output_format == "json":
-        typer.echo(json.dumps(payload, indent=2))
-        return
 
-    lines = [
-        "| Metric | Agent 1 | Agent 2 |",
-        "|---|---:|---:|",
-        f"| Name | {first.agent_name} | {second.agent_name} |",
-        (
-            f"| Risk score | {first.risk_score:.1f} ({first.risk_tier}) | "
-            f"{second.risk_score:.1f} ({second.risk_tier}) |"
-        ),
-        (
-            f"| File system | {first.checks['filesystem'].severity.upper()} | "
-            f"{second.checks['filesystem'].severity.upper()} |"
-        ),
-        (
-            f"| Network | {first.checks['network'].severity.upper()} | "
-            f"{second.checks['network'].severity.upper()} |"
-        ),
-        f"| Shell | {first.checks['shell'].severity.upper()} | {second.checks['shell'].severity.upper()} |",
-        (
-            f"| Secrets | {first.checks['secrets'].severity.upper()} | "
-            f"{second.checks['secrets'].severity.upper()} |"
-        ),
-        f"| Skills | {first.checks['skills'].severity.upper()} | {second.checks['skills'].severity.upper()} |",
-    ]
-    rendered = "\n".join(lines)
-    if output_format == "markdown":
-        typer.echo(rendered)
-        return
-    typer.echo(rendered)
+@app.command()
+def serve(
+    socket_path: Path = typer.Option(..., "--socket", help="Unix socket path to listen on"),
+    network_rules: Path | None = typer.Option(
+        None,
+        "--network-rules",
+        help="JSON rule file with extra domain/CIDR labels merged over the built-in rules",
+    ),
+) -> None:
+    """Run a resident scan daemon with warm caches on a Unix socket."""
+    from agent_audit.core.daemon import serve as serve_daemon
+
+    typer.echo(f"agent-audit daemon listening on {socket_path}", err=True)
+    try:
+        serve_daemon(socket_path, network_rules=network_rules)
+    except (ValueError, OSError) as exc:
+        _fail(str(exc))
+
+
+@app.command("scan-history")
+def scan_history(
+    repo: Path = typer.Argument(Path("."), help="Git repository to walk"),
+    paths: list[str] | None = typer.Option(
+        None, "--paths", help="Agent roots inside the repository (repeatable; default: its root)"
+    ),
+    rev: str = typer.Option("HEAD", "--rev", help="Revision or range whose history is scanned"),
+    max_count: int | None = typer.Option(
+        None, "--max-count", min=1, help="Only the most recent N commits touching agent files"
+    ),
+    output_format: Literal["table", "json", "markdown"] = typer.Option(
+        "table", "--format", help="Output format"
+    ),
+    network_rules: Path | None = typer.Option(
+        None,
+        "--network-rules",
+        help="JSON rule file with extra domain/CIDR labels merged over the built-in rules",
+    ),
+) -> None:
+    """Score agent configs at every commit that changed them, without checking out trees."""
+    from agent_audit.core.githistory import scan_git_history
+    from agent_audit.core.reporter import render_git_history
+    from agent_audit.core.scanner import Scanner
+
+    try:
+        report = scan_git_history(
+            repo, paths or (), Scanner(network_rules=network_rules), rev=rev, max_count=max_count
+        )
+    except ValueError as exc:
+        _fail(str(exc))
+    typer.echo(render_git_history(report, output_format))
+
+
+def _now_iso() -> str:
+    from datetime import datetime, timezone
+
+    return datetime.now(tz=timezone.utc).isoformat(timespec="seconds")
 
 
 def _render_event_line(kind: str, target: str, severity: str, timestamp: str) -> str:
@@ -137,6 +406,30 @@ def monitor(
     ),
     live: bool = typer.Option(False, "--live", help="Stream events as they are collected"),
     output_format: Literal["table", "json"] = typer.Option("table", "--format", help="Output format"),
+    sink: list[str] | None = typer.Option(
+        None,
+        "--sink",
+        help="Also ship events to jsonl:PATH, unix:SOCKET (datagrams) or sqlite:PATH; repeatable",
+    ),
+    history: Path | None = HISTORY_OPTION,
+    maps: bool = typer.Option(
+        True, "--maps/--no-maps", help="Report files mapped into memory (/proc/<pid>/maps)"
+    ),
+    enforce: list[str] | None = typer.Option(
+        None,
+        "--enforce",
+        help="Signal offenders: [KIND/]SEVERITY:stop|kill[:process|tree], e.g. 'critical:kill' or "
+        "'read/high:stop:tree' (tree scope needs --exec); first matching rule wins; repeatable",
+    ),
+    coalesce_window: float | None = typer.Option(
+        None,
+        "--coalesce-window",
+        help="Roll up low/medium file events per directory, kind and process over this many "
+        "seconds; high and critical events are always reported individually",
+    ),
+    coalesce_depth: int = typer.Option(
+        4, "--coalesce-depth", min=1, help="Directory levels kept in a rollup target"
+    ),
 ) -> None:
     """Monitor a running agent process by PID."""
     if pid is None and command is None:
@@ -144,6 +437,27 @@ def monitor(
     if pid is not None and command is not None:
         raise typer.BadParameter("Use only one of --pid or --exec.")
 
+    import json
+    import subprocess
+
+    from agent_audit.core.enforce import parse_rule
+    from agent_audit.core.monitor import ProcessMonitor
+    from agent_audit.core.procfs import RealProcFS
+    from agent_audit.core.sinks import parse_sink
+
+    try:
+        rules = [parse_rule(spec) for spec in enforce or []]
+        if command is None and any(rule.scope == "tree" for rule in rules):
+            raise ValueError("Tree-scoped enforce rules require a session started with --exec.")
+        coalescer = None
+        if coalesce_window is not None:
+            from agent_audit.core.coalesce import EventCoalescer
+
+            coalescer = EventCoalescer(window_seconds=coalesce_window, depth=coalesce_depth)
+        sinks = [parse_sink(spec) for spec in sink or []]
+    except (OSError, ValueError) as exc:
+        _fail(str(exc))
+
     proc: subprocess.Popen[bytes] | None = None
     target_pid = pid
     if command is not None:
@@ -158,47 +472,158 @@ def monitor(
 
     if target_pid is None:
         raise typer.BadParameter("Could not determine process PID for monitoring.")
-    if not Path(f"/proc/{target_pid}").exists():
+    backend = RealProcFS()
+    if not backend.exists(target_pid):
         _fail(f"PID {target_pid} is not running or not visible from this namespace.")
 
+    monitor: ProcessMonitor | None = None
     try:
-        monitor = ProcessMonitor(pid=target_pid, project_root=path)
-        events = monitor.run(duration_seconds=duration, interval_seconds=interval)
+        monitor = ProcessMonitor(
+            pid=target_pid,
+            project_root=path,
+            backend=backend,
+            sinks=sinks,
+            maps=maps,
+            enforce=rules,
+            enforce_tree=command is not None,
+            coalescer=coalescer,
+        )
+        started_at = _now_iso()
+        try:
+            events = monitor.run(duration_seconds=duration, interval_seconds=interval)
+        finally:
+            monitor.session.close()
         summary = monitor.session.summarize()
+        if history is not None:
+            from agent_audit.core.history import HistoryStore
+
+            with HistoryStore(history.expanduser()) as store:
+                store.record_session(target_pid, command, started_at, _now_iso(), events, summary)
+        sink_stats = {name: stats.to_dict() for name, stats in monitor.session.sink_stats().items()}
 
         if live:
             for event in events:
-                typer.echo(_render_event_line(event.kind, event.target, event.severity, event.timestamp))
+                target = (
+                    event.target if event.count == 1 else f"{event.target}/ ({event.count} events)"
+                )
+                typer.echo(_render_event_line(event.kind, target, event.severity, event.timestamp))
 
         if output_format == "json":
             payload = {
                 "pid": target_pid,
                 "command": command,
                 "duration_seconds": duration,
-                "events": [
-                    {
-                        "timestamp": event.timestamp,
-                        "kind": event.kind,
-                        "target": event.target,
-                        "severity": event.severity,
-                    }
-                    for event in events
-                ],
+                "events": [event.to_dict() for event in events],
                 "summary": {
                     "events": summary.events,
                     "alerts_high": summary.alerts_high,
                     "alerts_medium": summary.alerts_medium,
                 },
             }
+            if rules:
+                payload["summary"]["enforced"] = summary.enforced
+                payload["summary"]["max_enforcement_latency_ms"] = (
+                    summary.max_enforcement_latency_ms
+                )
+                payload["enforcement"] = [
+                    action.to_dict() for action in monitor.session.enforcement
+                ]
+            if sink_stats:
+                payload["sinks"] = sink_stats
             typer.echo(json.dumps(payload, indent=2))
             return
 
         typer.echo(
             f"Session summary: events={summary.events} high={summary.alerts_high} medium={summary.alerts_medium}"
         )
+        for name, stats in sink_stats.items():
+            typer.echo(
+                f"Sink {name}: written={stats['written']} dropped={stats['dropped']} "
+                f"errors={stats['errors']}"
+            )
+        for action in monitor.session.enforcement:
+            typer.echo(
+                f"Enforced {action.rule}: {action.action} {action.signalled} "
+                f"after {action.event_kind} {action.event_target} ({action.latency_ms:.1f} ms)"
+            )
     finally:
-        if proc is not None and proc.poll() is None:
-            proc.terminate()
+        if proc is not None:
+            # This session owns the tree: stopped processes would otherwise linger.
+            if monitor is not None and monitor.enforcer is not None:
+                monitor.enforcer.release()
+            if proc.poll() is None:
+                proc.terminate()
+
+
+history_app = typer.Typer(
+    add_completion=False,
+    no_args_is_help=True,
+    help="Query the scan history recorded with `scan --history`.",
+)
+app.add_typer(history_app, name="history")
+
+HISTORY_DB_OPTION = typer.Option(
+    ..., "--db", envvar="AGENT_AUDIT_HISTORY", help="SQLite history database"
+)
+
+
+def _open_history(db: Path) -> Any:
+    from agent_audit.core.history import HistoryStore
+
+    if not db.expanduser().exists():
+        _fail(f"History database {db} does not exist; record scans with `scan --history {db}`.")
+    try:
+        return HistoryStore(db.expanduser())
+    except ValueError as exc:
+        _fail(str(exc))
+
+
+def _agent_root(root: Path | None) -> str | None:
+    return str(root.expanduser().resolve()) if root is not None else None
+
+
+@history_app.command("trend")
+def history_trend(
+    db: Path = HISTORY_DB_OPTION,
+    root: Path | None = typer.Option(None, "--root", help="Only this agent root"),
+    adapter: str | None = typer.Option(None, "--adapter", help="Only this adapter"),
+    since: str | None = typer.Option(None, "--since", help="ISO date/time lower bound (inclusive)"),
+    until: str | None = typer.Option(None, "--until", help="ISO date/time upper bound (exclusive)"),
+    bucket: Literal["scan", "day", "week", "month"] = typer.Option(
+        "day", "--bucket", help="Aggregate scores per period"
+    ),
+    limit: int = typer.Option(1000, "--limit", min=1, help="Most recent periods to show"),
+    output_format: Literal["table", "json", "markdown"] = typer.Option(
+        "table", "--format", help="Output format"
+    ),
+) -> None:
+    """Risk score over time per agent root."""
+    from agent_audit.core.reporter import render_trend
+
+    with _open_history(db) as store:
+        points = store.trend(_agent_root(root), adapter, since, until, bucket, limit)
+    typer.echo(render_trend(points, output_format))
+
+
+@history_app.command("changes")
+def history_changes(
+    db: Path = HISTORY_DB_OPTION,
+    root: Path | None = typer.Option(None, "--root", help="Only this agent root"),
+    adapter: str | None = typer.Option(None, "--adapter", help="Only this adapter"),
+    check: str | None = typer.Option(None, "--check", help="Only this check key (e.g. shell)"),
+    since: str | None = typer.Option(None, "--since", help="ISO date/time lower bound (inclusive)"),
+    until: str | None = typer.Option(None, "--until", help="ISO date/time upper bound (exclusive)"),
+    limit: int = typer.Option(1000, "--limit", min=1, help="Most recent changes to show"),
+    output_format: Literal["table", "json", "markdown"] = typer.Option(
+        "table", "--format", help="Output format"
+    ),
+) -> None:
+    """Scans where a check's severity or summary changed from the previous scan."""
+    from agent_audit.core.reporter import render_changes
+
+    with _open_history(db) as store:
+        changes = store.changes(_agent_root(root), adapter, check, since, until, limit)
+    typer.echo(render_changes(changes, output_format))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Sequence
+from concurrent.futures import Executor, ThreadPoolExecutor
+from pathlib import Path
+
+from agent_audit.core.scanner import Scanner
+from agent_audit.types import ScanResult
+
+DEFAULT_CONCURRENCY = 8
+
+
+async def scan_path_async(
+    path: str | Path,
+    scanner: Scanner | None = None,
+    timeout: float | None = None,
+    executor: Executor | None = None,
+) -> ScanResult:
+    """Run `Scanner.scan_path` off the event loop and await its result.
+
+    File reads and parsing happen on `executor` (the loop's default executor when omitted).
+    On timeout or cancellation the awaiting task stops waiting immediately; a scan already
+    running in a worker thread finishes in the background and its result is discarded.
+    """
+    scanner = scanner or Scanner()
+    loop = asyncio.get_running_loop()
+    future = loop.run_in_executor(executor, scanner.scan_path, path)
+    if timeout is None:
+        return await future
+    try:
+        async with asyncio.timeout(timeout):
+            return await future
+    except TimeoutError:
+        raise TimeoutError(f"Scan of {path} timed out after {timeout:g}s") from None
+
+
+async def scan_many_async(
+    paths: Sequence[str | Path],
+    scanner: Scanner | None = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    timeout: float | None = None,
+    return_exceptions: bool = False,
+) -> list[ScanResult | BaseException]:
+    """Scan every distinct path once with at most `concurrency` scans in flight.
+
+    Results line up with `paths`. `timeout` applies to each scan separately. With
+    `return_exceptions` a failed or timed-out scan yields its exception in place of a result;
+    otherwise the first failure cancels the remaining scans and is raised. Scans run on a
+    private pool of `concurrency` threads, so an abandoned scan keeps its worker busy until it
+    returns and never lets more than `concurrency` scans run at once.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    scanner = scanner or Scanner()
+    targets = [Path(path).expanduser().resolve() for path in paths]
+    unique = list(dict.fromkeys(targets))
+    if not unique:
+        return []
+
+    limit = asyncio.Semaphore(concurrency)
+    pool = ThreadPoolExecutor(
+        max_workers=min(concurrency, len(unique)), thread_name_prefix="agent-audit-scan"
+    )
+
+    async def scan_one(target: Path) -> ScanResult:
+        async with limit:
+            return await scan_path_async(target, scanner, timeout, pool)
+
+    try:
+        tasks = [asyncio.ensure_future(scan_one(target)) for target in unique]
+        try:
+            outcomes = await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    scanned = dict(zip(unique, outcomes, strict=True))
+    return [scanned[target] for target in targets]
@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+from agent_audit.types import ScanResult, is_summary_detail
+
+# Diffs scan results against a saved baseline by finding fingerprint, so CI only reports what a
+# change introduced. Findings are indexed in dicts keyed by (agent, fingerprint); the diff is
+# set arithmetic over those keys and stays linear in the number of findings.
+
+SEVERITY_RANK = {"low": 0, "medium": 1, "high": 2, "critical": 3}
+
+
+@dataclass(slots=True)
+class FindingChange:
+    status: str  # "added", "removed" or "changed"
+    agent: str
+    adapter: str
+    check_key: str
+    # Empty for a check whose severity changed without any finding of its own changing.
+    fingerprint: str
+    detail: str
+    severity: str
+    previous_severity: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        payload = {
+            "status": self.status,
+            "agent": self.agent,
+            "adapter": self.adapter,
+            "check": self.check_key,
+            "fingerprint": self.fingerprint,
+            "detail": self.detail,
+            "severity": self.severity,
+        }
+        if self.status == "changed":
+            payload["previous_severity"] = self.previous_severity
+        return payload
+
+
+@dataclass(slots=True)
+class AgentDelta:
+    agent: str
+    adapter: str
+    risk_score: float | None
+    previous_risk_score: float | None
+    risk_tier: str | None
+    previous_risk_tier: str | None
+
+    @property
+    def score_delta(self) -> float:
+        return round((self.risk_score or 0.0) - (self.previous_risk_score or 0.0), 2)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "agent": self.agent,
+            "adapter": self.adapter,
+            "risk_score": self.risk_score,
+            "previous_risk_score": self.previous_risk_score,
+            "risk_tier": self.risk_tier,
+            "previous_risk_tier": self.previous_risk_tier,
+            "score_delta": self.score_delta,
+        }
+
+
+@dataclass(slots=True)
+class BaselineDiff:
+    findings: list[FindingChange] = field(default_factory=list)
+    agents: list[AgentDelta] = field(default_factory=list)
+
+    def _with_status(self, status: str) -> list[FindingChange]:
+        return [finding for finding in self.findings if finding.status == status]
+
+    @property
+    def added(self) -> list[FindingChange]:
+        return self._with_status("added")
+
+    @property
+    def removed(self) -> list[FindingChange]:
+        return self._with_status("removed")
+
+    @property
+    def changed(self) -> list[FindingChange]:
+        return self._with_status("changed")
+
+    @property
+    def score_delta(self) -> float:
+        return round(sum(agent.score_delta for agent in self.agents), 2)
+
+    @property
+    def introduces_risk(self) -> bool:
+        """New findings, or existing findings whose check got more severe."""
+        return any(
+            finding.status == "added"
+            or (
+                finding.status == "changed"
+                and SEVERITY_RANK.get(finding.severity, 0)
+                > SEVERITY_RANK.get(finding.previous_severity or "low", 0)
+            )
+            for finding in self.findings
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "score_delta": self.score_delta,
+            "introduces_risk": self.introduces_risk,
+            "counts": {
+                "added": len(self.added),
+                "removed": len(self.removed),
+                "changed": len(self.changed),
+            },
+            "agents": [agent.to_dict() for agent in self.agents],
+            "findings": [finding.to_dict() for finding in self.findings],
+        }
+
+
+_Finding = tuple[str, str, str, str]  # (adapter, check key, detail, check severity)
+
+
+def _index(results: list[ScanResult], single: bool) -> dict[tuple[str, str], _Finding]:
+    index: dict[tuple[str, str], _Finding] = {}
+    for result in results:
+        agent = "" if single else result.scanned_path
+        for check in result.checks.values():
+            fingerprints = result.fingerprints_for(check)
+            for detail, fingerprint in zip(check.details, fingerprints, strict=True):
+                # Baselines saved before summary lines lost their fingerprints still carry them.
+                if fingerprint and not is_summary_detail(detail):
+                    index[(agent, fingerprint)] = (
+                        result.adapter_name,
+                        check.key,
+                        detail,
+                        check.severity,
+                    )
+    return index
+
+
+def diff_results(baseline: Iterable[ScanResult], current: Iterable[ScanResult]) -> BaselineDiff:
+    """Added, removed and changed findings of `current` relative to `baseline`.
+
+    Results are paired by scanned path; when each side holds a single result they are paired
+    regardless, so a baseline saved from another checkout location still lines up.
+    """
+    before = list(baseline)
+    after = list(current)
+    single = len(before) == 1 and len(after) == 1
+    old = _index(before, single)
+    new = _index(after, single)
+
+    diff = BaselineDiff()
+    for key, (adapter, check_key, detail, severity) in new.items():
+        agent = after[0].scanned_path if single else key[0]
+        previous = old.get(key)
+        if previous is None:
+            diff.findings.append(
+                FindingChange("added", agent, adapter, check_key, key[1], detail, severity)
+            )
+        elif previous[3] != severity:
+            # Same finding (equal fingerprints imply equal normalized text), different check
+            # severity.
+            diff.findings.append(
+                FindingChange(
+                    "changed", agent, adapter, check_key, key[1], detail, severity, previous[3]
+                )
+            )
+    for key, (adapter, check_key, detail, severity) in old.items():
+        if key not in new:
+            agent = before[0].scanned_path if single else key[0]
+            diff.findings.append(
+                FindingChange("removed", agent, adapter, check_key, key[1], detail, severity)
+            )
+
+    previous_results = {"" if single else result.scanned_path: result for result in before}
+    current_results = {"" if single else result.scanned_path: result for result in after}
+    # A check can get more severe through findings that have no detail line of their own (an
+    # extra unknown domain); report it at check level unless a finding already carries it.
+    reported = {
+        (finding.agent, finding.check_key)
+        for finding in diff.findings
+        if finding.status != "removed"
+    }
+    for agent, now in current_results.items():
+        then = previous_results.get(agent)
+        if then is None:
+            continue
+        for key, check in now.checks.items():
+            previous = then.checks.get(key)
+            if (
+                previous is not None
+                and previous.severity != check.severity
+                and (now.scanned_path, key) not in reported
+            ):
+                diff.findings.append(
+                    FindingChange(
+                        "changed",
+                        now.scanned_path,
+                        now.adapter_name,
+                        key,
+                        "",
+                        check.summary,
+                        check.severity,
+                        previous.severity,
+                    )
+                )
+    for agent, reference in {**previous_results, **current_results}.items():
+        now = current_results.get(agent)
+        then = previous_results.get(agent)
+        diff.agents.append(
+            AgentDelta(
+                agent=reference.scanned_path,
+                adapter=reference.adapter_name,
+                risk_score=now.risk_score if now else None,
+                previous_risk_score=then.risk_score if then else None,
+                risk_tier=now.risk_tier if now else None,
+                previous_risk_tier=then.risk_tier if then else None,
+            )
+        )
+    return diff
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+CACHE_DIR_ENV = "AGENT_AUDIT_CACHE_DIR"
+
+
+def default_cache_dir() -> Path:
+    configured = os.environ.get(CACHE_DIR_ENV)
+    if configured:
+        return Path(configured).expanduser()
+    xdg = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg).expanduser() if xdg else Path.home() / ".cache"
+    return base / "agent-audit"
+
+
+class ContentCache:
+    """Persistent JSON store keyed by content digest, fronted by an in-memory LRU.
+
+    Entries live at `<directory>/<namespace>/<digest[:2]>/<digest>.json` and are written
+    atomically, so concurrent scanners sharing a cache directory never read partial files.
+    With `directory=None`, or once the directory turns out to be unwritable, only the
+    in-memory layer is used.
+    """
+
+    def __init__(self, directory: Path | None, namespace: str, max_entries: int = 4096) -> None:
+        self.root = directory / namespace if directory is not None else None
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._memory: OrderedDict[str, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def default(cls, namespace: str) -> ContentCache:
+        return cls(default_cache_dir(), namespace)
+
+    def _path(self, digest: str) -> Path | None:
+        if self.root is None:
+            return None
+        return self.root / digest[:2] / f"{digest}.json"
+
+    def get(self, digest: str) -> Any | None:
+        with self._lock:
+            if digest in self._memory:
+                self._memory.move_to_end(digest)
+                self.hits += 1
+                return self._memory[digest]
+        path = self._path(digest)
+        value = None
+        if path is not None:
+            try:
+                value = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                value = None
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._remember(digest, value)
+        return value
+
+    def put(self, digest: str, value: Any) -> None:
+        with self._lock:
+            self._remember(digest, value)
+        path = self._path(digest)
+        if path is None:
+            return
+        import tempfile  # only the on-disk layer needs it; kept off the scan startup path
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                    json.dump(value, handle, separators=(",", ":"))
+                os.replace(tmp_name, path)
+            except BaseException:
+                with contextlib.suppress(OSError):
+                    os.unlink(tmp_name)
+                raise
+        except OSError:
+            self.root = None
+
+    def _remember(self, digest: str, value: Any) -> None:
+        self._memory[digest] = value
+        self._memory.move_to_end(digest)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import subprocess
+from collections.abc import Iterable
+from fnmatch import fnmatch
+from pathlib import Path, PurePosixPath
+
+from agent_audit.adapters import AgentAdapter, all_adapters
+from agent_audit.checks.skill_content import locate_skill_dir
+
+# Maps git changes onto agent roots so hooks and CI only re-scan what a change touched.
+
+
+def _git(repo: Path, *args: str) -> str:
+    try:
+        completed = subprocess.run(
+            ["git", "-C", str(repo), *args],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+    except OSError as exc:
+        raise ValueError(f"Could not run git: {exc}") from exc
+    if completed.returncode != 0:
+        raise ValueError(f"git {' '.join(args)} failed: {completed.stderr.strip()}")
+    return completed.stdout
+
+
+def changed_files(path: Path, rev: str) -> list[Path]:
+    """Files changed between `rev` and the working tree (staged, unstaged and untracked)."""
+    start = path if path.is_dir() else path.parent
+    top = Path(_git(start, "rev-parse", "--show-toplevel").strip())
+    names = _git(top, "diff", "--name-only", "-z", rev, "--").split("\0")
+    names += _git(top, "ls-files", "--others", "--exclude-standard", "-z").split("\0")
+    return [top / name for name in dict.fromkeys(names) if name]
+
+
+def _exact_candidates() -> list[str]:
+    candidates: list[str] = []
+    for adapter in all_adapters():
+        candidates.extend(adapter._config_candidates)
+        candidates.extend(adapter._skills_candidates)
+    # Longest first so ".codex/skills.json" wins over "skills.json".
+    return sorted(set(candidates), key=len, reverse=True)
+
+
+def affected_roots(changed: Iterable[Path], scan_root: Path) -> list[Path]:
+    """Agent roots under `scan_root` whose known config, skills or skill body files changed."""
+    scan_root = scan_root.resolve()
+    candidates = _exact_candidates()
+    adapters = all_adapters()
+    skill_dirs: dict[Path, list[Path]] = {}
+    roots: dict[Path, None] = {}
+    for changed_path in changed:
+        resolved = changed_path.resolve()
+        try:
+            relative = PurePosixPath(resolved.relative_to(scan_root).as_posix())
+        except ValueError:
+            continue
+        text = str(relative)
+        root = None
+        for candidate in candidates:
+            if text == candidate:
+                root = scan_root
+            elif text.endswith(f"/{candidate}"):
+                root = scan_root / text[: -len(candidate) - 1]
+            if root is not None:
+                break
+        if root is None and _matches_detect_glob(adapters, relative.name, changed_path):
+            # Fuzzy detection globs recursively from the scanned root.
+            root = scan_root
+        if root is None:
+            root = _skill_root(resolved, scan_root, adapters, skill_dirs)
+        if root is not None:
+            roots[root] = None
+    return list(roots)
+
+
+def _skill_root(
+    changed_path: Path,
+    scan_root: Path,
+    adapters: list[AgentAdapter],
+    skill_dirs: dict[Path, list[Path]],
+) -> Path | None:
+    """The nearest enclosing agent root with a skill directory containing `changed_path`.
+
+    Skill bodies (SKILL.md, bundled scripts) are scanned for dangerous content, so editing one
+    affects its agent even though no config or manifest changed.
+    """
+    for directory in changed_path.parents:
+        if not directory.is_relative_to(scan_root):
+            break
+        if directory not in skill_dirs:
+            skill_dirs[directory] = _skill_dirs(directory, adapters)
+        if any(changed_path.is_relative_to(skill_dir) for skill_dir in skill_dirs[directory]):
+            return directory
+    return None
+
+
+def _skill_dirs(root: Path, adapters: list[AgentAdapter]) -> list[Path]:
+    """Skill directories of the agents whose skills manifests live under `root`."""
+    directories: list[Path] = []
+    for adapter in adapters:
+        if not any((root / candidate).is_file() for candidate in adapter._skills_candidates):
+            continue
+        for skill in adapter.get_skills(root):
+            directory = locate_skill_dir(skill, root)
+            if directory is not None:
+                directories.append(directory.resolve())
+    return directories
+
+
+def _matches_detect_glob(adapters: list[AgentAdapter], name: str, changed_path: Path) -> bool:
+    for adapter in adapters:
+        for pattern in adapter._detect_globs:
+            if not fnmatch(name, pattern):
+                continue
+            check = getattr(adapter, "_detect_file", None)
+            if check is None or (changed_path.is_file() and check(changed_path)):
+                return True
+    return False
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import json
+import os
+import socket
+from pathlib import Path
+from typing import Any
+
+# Thin client for `agent-audit serve`. Kept free of scanner imports so forwarding a command
+# costs little more than interpreter startup.
+
+SOCKET_ENV = "AGENT_AUDIT_SOCKET"
+DEFAULT_TIMEOUT = 60.0
+
+
+class DaemonUnavailable(ConnectionError):
+    pass
+
+
+def absolute_paths(paths: list[Path]) -> list[str]:
+    # The daemon has its own working directory.
+    return [os.path.abspath(os.path.expanduser(str(path))) for path in paths]
+
+
+def request(
+    socket_path: str | Path,
+    payload: dict[str, Any],
+    timeout: float = DEFAULT_TIMEOUT,
+) -> dict[str, Any]:
+    """Send one JSON request line and return the decoded response line."""
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+            conn.settimeout(timeout)
+            conn.connect(str(socket_path))
+            conn.sendall(json.dumps(payload).encode("utf-8") + b"\n")
+            with conn.makefile("rb") as reader:
+                line = reader.readline()
+    except OSError as exc:
+        raise DaemonUnavailable(
+            f"agent-audit daemon not reachable at {socket_path}: {exc}"
+        ) from exc
+    if not line:
+        raise DaemonUnavailable(f"agent-audit daemon at {socket_path} closed the connection")
+    return json.loads(line)
+
+
+def try_forward(socket_path: str | Path | None, payload: dict[str, Any]) -> dict[str, Any] | None:
+    """Forward to the daemon when its socket exists; None means run locally instead."""
+    if not socket_path or not Path(socket_path).exists():
+        return None
+    try:
+        return request(socket_path, payload)
+    except DaemonUnavailable:
+        return None
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from time import monotonic
+
+from agent_audit.core.monitor import MonitorEvent
+
+# Collapses bursts of routine file events (an `npm install` reading all of node_modules) into
+# one rollup per (kind, severity, directory prefix, pid) and time window.
+
+DEFAULT_WINDOW_SECONDS = 5.0
+DEFAULT_DEPTH = 4
+DEFAULT_MAX_GROUPS = 4096
+PASSTHROUGH_SEVERITIES = frozenset({"high", "critical"})
+COALESCED_KINDS = frozenset({"READ", "WRITE"})
+
+_GroupKey = tuple[str, str, str, int | None]
+
+
+def directory_prefix(path: str, depth: int) -> str:
+    """The first `depth` directories of `path`: /a/b/c/d/e.txt at depth 2 is /a/b."""
+    directories = path.split("/")[1:-1]
+    return "/" + "/".join(directories[:depth])
+
+
+@dataclass(slots=True)
+class _Group:
+    first: MonitorEvent
+    prefix: str
+    started: float
+    count: int = 0
+
+    def emit(self) -> MonitorEvent:
+        if self.count == 1:
+            return self.first
+        return MonitorEvent(
+            kind=self.first.kind,
+            target=self.prefix,
+            severity=self.first.severity,
+            timestamp=self.first.timestamp,
+            pid=self.first.pid,
+            observed_at=self.first.observed_at,
+            count=self.count,
+        )
+
+
+class EventCoalescer:
+    """Groups low and medium READ/WRITE events; everything else passes through unchanged.
+
+    A group is emitted `window_seconds` after its first event, as that event if it stayed
+    alone or as a rollup targeting the directory prefix with `count` set. At most `max_groups`
+    are held; past that the oldest group is emitted early.
+    """
+
+    def __init__(
+        self,
+        window_seconds: float = DEFAULT_WINDOW_SECONDS,
+        depth: int = DEFAULT_DEPTH,
+        max_groups: int = DEFAULT_MAX_GROUPS,
+    ) -> None:
+        if window_seconds <= 0:
+            raise ValueError("Coalescing window must be positive.")
+        if depth < 1:
+            raise ValueError("Coalescing depth must be at least 1.")
+        if max_groups < 1:
+            raise ValueError("max_groups must be at least 1.")
+        self.window_seconds = window_seconds
+        self.depth = depth
+        self.max_groups = max_groups
+        # Insertion order is start order, so expired groups are always at the front.
+        self._groups: OrderedDict[_GroupKey, _Group] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._groups)
+
+    def add(self, events: Iterable[MonitorEvent], now: float | None = None) -> list[MonitorEvent]:
+        """Events ready to record: expired groups first, then pass-through events."""
+        now = monotonic() if now is None else now
+        emitted = self._expire(now)
+        for event in events:
+            severity = event.severity.lower()
+            if event.kind not in COALESCED_KINDS or severity in PASSTHROUGH_SEVERITIES:
+                emitted.append(event)
+                continue
+            prefix = directory_prefix(event.target, self.depth)
+            key = (event.kind, event.severity, prefix, event.pid)
+            group = self._groups.get(key)
+            if group is None:
+                if len(self._groups) >= self.max_groups:
+                    emitted.append(self._groups.popitem(last=False)[1].emit())
+                group = self._groups[key] = _Group(event, prefix, event.observed_at)
+            group.count += event.count
+        return emitted
+
+    def flush(self) -> list[MonitorEvent]:
+        emitted = [group.emit() for group in self._groups.values()]
+        self._groups.clear()
+        return emitted
+
+    def _expire(self, now: float) -> list[MonitorEvent]:
+        emitted: list[MonitorEvent] = []
+        while self._groups:
+            key, group = next(iter(self._groups.items()))
+            if now - group.started < self.window_seconds:
+                break
+            del self._groups[key]
+            emitted.append(group.emit())
+        return emitted
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from agent_audit.core.scanner import Scanner
+from agent_audit.types import ScanResult
+
+DEFAULT_MAX_WORKERS = 8
+
+
+@dataclass(slots=True)
+class Comparison:
+    paths: list[str]
+    results: list[ScanResult]
+
+    def check_rows(self) -> list[tuple[str, str]]:
+        """(key, title) of every check seen in any result, in first-seen order."""
+        rows: dict[str, str] = {}
+        for result in self.results:
+            for key, check in result.checks.items():
+                rows.setdefault(key, check.title)
+        return list(rows.items())
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "checks": [{"key": key, "title": title} for key, title in self.check_rows()],
+            "agents": [
+                {
+                    "path": path,
+                    "name": result.agent_name,
+                    "adapter": result.adapter_name,
+                    "risk_score": result.risk_score,
+                    "risk_tier": result.risk_tier,
+                    "checks": {key: check.severity for key, check in result.checks.items()},
+                }
+                for path, result in zip(self.paths, self.results, strict=True)
+            ],
+        }
+
+
+def compare_paths(
+    paths: Sequence[str | Path],
+    scanner: Scanner | None = None,
+    max_workers: int | None = None,
+) -> Comparison:
+    """Scan every distinct path once, concurrently, and line results up in argument order."""
+    scanner = scanner or Scanner()
+    targets = [Path(path).expanduser().resolve() for path in paths]
+    unique = list(dict.fromkeys(targets))
+    workers = max(1, min(max_workers or DEFAULT_MAX_WORKERS, len(unique)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        scanned = dict(zip(unique, pool.map(scanner.scan_path, unique), strict=True))
+    return Comparison(
+        paths=[str(path) for path in paths],
+        results=[scanned[target] for target in targets],
+    )
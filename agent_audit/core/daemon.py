@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import json
+import os
+import signal
+import socket
+import socketserver
+import threading
+from pathlib import Path
+from typing import Any
+
+from agent_audit.adapters import detect_adapter
+from agent_audit.adapters.helpers import ParseCache, enable_parse_cache
+from agent_audit.core.compare import compare_paths
+from agent_audit.core.reporter import render_comparison, render_many
+from agent_audit.core.scanner import Scanner
+
+# Resident scan service for `agent-audit serve`.
+#
+# Protocol: newline-delimited JSON over a Unix stream socket, one response line per request.
+#   {"op": "scan", "paths": [...], "format": "json", "fields": [...]}
+#   {"op": "compare", "paths": [...], "format": "markdown"}
+#   {"op": "discover", "paths": [...]}
+#   {"op": "ping"}
+# Responses are {"ok": true, "output": "<rendered text>"} or
+# {"ok": false, "error": "<message>", "code": <exit code>}.
+
+
+class ScanService:
+    """Warm state shared by all connections: scanner, rule packs and parse cache."""
+
+    def __init__(self, network_rules: str | Path | None = None, cache_entries: int = 4096) -> None:
+        self.scanner = Scanner(network_rules=network_rules)
+        self.parse_cache: ParseCache = enable_parse_cache(cache_entries)
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    def handle(self, request: dict[str, Any]) -> dict[str, Any]:
+        with self._lock:
+            self.requests += 1
+        op = request.get("op")
+        try:
+            paths = _string_list(request, "paths")
+            fields = _string_list(request, "fields") or None
+            output_format = str(request.get("format", "table"))
+            if op == "ping":
+                return {"ok": True, "output": "pong", "stats": self.stats()}
+            if op == "scan":
+                results = [self.scanner.scan_path(path) for path in paths or ["."]]
+                output = render_many(results, output_format=output_format, fields=fields)
+                return {"ok": True, "output": output}
+            if op == "compare":
+                comparison = compare_paths(paths, scanner=self.scanner)
+                output = render_comparison(comparison, output_format=output_format)
+                return {"ok": True, "output": output}
+            if op == "discover":
+                return {"ok": True, "output": json.dumps(self._discover(paths), indent=2)}
+        except ValueError as exc:
+            return {"ok": False, "error": str(exc), "code": 2}
+        except Exception as exc:  # noqa: BLE001 - one failing request must not kill the connection
+            return {"ok": False, "error": f"{type(exc).__name__}: {exc}", "code": 1}
+        return {"ok": False, "error": f"Unknown op: {op!r}", "code": 2}
+
+    def _discover(self, paths: list[str]) -> list[dict[str, str | None]]:
+        found: list[dict[str, str | None]] = []
+        for path in paths:
+            try:
+                adapter = detect_adapter(Path(path))
+            except ValueError:
+                found.append({"path": path, "adapter": None})
+            else:
+                found.append({"path": path, "adapter": adapter.name})
+        return found
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "requests": self.requests,
+            "parse_cache_hits": self.parse_cache.hits,
+            "parse_cache_misses": self.parse_cache.misses,
+        }
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    server: DaemonServer
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+                if not isinstance(request, dict):
+                    raise ValueError("request must be a JSON object")
+            except ValueError as exc:
+                response: dict[str, Any] = {"ok": False, "error": f"Bad request: {exc}", "code": 2}
+            else:
+                response = self.server.service.handle(request)
+            self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+            self.wfile.flush()
+
+
+class DaemonServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path: str | Path, service: ScanService) -> None:
+        self.socket_path = Path(socket_path)
+        self.service = service
+        _remove_stale_socket(self.socket_path)
+        super().__init__(str(self.socket_path), _RequestHandler)
+        os.chmod(self.socket_path, 0o600)
+
+    def server_close(self) -> None:
+        super().server_close()
+        try:
+            self.socket_path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def _string_list(request: dict[str, Any], key: str) -> list[str]:
+    value = request.get(key)
+    if value is None:
+        return []
+    if not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+        raise ValueError(f"{key!r} must be a list of strings")
+    return value
+
+
+def _remove_stale_socket(path: Path) -> None:
+    if not path.exists():
+        return
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(str(path))
+    except OSError:
+        path.unlink()
+    else:
+        raise ValueError(f"An agent-audit daemon is already listening on {path}")
+    finally:
+        probe.close()
+
+
+def serve(socket_path: str | Path, network_rules: str | Path | None = None) -> None:
+    with DaemonServer(socket_path, ScanService(network_rules=network_rules)) as server:
+
+        def _stop(_signum: int, _frame: object) -> None:
+            # shutdown() blocks until serve_forever returns, so it cannot run on this thread.
+            threading.Thread(target=server.shutdown, daemon=True).start()
+
+        signal.signal(signal.SIGTERM, _stop)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import signal
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from time import monotonic
+from typing import TYPE_CHECKING, Any
+
+from agent_audit.core.procfs import ProcBackend
+
+if TYPE_CHECKING:
+    from agent_audit.core.monitor import MonitorEvent
+
+SEVERITY_RANK = {"low": 0, "medium": 1, "high": 2, "critical": 3}
+ACTIONS = {"stop": signal.SIGSTOP, "kill": signal.SIGKILL}
+SCOPES = ("process", "tree")
+EVENT_KINDS = ("EXEC", "READ", "WRITE", "NETWORK")
+
+
+@dataclass(slots=True, frozen=True)
+class EnforcementRule:
+    """Signal the offending process (or the whole tree) for events at or above a severity."""
+
+    severity: str
+    action: str
+    scope: str = "process"
+    kind: str | None = None
+
+    def matches(self, event: MonitorEvent) -> bool:
+        if self.kind is not None and event.kind != self.kind:
+            return False
+        return SEVERITY_RANK.get(event.severity.lower(), 0) >= SEVERITY_RANK[self.severity]
+
+    def __str__(self) -> str:
+        prefix = f"{self.kind.lower()}/" if self.kind else ""
+        return f"{prefix}{self.severity}:{self.action}:{self.scope}"
+
+
+def parse_rule(spec: str) -> EnforcementRule:
+    """Parse `[KIND/]SEVERITY:ACTION[:SCOPE]`, e.g. `critical:kill` or `read/high:stop:tree`."""
+    kind: str | None = None
+    body = spec.strip()
+    if "/" in body:
+        raw_kind, body = body.split("/", 1)
+        kind = raw_kind.strip().upper()
+        if kind not in EVENT_KINDS:
+            raise ValueError(
+                f"Invalid enforce rule {spec!r}: kind must be one of {', '.join(EVENT_KINDS)}"
+            )
+    parts = [part.strip().lower() for part in body.split(":")]
+    if len(parts) not in {2, 3}:
+        raise ValueError(f"Invalid enforce rule {spec!r}; expected [KIND/]SEVERITY:ACTION[:SCOPE]")
+    severity, action = parts[0], parts[1]
+    scope = parts[2] if len(parts) == 3 else "process"
+    if severity not in SEVERITY_RANK:
+        raise ValueError(
+            f"Invalid enforce rule {spec!r}: severity must be one of {', '.join(SEVERITY_RANK)}"
+        )
+    if action not in ACTIONS:
+        raise ValueError(
+            f"Invalid enforce rule {spec!r}: action must be one of {', '.join(ACTIONS)}"
+        )
+    if scope not in SCOPES:
+        raise ValueError(f"Invalid enforce rule {spec!r}: scope must be one of {', '.join(SCOPES)}")
+    return EnforcementRule(severity=severity, action=action, scope=scope, kind=kind)
+
+
+@dataclass(slots=True)
+class EnforcementAction:
+    rule: str
+    action: str
+    pids: list[int]
+    event_kind: str
+    event_target: str
+    event_pid: int | None
+    latency_ms: float
+    signalled: list[int] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "rule": self.rule,
+            "action": self.action,
+            "pids": list(self.pids),
+            "signalled": list(self.signalled),
+            "event": {"kind": self.event_kind, "target": self.event_target, "pid": self.event_pid},
+            "latency_ms": round(self.latency_ms, 3),
+        }
+
+
+class Enforcer:
+    """Applies the first matching rule to each event as soon as the monitor observes it.
+
+    Latency is measured from the event's `observed_at` (monotonic clock) to the signal.
+    Tree-scoped rules signal the monitored root first, so a stopped root cannot spawn
+    replacements, then every other descendant.
+    """
+
+    def __init__(
+        self,
+        rules: Iterable[EnforcementRule],
+        backend: ProcBackend,
+        allow_tree: bool = False,
+    ) -> None:
+        self.rules = list(rules)
+        if not allow_tree and any(rule.scope == "tree" for rule in self.rules):
+            raise ValueError("Tree-scoped enforce rules require a session started with --exec.")
+        self.backend = backend
+        self.actions: list[EnforcementAction] = []
+        self.stopped: set[int] = set()
+        self._killed: set[int] = set()
+
+    def apply(
+        self, events: Iterable[MonitorEvent], root_pid: int, descendants: set[int]
+    ) -> list[EnforcementAction]:
+        taken: list[EnforcementAction] = []
+        for event in events:
+            rule = next((rule for rule in self.rules if rule.matches(event)), None)
+            if rule is None:
+                continue
+            if rule.scope == "tree":
+                pids = [root_pid, *sorted(pid for pid in descendants if pid != root_pid)]
+            elif event.pid is not None:
+                pids = [event.pid]
+            else:
+                continue
+            signum = ACTIONS[rule.action]
+            pending = [pid for pid in pids if self._needs_signal(pid, rule.action)]
+            if not pending:
+                continue
+            signalled = [pid for pid in pending if self.backend.send_signal(pid, signum)]
+            latency = (monotonic() - event.observed_at) * 1000
+            for pid in signalled:
+                (self._killed if rule.action == "kill" else self.stopped).add(pid)
+            action = EnforcementAction(
+                rule=str(rule),
+                action=rule.action,
+                pids=pending,
+                event_kind=event.kind,
+                event_target=event.target,
+                event_pid=event.pid,
+                latency_ms=latency,
+                signalled=signalled,
+            )
+            self.actions.append(action)
+            taken.append(action)
+        return taken
+
+    def _needs_signal(self, pid: int, action: str) -> bool:
+        if pid in self._killed:
+            return False
+        return action == "kill" or pid not in self.stopped
+
+    def release(self) -> None:
+        """Terminate processes this enforcer stopped (used when the session owns the tree)."""
+        for pid in sorted(self.stopped - self._killed):
+            self.backend.send_signal(pid, signal.SIGTERM)
+            self.backend.send_signal(pid, signal.SIGCONT)
+        self.stopped.clear()
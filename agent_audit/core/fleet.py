@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import heapq
+import math
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+
+from agent_audit.core.risk import TIER_THRESHOLDS, TIERS, WEIGHTS
+from agent_audit.types import ScanResult
+
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:  # pragma: no cover - numpy is optional
+    HAS_NUMPY = False
+
+DEFAULT_PERCENTILES = (50.0, 90.0, 99.0)
+
+_TIER_BOUNDS = [threshold for threshold, _ in TIER_THRESHOLDS]
+
+
+@dataclass(slots=True)
+class FleetReport:
+    scores: list[float]
+    tiers: list[str]
+    tier_histogram: dict[str, int]
+    percentiles: dict[str, dict[str, float]]
+    top: list[tuple[str, float]] = field(default_factory=list)
+
+
+class CheckMatrix:
+    """Check scores of many scan results packed row-major into one contiguous float64 buffer.
+
+    Missing checks are stored as NaN: they contribute nothing to a score, like in
+    `calculate_risk_score`, and are ignored by percentiles.
+    """
+
+    def __init__(self, keys: Sequence[str], values: array, labels: list[str]) -> None:
+        self.keys = tuple(keys)
+        self.values = values
+        self.labels = labels
+
+    @classmethod
+    def from_results(
+        cls,
+        results: Iterable[ScanResult],
+        keys: Sequence[str] | None = None,
+    ) -> CheckMatrix:
+        results = list(results)
+        if keys is None:
+            ordered = dict.fromkeys(WEIGHTS)
+            for result in results:
+                ordered.update(dict.fromkeys(result.checks))
+            keys = list(ordered)
+        values = array("d")
+        labels: list[str] = []
+        nan = math.nan
+        for result in results:
+            checks = result.checks
+            values.extend(checks[key].score if key in checks else nan for key in keys)
+            labels.append(result.scanned_path)
+        return cls(keys, values, labels)
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def column(self, key: str) -> list[float]:
+        index = self.keys.index(key)
+        return self.values[index :: len(self.keys)].tolist()
+
+    def scores(self, weights: Mapping[str, float] = WEIGHTS) -> list[float]:
+        if HAS_NUMPY:
+            raw = self._raw_scores_numpy(weights).tolist()
+        else:
+            raw = self._raw_scores_array(weights)
+        # Python's correctly-rounded round() keeps parity with calculate_risk_score.
+        return [round(value, 1) for value in raw]
+
+    def report(
+        self,
+        weights: Mapping[str, float] = WEIGHTS,
+        top_n: int = 10,
+        percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+    ) -> FleetReport:
+        """Score, tier and summarize the whole fleet; pass other weights to re-score."""
+        scores = self.scores(weights)
+        tier_indexes = self._tier_indexes(scores)
+        histogram = dict.fromkeys(TIERS, 0)
+        for index in tier_indexes:
+            histogram[TIERS[index]] += 1
+        return FleetReport(
+            scores=scores,
+            tiers=[TIERS[index] for index in tier_indexes],
+            tier_histogram=histogram,
+            percentiles={key: self._percentiles(key, percentiles) for key in self.keys},
+            top=self._top(scores, top_n),
+        )
+
+    def _weight_vector(self, weights: Mapping[str, float]) -> list[float]:
+        return [float(weights.get(key, 0.0)) for key in self.keys]
+
+    def _raw_scores_numpy(self, weights: Mapping[str, float]) -> np.ndarray:
+        matrix = np.frombuffer(self.values, dtype=np.float64).reshape(len(self), len(self.keys))
+        total = np.zeros(len(self), dtype=np.float64)
+        # Accumulate column by column in key order, the same float operations as the
+        # per-result loop, so rounded scores match exactly.
+        for column, weight in enumerate(self._weight_vector(weights)):
+            if weight:
+                total += np.nan_to_num(matrix[:, column]) * weight
+        return total
+
+    def _raw_scores_array(self, weights: Mapping[str, float]) -> list[float]:
+        width = len(self.keys)
+        vector = self._weight_vector(weights)
+        values = self.values
+        totals = [0.0] * len(self)
+        for column, weight in enumerate(vector):
+            if not weight:
+                continue
+            for row, value in enumerate(values[column::width]):
+                if value == value:  # skip NaN (missing check)
+                    totals[row] += value * weight
+        return totals
+
+    def _tier_indexes(self, scores: list[float]) -> list[int]:
+        if HAS_NUMPY:
+            return np.searchsorted(_TIER_BOUNDS, scores, side="right").tolist()
+        return [bisect_right(_TIER_BOUNDS, score) for score in scores]
+
+    def _percentiles(self, key: str, percentiles: Sequence[float]) -> dict[str, float]:
+        column = [value for value in self.column(key) if value == value]
+        if not column:
+            return {}
+        if HAS_NUMPY:
+            computed = np.percentile(np.asarray(column), list(percentiles)).tolist()
+        else:
+            column.sort()
+            computed = [_linear_percentile(column, percentile) for percentile in percentiles]
+        return {
+            f"p{percentile:g}": round(value, 2)
+            for percentile, value in zip(percentiles, computed, strict=True)
+        }
+
+    def _top(self, scores: list[float], top_n: int) -> list[tuple[str, float]]:
+        if top_n <= 0:
+            return []
+        best = heapq.nlargest(top_n, range(len(scores)), key=lambda index: (scores[index], -index))
+        return [(self.labels[index], scores[index]) for index in best]
+
+
+def _linear_percentile(ordered: list[float], percentile: float) -> float:
+    # Same "linear" interpolation numpy.percentile uses by default.
+    rank = (len(ordered) - 1) * percentile / 100.0
+    lower = math.floor(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def score_fleet(
+    results: Iterable[ScanResult],
+    weights: Mapping[str, float] = WEIGHTS,
+    top_n: int = 10,
+) -> FleetReport:
+    return CheckMatrix.from_results(results).report(weights=weights, top_n=top_n)
@@ -0,0 +1,307 @@
+from __future__ import annotations
+
+import subprocess
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path, PurePosixPath
+from types import TracebackType
+from typing import IO, Any
+
+from agent_audit.adapters import all_adapters
+from agent_audit.core.changes import _exact_candidates, _git
+from agent_audit.core.scanner import Scanner
+from agent_audit.types import ScanResult
+from agent_audit.utils.vfs import MAX_RETAINED_BYTES, VirtualFS
+
+# Scores an agent root at every commit that touched its config, skills manifest or skill files,
+# reading blobs straight from the object database instead of checking out trees.
+
+_SYMLINK_MODE = "120000"
+_SUBMODULE_MODE = "160000"
+# Requests written ahead of reading; kept well under the pipe buffer so writes never block.
+_BATCH_REQUESTS = 256
+
+
+class GitObjectReader:
+    """One long-lived `git cat-file --batch` process shared by every blob read."""
+
+    def __init__(self, repo: Path) -> None:
+        try:
+            self._process = subprocess.Popen(
+                ["git", "-C", str(repo), "cat-file", "--batch"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        except OSError as exc:
+            raise ValueError(f"Could not run git: {exc}") from exc
+        self.objects_read = 0
+
+    def __enter__(self) -> GitObjectReader:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._process.stdin is not None and not self._process.stdin.closed:
+            self._process.stdin.close()
+        self._process.wait()
+        if self._process.stdout is not None:
+            self._process.stdout.close()
+
+    def read_many(self, shas: Iterable[str]) -> Iterator[tuple[str, bytes | None]]:
+        """(sha, content) per object in request order; content is None for missing objects."""
+        stdin: IO[bytes] = self._process.stdin  # type: ignore[assignment]
+        stdout: IO[bytes] = self._process.stdout  # type: ignore[assignment]
+        pending = list(shas)
+        for start in range(0, len(pending), _BATCH_REQUESTS):
+            chunk = pending[start : start + _BATCH_REQUESTS]
+            stdin.write("".join(f"{sha}\n" for sha in chunk).encode("ascii"))
+            stdin.flush()
+            for sha in chunk:
+                header = stdout.readline().split()
+                if len(header) != 3:
+                    yield sha, None
+                    continue
+                size = int(header[2])
+                content = stdout.read(size)
+                stdout.read(1)
+                self.objects_read += 1
+                yield sha, content
+
+
+@dataclass(slots=True, frozen=True)
+class _Commit:
+    sha: str
+    timestamp: int
+    subject: str
+    changes: tuple[tuple[str, str, str], ...]  # (path, mode, sha); sha is null for deletions
+
+
+@dataclass(slots=True)
+class CommitScan:
+    commit: str
+    committed_at: str
+    subject: str
+    agent_root: str
+    result: ScanResult | None
+    reused: bool = False
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "commit": self.commit,
+            "committed_at": self.committed_at,
+            "subject": self.subject,
+            "agent_root": self.agent_root,
+            "reused": self.reused,
+            "result": self.result.to_dict() if self.result is not None else None,
+        }
+
+
+@dataclass(slots=True)
+class GitHistoryScan:
+    repo: str
+    scans: list[CommitScan] = field(default_factory=list)
+    commits: int = 0
+    unique_states: int = 0
+    blobs_read: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "repo": self.repo,
+            "commits": self.commits,
+            "unique_states": self.unique_states,
+            "blobs_read": self.blobs_read,
+            "scans": [scan.to_dict() for scan in self.scans],
+        }
+
+
+def _relative_roots(top: Path, paths: Iterable[str | Path]) -> list[str]:
+    roots: dict[str, None] = {}
+    for raw in paths:
+        path = Path(raw).expanduser()
+        if path.is_absolute():
+            try:
+                path = path.resolve().relative_to(top)
+            except ValueError as exc:
+                raise ValueError(f"{raw} is outside the repository {top}") from exc
+        relative = PurePosixPath(path.as_posix())
+        if ".." in relative.parts:
+            raise ValueError(f"{raw} is outside the repository {top}")
+        roots[str(relative)] = None
+    return list(roots) or ["."]
+
+
+def _pathspecs(roots: list[str]) -> list[str]:
+    """Exact config/skills files, fuzzy detection globs and skill directories under each root."""
+    globs = sorted({pattern for adapter in all_adapters() for pattern in adapter._detect_globs})
+    specs: list[str] = []
+    for root in roots:
+        prefix = "" if root == "." else f"{root}/"
+        specs.extend(f":(literal){prefix}{candidate}" for candidate in _exact_candidates())
+        specs.extend(f":(glob){prefix}**/{pattern}" for pattern in globs)
+        specs.append(f":(glob){prefix}**/skills/**")
+    return specs
+
+
+def _log(top: Path, rev: str, pathspecs: list[str], max_count: int | None) -> list[_Commit]:
+    args = [
+        "log",
+        "--reverse",
+        "--first-parent",
+        "-m",
+        "--raw",
+        "--no-renames",
+        "--no-abbrev",
+        "-z",
+    ]
+    args.append("--format=%x01%H %ct %s")
+    if max_count is not None:
+        args.append(f"--max-count={max_count}")
+    output = _git(top, *args, rev, "--", *pathspecs)
+
+    commits: list[_Commit] = []
+    for record in output.split("\x01")[1:]:
+        header, _, raw = record.partition("\0")
+        sha, timestamp, subject = (header.split(" ", 2) + [""])[:3]
+        commits.append(_Commit(sha, int(timestamp), subject, _parse_raw(raw)))
+    return commits
+
+
+def _parse_raw(raw: str) -> tuple[tuple[str, str, str], ...]:
+    """`--raw -z` entries -> (path, new mode, new sha)."""
+    # Every field is NUL-terminated, so the split leaves one empty token at the end.
+    tokens = raw.lstrip("\n").split("\0")[:-1]
+    changes = []
+    for meta, path in zip(tokens[::2], tokens[1::2], strict=True):
+        fields = meta.lstrip(":").split()
+        if len(fields) == 5:
+            changes.append((path, fields[1], fields[3]))
+    return tuple(changes)
+
+
+def _seed_state(top: Path, commit: str, pathspecs: list[str]) -> dict[str, tuple[str, str]]:
+    """Relevant files as of the first parent of `commit` (empty for a root commit)."""
+    try:
+        _git(top, "rev-parse", "--verify", "-q", f"{commit}^")
+    except ValueError:
+        return {}
+    # ls-tree does not support pathspec magic, so diff the parent against the empty tree.
+    empty_tree = _git(top, "hash-object", "-t", "tree", "/dev/null").strip()
+    raw = _git(
+        top,
+        *("diff-tree", "-r", "--raw", "--no-renames", "--no-abbrev", "-z"),
+        *(empty_tree, f"{commit}^", "--", *pathspecs),
+    )
+    return {path: (mode, sha) for path, mode, sha in _parse_raw(raw)}
+
+
+def _root_files(
+    state: dict[str, tuple[str, str]], root: str
+) -> frozenset[tuple[str, str, str]]:
+    prefix = "" if root == "." else f"{root}/"
+    return frozenset(
+        (path, mode, sha)
+        for path, (mode, sha) in state.items()
+        if path.startswith(prefix) and mode != _SUBMODULE_MODE
+    )
+
+
+def _build_tree(
+    top: Path, files: frozenset[tuple[str, str, str]], blobs: dict[str, bytes | None]
+) -> VirtualFS:
+    fs = VirtualFS(top)
+    for path, mode, sha in files:
+        content = blobs.get(sha)
+        if content is None:
+            continue
+        if mode == _SYMLINK_MODE:
+            fs.add_symlink(path, content.decode("utf-8", errors="replace"))
+        else:
+            fs.add_file(path, content)
+    return fs
+
+
+def scan_git_history(
+    repo: str | Path,
+    paths: Iterable[str | Path] = (),
+    scanner: Scanner | None = None,
+    rev: str = "HEAD",
+    max_count: int | None = None,
+) -> GitHistoryScan:
+    """Score each agent root at every first-parent commit that changed its relevant files.
+
+    Commits come from one `git log --raw` and blobs from one `git cat-file --batch` process.
+    Each root's set of (path, blob) pairs identifies its state, so a state seen before
+    (reverts, commits touching other roots) reuses the earlier result instead of re-scanning.
+    """
+    scanner = scanner or Scanner()
+    start = Path(repo).expanduser().resolve()
+    top = Path(
+        _git(start if start.is_dir() else start.parent, "rev-parse", "--show-toplevel").strip()
+    )
+    roots = _relative_roots(top, paths)
+    pathspecs = _pathspecs(roots)
+    commits = _log(top, rev, pathspecs, max_count)
+    report = GitHistoryScan(repo=str(top), commits=len(commits))
+    if not commits:
+        return report
+
+    state = _seed_state(top, commits[0].sha, pathspecs)
+    previous: dict[str, frozenset[tuple[str, str, str]]] = {
+        root: _root_files(state, root) for root in roots
+    }
+    timeline: list[tuple[_Commit, str, frozenset[tuple[str, str, str]]]] = []
+    for commit in commits:
+        for path, mode, sha in commit.changes:
+            if not sha.strip("0"):  # all-zero object id: deleted
+                state.pop(path, None)
+            else:
+                state[path] = (mode, sha)
+        for root in roots:
+            files = _root_files(state, root)
+            if files != previous[root]:
+                timeline.append((commit, root, files))
+                previous[root] = files
+
+    states = list(dict.fromkeys(files for _, _, files in timeline))
+    wanted = list(dict.fromkeys(sha for files in states for _, _, sha in files))
+    blobs: dict[str, bytes | None] = {}
+    with GitObjectReader(top) as reader:
+        for sha, content in reader.read_many(wanted):
+            blobs[sha] = content if content is None or len(content) <= MAX_RETAINED_BYTES else None
+        report.blobs_read = reader.objects_read
+
+    results: dict[tuple[str, frozenset[tuple[str, str, str]]], ScanResult | None] = {}
+    for commit, root, files in timeline:
+        key = (root, files)
+        reused = key in results
+        if not reused:
+            result = None
+            if files:
+                tree = _build_tree(top, files, blobs)
+                try:
+                    result = scanner.scan_virtual(tree.path(root if root != "." else ""))
+                except ValueError:
+                    # No supported agent config at this commit (not added yet or removed).
+                    result = None
+            results[key] = result
+        report.scans.append(
+            CommitScan(
+                commit=commit.sha,
+                committed_at=datetime.fromtimestamp(commit.timestamp, tz=timezone.utc).isoformat(),
+                subject=commit.subject,
+                agent_root=root,
+                result=results[key],
+                reused=reused,
+            )
+        )
+    report.unique_states = len(results)
+    return report
@@ -0,0 +1,424 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from agent_audit.types import ScanResult
+
+if TYPE_CHECKING:
+    from agent_audit.core.monitor import MonitorEvent, MonitorSummary
+
+HISTORY_ENV = "AGENT_AUDIT_HISTORY"
+HISTORY_SCHEMA_VERSION = 2
+BATCH_SIZE = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS scans (
+    id INTEGER PRIMARY KEY,
+    agent_root TEXT NOT NULL,
+    adapter TEXT NOT NULL,
+    agent_name TEXT NOT NULL,
+    agent_version TEXT NOT NULL,
+    scanned_at TEXT NOT NULL,
+    risk_score REAL NOT NULL,
+    risk_tier TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS scans_root_time ON scans (agent_root, scanned_at);
+CREATE INDEX IF NOT EXISTS scans_adapter_time ON scans (adapter, scanned_at);
+CREATE INDEX IF NOT EXISTS scans_time ON scans (scanned_at);
+-- agent_root and scanned_at are copied from scans so "what changed" windows are served
+-- in index order without joining and sorting.
+CREATE TABLE IF NOT EXISTS checks (
+    scan_id INTEGER NOT NULL REFERENCES scans (id),
+    check_key TEXT NOT NULL,
+    agent_root TEXT NOT NULL,
+    scanned_at TEXT NOT NULL,
+    score REAL NOT NULL,
+    severity TEXT NOT NULL,
+    summary TEXT NOT NULL,
+    details TEXT NOT NULL,
+    PRIMARY KEY (scan_id, check_key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS checks_root_key_time
+    ON checks (agent_root, check_key, scanned_at, scan_id);
+CREATE INDEX IF NOT EXISTS checks_key ON checks (check_key);
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    pid INTEGER NOT NULL,
+    command TEXT,
+    started_at TEXT NOT NULL,
+    ended_at TEXT NOT NULL,
+    events INTEGER NOT NULL,
+    alerts_high INTEGER NOT NULL,
+    alerts_medium INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sessions_time ON sessions (started_at);
+CREATE TABLE IF NOT EXISTS session_events (
+    session_id INTEGER NOT NULL REFERENCES sessions (id),
+    timestamp TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    target TEXT NOT NULL,
+    severity TEXT NOT NULL,
+    count INTEGER NOT NULL DEFAULT 1
+);
+CREATE INDEX IF NOT EXISTS session_events_session ON session_events (session_id, timestamp);
+"""
+
+# SQLite date modifiers per trend bucket; "scan" keeps one row per scan.
+BUCKETS = {
+    "scan": None,
+    "day": "%Y-%m-%d",
+    "week": "%Y-W%W",
+    "month": "%Y-%m",
+}
+
+
+@dataclass(slots=True)
+class TrendPoint:
+    agent_root: str
+    adapter: str
+    period: str
+    scans: int
+    risk_score: float
+    max_risk_score: float
+    risk_tier: str
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "agent_root": self.agent_root,
+            "adapter": self.adapter,
+            "period": self.period,
+            "scans": self.scans,
+            "risk_score": self.risk_score,
+            "max_risk_score": self.max_risk_score,
+            "risk_tier": self.risk_tier,
+        }
+
+
+@dataclass(slots=True)
+class CheckChange:
+    agent_root: str
+    adapter: str
+    check_key: str
+    changed_at: str
+    previous_at: str
+    severity: str
+    previous_severity: str
+    score: float
+    previous_score: float
+    summary: str
+    previous_summary: str
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "agent_root": self.agent_root,
+            "adapter": self.adapter,
+            "check_key": self.check_key,
+            "changed_at": self.changed_at,
+            "previous_at": self.previous_at,
+            "severity": self.severity,
+            "previous_severity": self.previous_severity,
+            "score": self.score,
+            "previous_score": self.previous_score,
+            "summary": self.summary,
+            "previous_summary": self.previous_summary,
+        }
+
+
+def _filters(
+    agent_root: str | None,
+    adapter: str | None,
+    since: str | None,
+    until: str | None,
+) -> tuple[str, list[Any]]:
+    clauses: list[str] = []
+    params: list[Any] = []
+    for clause, value in (
+        ("s.agent_root = ?", agent_root),
+        ("s.adapter = ?", adapter),
+        ("s.scanned_at >= ?", since),
+        ("s.scanned_at < ?", until),
+    ):
+        if value is not None:
+            clauses.append(clause)
+            params.append(value)
+    return (" AND ".join(clauses) or "1"), params
+
+
+def _encode_details(encoded: dict[tuple[str, ...], str], details: list[str]) -> str:
+    key = tuple(details)
+    value = encoded.get(key)
+    if value is None:
+        value = encoded[key] = json.dumps(details)
+    return value
+
+
+class HistoryStore:
+    """Local SQLite history of scan results and monitor sessions."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(path, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute("PRAGMA cache_size=-65536")
+        with self._transaction():
+            for statement in _SCHEMA.split(";"):
+                if statement.strip():
+                    self._connection.execute(statement)
+            row = self._connection.execute(
+                "SELECT value FROM meta WHERE key = 'schema_version'"
+            ).fetchone()
+            if row is None:
+                self._connection.execute(
+                    "INSERT INTO meta (key, value) VALUES ('schema_version', ?)",
+                    (str(HISTORY_SCHEMA_VERSION),),
+                )
+            elif int(row[0]) > HISTORY_SCHEMA_VERSION:
+                raise ValueError(
+                    f"History database {path} uses schema {row[0]}; this agent-audit reads up to "
+                    f"{HISTORY_SCHEMA_VERSION}"
+                )
+            elif int(row[0]) < HISTORY_SCHEMA_VERSION:
+                self._migrate(int(row[0]))
+
+    def _migrate(self, version: int) -> None:
+        if version < 2:
+            # Version 2 records how many raw events a coalesced session event stands for.
+            self._connection.execute(
+                "ALTER TABLE session_events ADD COLUMN count INTEGER NOT NULL DEFAULT 1"
+            )
+        self._connection.execute(
+            "UPDATE meta SET value = ? WHERE key = 'schema_version'",
+            (str(HISTORY_SCHEMA_VERSION),),
+        )
+
+    def close(self) -> None:
+        self._connection.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        self._connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self._connection.rollback()
+            raise
+        self._connection.commit()
+
+    def __enter__(self) -> HistoryStore:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    # Writes
+
+    def record_scans(self, results: Iterable[ScanResult], batch_size: int = BATCH_SIZE) -> int:
+        """Insert results, committing one transaction per `batch_size` scans."""
+        with self.batch(batch_size) as add:
+            count = 0
+            for result in results:
+                add(result)
+                count += 1
+        return count
+
+    @contextmanager
+    def batch(self, batch_size: int = BATCH_SIZE) -> Iterator[Any]:
+        """Yield an `add(result)` callable that buffers and writes in batched transactions."""
+        pending: list[ScanResult] = []
+
+        def add(result: ScanResult) -> None:
+            pending.append(result)
+            if len(pending) >= batch_size:
+                self._write(pending)
+                pending.clear()
+
+        try:
+            yield add
+        finally:
+            if pending:
+                self._write(pending)
+
+    def _write(self, results: list[ScanResult]) -> None:
+        connection = self._connection
+        # The write lock is held from the start, so ids allocated from MAX(id) cannot collide
+        # with another writer and both tables are filled with executemany.
+        with self._transaction():
+            (first_id,) = connection.execute(
+                "SELECT COALESCE(MAX(id), 0) + 1 FROM scans"
+            ).fetchone()
+            scans = []
+            checks = []
+            # Fleets repeat the same details across scans; encode each distinct list once.
+            encoded: dict[tuple[str, ...], str] = {}
+            for scan_id, result in enumerate(results, start=first_id):
+                scans.append(
+                    (
+                        scan_id,
+                        result.scanned_path,
+                        result.adapter_name,
+                        result.agent_name,
+                        result.agent_version,
+                        result.generated_at,
+                        result.risk_score,
+                        result.risk_tier,
+                    )
+                )
+                checks.extend(
+                    (
+                        scan_id,
+                        key,
+                        result.scanned_path,
+                        result.generated_at,
+                        check.score,
+                        check.severity,
+                        check.summary,
+                        _encode_details(encoded, check.details),
+                    )
+                    for key, check in result.checks.items()
+                )
+            connection.executemany(
+                "INSERT INTO scans (id, agent_root, adapter, agent_name, agent_version, "
+                "scanned_at, risk_score, risk_tier) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                scans,
+            )
+            connection.executemany(
+                "INSERT INTO checks (scan_id, check_key, agent_root, scanned_at, score, severity, "
+                "summary, details) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                checks,
+            )
+
+    def record_session(
+        self,
+        pid: int,
+        command: str | None,
+        started_at: str,
+        ended_at: str,
+        events: list[MonitorEvent],
+        summary: MonitorSummary,
+    ) -> int:
+        with self._transaction():
+            cursor = self._connection.execute(
+                "INSERT INTO sessions (pid, command, started_at, ended_at, events, alerts_high, "
+                "alerts_medium) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    pid,
+                    command,
+                    started_at,
+                    ended_at,
+                    summary.events,
+                    summary.alerts_high,
+                    summary.alerts_medium,
+                ),
+            )
+            session_id = int(cursor.lastrowid or 0)
+            self._connection.executemany(
+                "INSERT INTO session_events (session_id, timestamp, kind, target, severity, "
+                "count) VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        session_id,
+                        event.timestamp,
+                        event.kind,
+                        event.target,
+                        event.severity,
+                        event.count,
+                    )
+                    for event in events
+                ],
+            )
+        return session_id
+
+    # Queries
+
+    def trend(
+        self,
+        agent_root: str | None = None,
+        adapter: str | None = None,
+        since: str | None = None,
+        until: str | None = None,
+        bucket: str = "day",
+        limit: int = 1000,
+    ) -> list[TrendPoint]:
+        if bucket not in BUCKETS:
+            raise ValueError(f"Unknown bucket {bucket!r}; expected one of {', '.join(BUCKETS)}")
+        where, params = _filters(agent_root, adapter, since, until)
+        fmt = BUCKETS[bucket]
+        period = "s.scanned_at" if fmt is None else f"strftime('{fmt}', s.scanned_at)"
+        # The tier is the one of the latest scan in each period, ranked explicitly rather than
+        # relying on which row SQLite picks for a bare column beside MAX().
+        rows = self._connection.execute(
+            "SELECT agent_root, adapter, period, COUNT(*), AVG(risk_score), MAX(risk_score), "
+            "MAX(CASE WHEN latest = 1 THEN risk_tier END) FROM ("
+            f"SELECT s.agent_root, s.adapter, {period} AS period, s.risk_score, s.risk_tier, "
+            "ROW_NUMBER() OVER (PARTITION BY s.agent_root, s.adapter, "
+            f"{period} ORDER BY s.scanned_at DESC, s.id DESC) AS latest "
+            f"FROM scans s WHERE {where}) "
+            "GROUP BY agent_root, adapter, period "
+            "ORDER BY period DESC, agent_root LIMIT ?",
+            [*params, limit],
+        ).fetchall()
+        return [
+            TrendPoint(
+                agent_root=row[0],
+                adapter=row[1],
+                period=row[2],
+                scans=row[3],
+                risk_score=round(row[4], 2),
+                max_risk_score=row[5],
+                risk_tier=row[6],
+            )
+            for row in reversed(rows)
+        ]
+
+    def changes(
+        self,
+        agent_root: str | None = None,
+        adapter: str | None = None,
+        check_key: str | None = None,
+        since: str | None = None,
+        until: str | None = None,
+        limit: int = 1000,
+    ) -> list[CheckChange]:
+        """Scans where a check's severity or summary differs from the previous scan of that root."""
+        # Only root and check narrow the window input: a time or adapter filter applied before
+        # LAG() would leave the first matching scan without its predecessor.
+        inner: list[str] = []
+        outer: list[str] = []
+        params: list[Any] = []
+        for clauses, clause, value in (
+            (inner, "c.check_key = ?", check_key),
+            (inner, "c.agent_root = ?", agent_root),
+            (outer, "changed_at >= ?", since),
+            (outer, "changed_at < ?", until),
+            (outer, "s.adapter = ?", adapter),
+        ):
+            if value is not None:
+                clauses.append(clause)
+                params.append(value)
+        rows = self._connection.execute(
+            "SELECT changed.agent_root, s.adapter, check_key, changed_at, previous_at, severity, "
+            "previous_severity, score, previous_score, summary, previous_summary FROM ("
+            "SELECT c.scan_id, c.agent_root, c.check_key, c.scanned_at AS changed_at, "
+            "LAG(c.scanned_at) OVER w AS previous_at, c.severity, "
+            "LAG(c.severity) OVER w AS previous_severity, c.score, "
+            "LAG(c.score) OVER w AS previous_score, c.summary, "
+            "LAG(c.summary) OVER w AS previous_summary "
+            f"FROM checks c WHERE {' AND '.join(inner) or '1'} "
+            "WINDOW w AS (PARTITION BY c.agent_root, c.check_key ORDER BY c.scanned_at, c.scan_id)"
+            ") AS changed JOIN scans s ON s.id = changed.scan_id "
+            "WHERE previous_at IS NOT NULL "
+            "AND (severity != previous_severity OR summary != previous_summary) "
+            f"{''.join(f'AND {clause} ' for clause in outer)}"
+            "ORDER BY changed_at DESC, changed.agent_root, check_key LIMIT ?",
+            [*params, limit],
+        ).fetchall()
+        return [CheckChange(*row) for row in reversed(rows)]
@@ -1,10 +1,19 @@
 from __future__ import annotations
 
+import zlib
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from time import sleep
-from typing import Iterable
+from time import monotonic, sleep
+from typing import TYPE_CHECKING, Any, Iterable
+
+from agent_audit.core.enforce import EnforcementAction, EnforcementRule, Enforcer
+from agent_audit.core.procfs import ProcBackend, RealProcFS
+from agent_audit.core.sinks import EventSink, SinkDispatcher, SinkStats
+
+if TYPE_CHECKING:
+    from agent_audit.core.coalesce import EventCoalescer
 
 
 @dataclass(slots=True)
@@ -15,6 +24,21 @@ class MonitorEvent:
     timestamp: str = field(
         default_factory=lambda: datetime.now(tz=timezone.utc).isoformat(timespec="seconds")
     )
+    pid: int | None = None
+    # Monotonic time the event was observed; enforcement latency is measured from here.
+    observed_at: float = field(default_factory=monotonic)
+    # Events this one stands for; above 1 for coalesced rollups, whose target is a directory.
+    count: int = 1
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "timestamp": self.timestamp,
+            "kind": self.kind,
+            "target": self.target,
+            "severity": self.severity,
+            "pid": self.pid,
+            "count": self.count,
+        }
 
 
 @dataclass(slots=True)
@@ -22,24 +46,67 @@ class MonitorSummary:
     events: int
     alerts_high: int
     alerts_medium: int
+    enforced: int = 0
+    max_enforcement_latency_ms: float | None = None
 
 
 class SessionMonitor:
-    def __init__(self) -> None:
+    def __init__(self, sinks: Iterable[EventSink | SinkDispatcher] = ()) -> None:
         self._events: list[MonitorEvent] = []
+        self.enforcement: list[EnforcementAction] = []
+        # Each sink gets its own queue and worker thread; record() only enqueues.
+        self.dispatchers = [
+            sink if isinstance(sink, SinkDispatcher) else SinkDispatcher(sink) for sink in sinks
+        ]
 
     def record(self, event: MonitorEvent) -> None:
-        self._events.append(event)
+        self.record_many([event])
+
+    def record_many(self, events: list[MonitorEvent]) -> None:
+        # One call per poll, so a blocking sink stalls the poll for at most its block_timeout.
+        self._events.extend(events)
+        for dispatcher in self.dispatchers:
+            dispatcher.submit_many(events)
+
+    def record_enforcement(self, action: EnforcementAction) -> None:
+        self.enforcement.append(action)
+
+    def close(self) -> None:
+        for dispatcher in self.dispatchers:
+            dispatcher.close()
+
+    def sink_stats(self) -> dict[str, SinkStats]:
+        return {dispatcher.sink.name: dispatcher.stats for dispatcher in self.dispatchers}
 
     @property
     def events(self) -> list[MonitorEvent]:
         return list(self._events)
 
     def summarize(self) -> MonitorSummary:
-        high = sum(1 for event in self._events if event.severity.lower() in {"high", "critical"})
-        medium = sum(1 for event in self._events if event.severity.lower() == "medium")
-        return MonitorSummary(events=len(self._events), alerts_high=high, alerts_medium=medium)
-
+        events = self._events
+        high = sum(
+            event.count for event in events if event.severity.lower() in {"high", "critical"}
+        )
+        medium = sum(event.count for event in events if event.severity.lower() == "medium")
+        latencies = [action.latency_ms for action in self.enforcement]
+        return MonitorSummary(
+            events=sum(event.count for event in events),
+            alerts_high=high,
+            alerts_medium=medium,
+            enforced=len(self.enforcement),
+            max_enforcement_latency_ms=round(max(latencies), 3) if latencies else None,
+        )
+
+
+# Shared libraries every process maps; read-only mappings from here are routine.
+SYSTEM_LIBRARY_PREFIXES = (
+    "/lib/",
+    "/lib64/",
+    "/usr/lib/",
+    "/usr/lib64/",
+    "/usr/local/lib/",
+    "/nix/store/",
+)
 
 SENSITIVE_PATH_MARKERS = {
     ".ssh",
@@ -55,63 +122,66 @@ def _timestamp() -> str:
     return datetime.now(tz=timezone.utc).isoformat(timespec="seconds")
 
 
-def _is_proc_alive(pid: int) -> bool:
-    return Path(f"/proc/{pid}").exists()
-
-
-def _all_process_ids() -> list[int]:
-    proc_dir = Path("/proc")
-    pids: list[int] = []
-    for child in proc_dir.iterdir():
-        if child.name.isdigit():
-            pids.append(int(child.name))
-    return pids
-
-
-def _read_ppid(pid: int) -> int | None:
-    stat_path = Path(f"/proc/{pid}/stat")
-    try:
-        data = stat_path.read_text(encoding="utf-8")
-    except OSError:
+def _parse_ppid(stat: str | None) -> int | None:
+    if not stat:
         return None
-    fields = data.split()
-    if len(fields) < 4:
+    # The command name is parenthesised and may contain spaces; fields resume after ")".
+    fields = stat[stat.rfind(")") + 1 :].split()
+    if len(fields) < 2:
         return None
     try:
-        return int(fields[3])
+        return int(fields[1])
     except ValueError:
         return None
 
 
-def _collect_descendants(root_pid: int) -> set[int]:
-    pids = _all_process_ids()
-    parent_map: dict[int, int] = {}
-    for pid in pids:
-        ppid = _read_ppid(pid)
+def _collect_descendants(backend: ProcBackend, root_pid: int) -> set[int]:
+    children: dict[int, list[int]] = {}
+    for pid in backend.pids():
+        ppid = _parse_ppid(backend.stat(pid))
         if ppid is not None:
-            parent_map[pid] = ppid
+            children.setdefault(ppid, []).append(pid)
 
     descendants = {root_pid}
-    changed = True
-    while changed:
-        changed = False
-        for pid, ppid in parent_map.items():
-            if ppid in descendants and pid not in descendants:
-                descendants.add(pid)
-                changed = True
+    queue = deque([root_pid])
+    while queue:
+        for child in children.get(queue.popleft(), ()):
+            if child not in descendants:
+                descendants.add(child)
+                queue.append(child)
     return descendants
 
 
-def _cmdline_for_pid(pid: int) -> str:
-    cmdline = Path(f"/proc/{pid}/cmdline")
-    try:
-        raw = cmdline.read_bytes()
-    except OSError:
+def _cmdline_for_pid(backend: ProcBackend, pid: int) -> str:
+    raw = backend.cmdline(pid)
+    if raw is None:
         return f"pid:{pid}"
     parts = [part.decode("utf-8", errors="replace") for part in raw.split(b"\x00") if part]
     return " ".join(parts) if parts else f"pid:{pid}"
 
 
+def _parse_maps(raw: bytes) -> set[tuple[str, bool, bool]]:
+    """File-backed regions in /proc/<pid>/maps as (path, is_write, is_exec).
+
+    Only shared writable mappings count as writes; private writable ones are copy-on-write.
+    A file is executable when any of its segments is mapped with execute permission.
+    """
+    regions: dict[tuple[str, bool], bool] = {}
+    for line in raw.decode("utf-8", errors="replace").splitlines():
+        parts = line.split(maxsplit=5)
+        if len(parts) < 6 or parts[4] == "0":
+            continue
+        path = parts[5]
+        if not path.startswith("/"):
+            continue
+        if path.endswith(" (deleted)"):
+            path = path[: -len(" (deleted)")]
+        perms = parts[1]
+        key = (path, len(perms) >= 4 and perms[1] == "w" and perms[3] == "s")
+        regions[key] = regions.get(key, False) or (len(perms) >= 3 and perms[2] == "x")
+    return {(path, is_write, is_exec) for (path, is_write), is_exec in regions.items()}
+
+
 def _severity_for_exec(command: str) -> str:
     lower = command.lower()
     if any(token in lower for token in ("sudo ", "curl ", "wget ", "nc ", "ssh ")):
@@ -155,17 +225,13 @@ def _decode_ipv4(raw: str) -> str:
     return ".".join(octets)
 
 
-def _load_socket_index() -> dict[str, str]:
+def _load_socket_index(backend: ProcBackend) -> dict[str, str]:
     index: dict[str, str] = {}
-    for proc_file, proto in (("/proc/net/tcp", "tcp"), ("/proc/net/udp", "udp")):
-        path = Path(proc_file)
-        if not path.exists():
-            continue
-        try:
-            lines = path.read_text(encoding="utf-8").splitlines()
-        except OSError:
+    for proto in ("tcp", "udp"):
+        table = backend.net_table(proto)
+        if table is None:
             continue
-        for line in lines[1:]:
+        for line in table.splitlines()[1:]:
             parts = line.split()
             if len(parts) < 10:
                 continue
@@ -179,71 +245,106 @@ def _load_socket_index() -> dict[str, str]:
     return index
 
 
+def _is_write_fd(info: str) -> bool:
+    for line in info.splitlines():
+        if line.startswith("flags:"):
+            _, value = line.split(":", 1)
+            flags = _parse_flags(value)
+            return flags is not None and (flags & 0o3) in {1, 2}
+    return False
+
+
 class ProcessMonitor:
-    def __init__(self, pid: int, project_root: Path | None = None) -> None:
+    def __init__(
+        self,
+        pid: int,
+        project_root: Path | None = None,
+        backend: ProcBackend | None = None,
+        sinks: Iterable[EventSink | SinkDispatcher] = (),
+        maps: bool = True,
+        enforce: Iterable[EnforcementRule] = (),
+        enforce_tree: bool = False,
+        coalescer: EventCoalescer | None = None,
+    ) -> None:
         self.pid = pid
+        self.track_maps = maps
         self.project_root = project_root.resolve() if project_root else None
-        self.session = SessionMonitor()
+        self.backend: ProcBackend = backend or RealProcFS()
+        self.session = SessionMonitor(sinks)
+        rules = list(enforce)
+        # Tree-wide signals are only allowed when this session started the process (--exec).
+        self.enforcer = Enforcer(rules, self.backend, allow_tree=enforce_tree) if rules else None
+        # Sits between poll() and the session: enforcement still sees every raw event.
+        self.coalescer = coalescer
         self._seen_exec_pids: set[int] = {pid}
         self._seen_files: set[tuple[int, str, bool]] = set()
         self._seen_socket_inodes: set[str] = set()
+        # Last (length, crc32) of each process's maps; unchanged maps are not re-parsed.
+        self._maps_signatures: dict[int, tuple[int, int]] = {}
+        self.maps_parsed = 0
 
-    def _iter_fd_paths(self, pid: int) -> list[Path]:
-        fd_dir = Path(f"/proc/{pid}/fd")
-        if not fd_dir.exists():
-            return []
-        try:
-            return list(fd_dir.iterdir())
-        except (OSError, PermissionError):
-            return []
+    def _iter_fd_paths(self, pid: int) -> list[tuple[str, str]]:
+        return self.backend.fds(pid)
 
-    def _file_events_for_pid(self, pid: int) -> list[MonitorEvent]:
+    def _file_events_for_pid(self, pid: int, fds: list[tuple[str, str]]) -> list[MonitorEvent]:
         events: list[MonitorEvent] = []
-        for fd_path in self._iter_fd_paths(pid):
-            try:
-                target = fd_path.readlink()
-            except OSError:
+        for fd, target in fds:
+            if not target.startswith("/"):
                 continue
-            target_str = str(target)
-            if not target_str.startswith("/"):
-                continue
-
-            fdinfo = Path(f"/proc/{pid}/fdinfo/{fd_path.name}")
-            is_write = False
-            try:
-                info = fdinfo.read_text(encoding="utf-8")
-            except OSError:
-                info = ""
-            for line in info.splitlines():
-                if line.startswith("flags:"):
-                    _, value = line.split(":", 1)
-                    flags = _parse_flags(value)
-                    if flags is not None and (flags & 0o3) in {1, 2}:
-                        is_write = True
-                    break
-
-            entry = (pid, target_str, is_write)
+            is_write = _is_write_fd(self.backend.fdinfo(pid, fd))
+            entry = (pid, target, is_write)
             if entry in self._seen_files:
                 continue
             self._seen_files.add(entry)
 
             event = MonitorEvent(
                 kind="WRITE" if is_write else "READ",
-                target=target_str,
-                severity=_severity_for_file(target_str, is_write, self.project_root),
+                target=target,
+                severity=_severity_for_file(target, is_write, self.project_root),
                 timestamp=_timestamp(),
+                pid=pid,
             )
             events.append(event)
         return events
 
-    def _socket_events_for_pid(self, pid: int, socket_index: dict[str, str]) -> list[MonitorEvent]:
+    def _map_events_for_pid(self, pid: int) -> list[MonitorEvent]:
+        raw = self.backend.maps(pid)
+        if raw is None:
+            return []
+        signature = (len(raw), zlib.crc32(raw))
+        if self._maps_signatures.get(pid) == signature:
+            return []
+        self._maps_signatures[pid] = signature
+        self.maps_parsed += 1
+
         events: list[MonitorEvent] = []
-        for fd_path in self._iter_fd_paths(pid):
-            try:
-                link = fd_path.readlink()
-            except OSError:
+        for path, is_write, is_exec in sorted(_parse_maps(raw)):
+            entry = (pid, path, is_write)
+            if entry in self._seen_files:
                 continue
-            value = str(link)
+            self._seen_files.add(entry)
+            # Read-only code mappings are the program and its libraries wherever they are
+            # installed; data files mapped from outside the project keep their file severity.
+            if not is_write and (is_exec or path.startswith(SYSTEM_LIBRARY_PREFIXES)):
+                severity = "low"
+            else:
+                severity = _severity_for_file(path, is_write, self.project_root)
+            events.append(
+                MonitorEvent(
+                    kind="WRITE" if is_write else "READ",
+                    target=path,
+                    severity=severity,
+                    timestamp=_timestamp(),
+                    pid=pid,
+                )
+            )
+        return events
+
+    def _socket_events_for_pid(
+        self, pid: int, fds: list[tuple[str, str]], socket_index: dict[str, str]
+    ) -> list[MonitorEvent]:
+        events: list[MonitorEvent] = []
+        for _, value in fds:
             if not value.startswith("socket:[") or not value.endswith("]"):
                 continue
             inode = value[len("socket:[") : -1]
@@ -254,7 +355,9 @@ class ProcessMonitor:
             severity = "medium"
             if "127.0.0.1" in endpoint or "0.0.0.0" in endpoint:
                 severity = "low"
-            event = MonitorEvent(kind="NETWORK", target=endpoint, severity=severity, timestamp=_timestamp())
+            event = MonitorEvent(
+                kind="NETWORK", target=endpoint, severity=severity, timestamp=_timestamp(), pid=pid
+            )
             events.append(event)
         return events
 
@@ -264,31 +367,57 @@ class ProcessMonitor:
             if pid in self._seen_exec_pids:
                 continue
             self._seen_exec_pids.add(pid)
-            command = _cmdline_for_pid(pid)
+            command = _cmdline_for_pid(self.backend, pid)
             events.append(
                 MonitorEvent(
                     kind="EXEC",
                     target=command,
                     severity=_severity_for_exec(command),
                     timestamp=_timestamp(),
+                    pid=pid,
                 )
             )
         return events
 
     def poll(self) -> list[MonitorEvent]:
-        if not _is_proc_alive(self.pid):
+        if not self.backend.exists(self.pid):
             return []
-        descendants = _collect_descendants(self.pid)
-        socket_index = _load_socket_index()
+        descendants = _collect_descendants(self.backend, self.pid)
+        socket_index = _load_socket_index(self.backend)
         events: list[MonitorEvent] = []
-        events.extend(self._exec_events(descendants))
+        self._enforce(events, self._exec_events(descendants), descendants)
         for pid in descendants:
-            events.extend(self._file_events_for_pid(pid))
-            events.extend(self._socket_events_for_pid(pid, socket_index))
-        for event in events:
-            self.session.record(event)
+            fds = self._iter_fd_paths(pid)
+            self._enforce(events, self._file_events_for_pid(pid, fds), descendants)
+            self._enforce(events, self._socket_events_for_pid(pid, fds, socket_index), descendants)
+            if self.track_maps:
+                self._enforce(events, self._map_events_for_pid(pid), descendants)
+        if self.track_maps and len(self._maps_signatures) > len(descendants):
+            for pid in self._maps_signatures.keys() - descendants:
+                del self._maps_signatures[pid]
+        if self.coalescer is not None:
+            events = self.coalescer.add(events)
+        self.session.record_many(events)
+        return events
+
+    def flush(self) -> list[MonitorEvent]:
+        """Record and return events still held by the coalescer."""
+        if self.coalescer is None:
+            return []
+        events = self.coalescer.flush()
+        self.session.record_many(events)
         return events
 
+    def _enforce(
+        self, events: list[MonitorEvent], new: list[MonitorEvent], descendants: set[int]
+    ) -> None:
+        # Enforcement runs as each process's events are collected rather than once per poll,
+        # so the reaction does not wait for the rest of the tree to be read.
+        events.extend(new)
+        if self.enforcer is not None and new:
+            for action in self.enforcer.apply(new, self.pid, descendants):
+                self.session.record_enforcement(action)
+
     def run(
         self,
         duration_seconds: float,
@@ -297,8 +426,9 @@ class ProcessMonitor:
         deadline = datetime.now(tz=timezone.utc).timestamp() + duration_seconds
         collected: list[MonitorEvent] = []
         while datetime.now(tz=timezone.utc).timestamp() < deadline:
-            if not _is_proc_alive(self.pid):
+            if not self.backend.exists(self.pid):
                 break
             collected.extend(self.poll())
             sleep(interval_seconds)
+        collected.extend(self.flush())
         return collected
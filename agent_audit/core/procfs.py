@@ -0,0 +1,282 @@
+from __future__ import annotations
+
+import os
+import signal
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Protocol
+
+# Every /proc access made by the monitor goes through a ProcBackend. Backends return raw
+# procfs content (stat lines, cmdline bytes, net tables) so parsing is shared and the
+# synthetic backend exercises the same code paths as a live system.
+
+
+class ProcBackend(Protocol):
+    def pids(self) -> list[int]:
+        """Return all visible process ids."""
+
+    def exists(self, pid: int) -> bool:
+        """Return True if the process is visible."""
+
+    def stat(self, pid: int) -> str | None:
+        """Return the content of /proc/<pid>/stat."""
+
+    def cmdline(self, pid: int) -> bytes | None:
+        """Return the NUL-separated content of /proc/<pid>/cmdline."""
+
+    def fds(self, pid: int) -> list[tuple[str, str]]:
+        """Return (fd, link target) pairs from /proc/<pid>/fd."""
+
+    def fdinfo(self, pid: int, fd: str) -> str:
+        """Return the content of /proc/<pid>/fdinfo/<fd>."""
+
+    def net_table(self, proto: str) -> str | None:
+        """Return the content of /proc/net/<proto> (tcp, udp)."""
+
+    def maps(self, pid: int) -> bytes | None:
+        """Return the content of /proc/<pid>/maps."""
+
+    def send_signal(self, pid: int, signum: int) -> bool:
+        """Deliver a signal; return False if the process is gone or not ours."""
+
+
+class RealProcFS:
+    def __init__(self, root: Path = Path("/proc")) -> None:
+        self.root = root
+
+    def pids(self) -> list[int]:
+        try:
+            return [int(child.name) for child in self.root.iterdir() if child.name.isdigit()]
+        except OSError:
+            return []
+
+    def exists(self, pid: int) -> bool:
+        return (self.root / str(pid)).exists()
+
+    def stat(self, pid: int) -> str | None:
+        try:
+            return (self.root / str(pid) / "stat").read_text(encoding="utf-8")
+        except OSError:
+            return None
+
+    def cmdline(self, pid: int) -> bytes | None:
+        try:
+            return (self.root / str(pid) / "cmdline").read_bytes()
+        except OSError:
+            return None
+
+    def fds(self, pid: int) -> list[tuple[str, str]]:
+        fd_dir = self.root / str(pid) / "fd"
+        try:
+            entries = list(fd_dir.iterdir())
+        except (OSError, PermissionError):
+            return []
+        links: list[tuple[str, str]] = []
+        for entry in entries:
+            try:
+                links.append((entry.name, os.readlink(entry)))
+            except OSError:
+                continue
+        return links
+
+    def fdinfo(self, pid: int, fd: str) -> str:
+        try:
+            return (self.root / str(pid) / "fdinfo" / fd).read_text(encoding="utf-8")
+        except OSError:
+            return ""
+
+    def net_table(self, proto: str) -> str | None:
+        try:
+            return (self.root / "net" / proto).read_text(encoding="utf-8")
+        except OSError:
+            return None
+
+    def maps(self, pid: int) -> bytes | None:
+        try:
+            return (self.root / str(pid) / "maps").read_bytes()
+        except OSError:
+            return None
+
+    def send_signal(self, pid: int, signum: int) -> bool:
+        try:
+            os.kill(pid, signum)
+        except (ProcessLookupError, PermissionError):
+            return False
+        return True
+
+
+_NET_HEADER = (
+    "  sl  local_address rem_address   st tx_queue rx_queue tr tm->when retrnsmt"
+    "   uid  timeout inode"
+)
+
+
+@dataclass(slots=True)
+class SyntheticProcess:
+    pid: int
+    ppid: int
+    cmdline: list[str]
+    fds: dict[str, str] = field(default_factory=dict)
+    fd_flags: dict[str, int] = field(default_factory=dict)
+    # (path, perms) per mapped region, e.g. ("/usr/lib/libc.so.6", "r-xp").
+    mappings: list[tuple[str, str]] = field(default_factory=list)
+
+
+class SyntheticProcFS:
+    """Scriptable in-memory procfs for deterministic monitor tests and scaling benchmarks.
+
+    Mutate state directly (`spawn`, `open`, `connect`, ...) or schedule mutations with
+    `at(tick, action)` and call `advance()` between `ProcessMonitor.poll()` calls.
+    """
+
+    def __init__(self) -> None:
+        self.processes: dict[int, SyntheticProcess] = {}
+        self.sockets: dict[str, tuple[str, str]] = {}
+        self.tick = 0
+        self._script: dict[int, list[Callable[[SyntheticProcFS], None]]] = {}
+        self._next_inode = 10_000
+        self.signals: list[tuple[int, int]] = []
+        self.stopped: set[int] = set()
+
+    # Scripting
+
+    def at(self, tick: int, action: Callable[[SyntheticProcFS], None]) -> None:
+        self._script.setdefault(tick, []).append(action)
+
+    def advance(self, ticks: int = 1) -> None:
+        for _ in range(ticks):
+            self.tick += 1
+            for action in self._script.pop(self.tick, []):
+                action(self)
+
+    def spawn(self, pid: int, ppid: int, cmdline: str) -> SyntheticProcess:
+        process = SyntheticProcess(pid=pid, ppid=ppid, cmdline=cmdline.split())
+        self.processes[pid] = process
+        return process
+
+    def exit(self, pid: int) -> None:
+        self.processes.pop(pid, None)
+
+    def open(self, pid: int, fd: int, target: str, write: bool = False) -> None:
+        process = self.processes[pid]
+        process.fds[str(fd)] = target
+        process.fd_flags[str(fd)] = os.O_RDWR if write else os.O_RDONLY
+
+    def close(self, pid: int, fd: int) -> None:
+        process = self.processes[pid]
+        process.fds.pop(str(fd), None)
+        process.fd_flags.pop(str(fd), None)
+
+    def mmap(self, pid: int, path: str, perms: str = "r--p") -> None:
+        self.processes[pid].mappings.append((path, perms))
+
+    def munmap(self, pid: int, path: str) -> None:
+        process = self.processes[pid]
+        process.mappings = [mapping for mapping in process.mappings if mapping[0] != path]
+
+    def connect(self, pid: int, fd: int, remote: str, proto: str = "tcp") -> str:
+        """Open a socket fd connected to `remote` ("ip:port"); returns its inode."""
+        inode = str(self._next_inode)
+        self._next_inode += 1
+        self.sockets[inode] = (proto, remote)
+        self.processes[pid].fds[str(fd)] = f"socket:[{inode}]"
+        return inode
+
+    @classmethod
+    def tree(
+        cls,
+        processes: int,
+        root_pid: int = 1000,
+        fanout: int = 8,
+        files_per_process: int = 4,
+        sockets_per_process: int = 1,
+        maps_per_process: int = 0,
+    ) -> SyntheticProcFS:
+        """A process tree of `processes` pids under `root_pid` with open files and sockets."""
+        backend = cls()
+        backend.spawn(root_pid, 1, "agent --serve")
+        for index in range(1, processes):
+            pid = root_pid + index
+            parent = root_pid + (index - 1) // fanout
+            backend.spawn(pid, parent, f"node worker.js --id {index}")
+        for pid in list(backend.processes):
+            for fd in range(files_per_process):
+                backend.open(
+                    pid, 10 + fd, f"/work/project/src/module{pid % 97}_{fd}.js", write=fd == 0
+                )
+            for fd in range(sockets_per_process):
+                backend.connect(pid, 100 + fd, f"93.184.216.{pid % 250}:443")
+            for index in range(maps_per_process):
+                backend.mmap(pid, f"/usr/lib/x86_64-linux-gnu/lib{index}.so", "r-xp")
+        return backend
+
+    # ProcBackend
+
+    def pids(self) -> list[int]:
+        return list(self.processes)
+
+    def exists(self, pid: int) -> bool:
+        return pid in self.processes
+
+    def stat(self, pid: int) -> str | None:
+        process = self.processes.get(pid)
+        if process is None:
+            return None
+        name = process.cmdline[0] if process.cmdline else "?"
+        return f"{pid} ({name}) S {process.ppid} {pid} {pid} 0 -1 4194304 0 0 0 0\n"
+
+    def cmdline(self, pid: int) -> bytes | None:
+        process = self.processes.get(pid)
+        if process is None:
+            return None
+        return b"".join(part.encode("utf-8") + b"\x00" for part in process.cmdline)
+
+    def fds(self, pid: int) -> list[tuple[str, str]]:
+        process = self.processes.get(pid)
+        return list(process.fds.items()) if process else []
+
+    def fdinfo(self, pid: int, fd: str) -> str:
+        process = self.processes.get(pid)
+        if process is None or fd not in process.fd_flags:
+            return ""
+        return f"pos:\t0\nflags:\t{process.fd_flags[fd]:07o}\nmnt_id:\t25\n"
+
+    def maps(self, pid: int) -> bytes | None:
+        process = self.processes.get(pid)
+        if process is None:
+            return None
+        lines = []
+        for index, (path, perms) in enumerate(process.mappings):
+            start = 0x7F0000000000 + index * 0x10000
+            lines.append(
+                f"{start:x}-{start + 0x10000:x} {perms} 00000000 08:01 {1000 + index}  {path}\n"
+            )
+        lines.append("7ffd00000000-7ffd00021000 rw-p 00000000 00:00 0  [stack]\n")
+        return "".join(lines).encode("utf-8")
+
+    def send_signal(self, pid: int, signum: int) -> bool:
+        if pid not in self.processes:
+            return False
+        self.signals.append((pid, signum))
+        if signum in (signal.SIGKILL, signal.SIGTERM):
+            self.exit(pid)
+            self.stopped.discard(pid)
+        elif signum == signal.SIGSTOP:
+            self.stopped.add(pid)
+        elif signum == signal.SIGCONT:
+            self.stopped.discard(pid)
+        return True
+
+    def net_table(self, proto: str) -> str | None:
+        lines = [_NET_HEADER]
+        for slot, (inode, (socket_proto, remote)) in enumerate(self.sockets.items()):
+            if socket_proto != proto:
+                continue
+            host, port = remote.rsplit(":", 1)
+            encoded = "".join(f"{int(octet):02X}" for octet in reversed(host.split(".")))
+            lines.append(
+                f"{slot:4d}: 0100007F:9C40 {encoded}:{int(port):04X} 01 00000000:00000000 "
+                f"00:00000000 00000000  1000        0 {inode} 1 0000000000000000 20 4 30 10 -1"
+            )
+        return "\n".join(lines) + "\n"
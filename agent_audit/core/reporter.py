@@ -1,21 +1,33 @@
 from __future__ import annotations
 
-from io import StringIO
 import json
-from typing import Literal
+from io import StringIO
+from typing import TYPE_CHECKING, Any, Literal
 
 from agent_audit.types import ScanResult
 
-try:
-    from rich.console import Console
-    from rich.table import Table
+if TYPE_CHECKING:
+    from agent_audit.core.baseline import BaselineDiff
+    from agent_audit.core.compare import Comparison
+    from agent_audit.core.githistory import GitHistoryScan
+    from agent_audit.core.history import CheckChange, TrendPoint
+    from agent_audit.utils.profiling import ScanProfile
+
 
-    HAS_RICH = True
-except ImportError:  # pragma: no cover - fallback for minimal envs
-    HAS_RICH = False
+def _has_rich() -> bool:
+    # rich is only needed for table output, so it is imported on first use rather
+    # than at module import time.
+    try:
+        import rich  # noqa: F401
+    except ImportError:  # pragma: no cover - fallback for minimal envs
+        return False
+    return True
 
 
 def _table_with_rich(result: ScanResult) -> str:
+    from rich.console import Console
+    from rich.table import Table
+
     buffer = StringIO()
     console = Console(file=buffer, force_terminal=False, color_system=None)
     console.print(f"agent-audit scan :: {result.agent_name} ({result.adapter_name})")
@@ -66,6 +78,28 @@ def to_markdown(result: ScanResult) -> str:
     return "\n".join(lines)
 
 
+def render_many(
+    results: list[ScanResult],
+    output_format: str = "table",
+    fields: list[str] | None = None,
+) -> str:
+    """Render one or more results; a single json result stays a bare object."""
+    if output_format in {"ndjson", "sarif"}:
+        from agent_audit.core.streaming import open_writer
+
+        buffer = StringIO()
+        with open_writer(output_format, buffer, fields) as writer:
+            writer.write_all(results)
+        return buffer.getvalue().rstrip("\n")
+    if output_format == "json":
+        from agent_audit.core.streaming import Projection
+
+        projection = Projection(fields)
+        payloads = [projection.apply(result.to_dict()) for result in results]
+        return json.dumps(payloads[0] if len(payloads) == 1 else payloads, indent=2)
+    return "\n\n".join(render(result, output_format=output_format) for result in results)
+
+
 def render(
     result: ScanResult,
     output_format: Literal["table", "json", "markdown"] = "table",
@@ -74,6 +108,194 @@ def render(
         return json.dumps(result.to_dict(), indent=2)
     if output_format == "markdown":
         return to_markdown(result)
-    if HAS_RICH:
+    if _has_rich():
         return _table_with_rich(result)
     return _table_plain(result)
+
+
+def _comparison_rows(comparison: Comparison) -> tuple[list[str], list[list[str]]]:
+    results = comparison.results
+    header = ["Metric", *[f"Agent {index}" for index in range(1, len(results) + 1)]]
+    rows = [
+        ["Name", *[result.agent_name for result in results]],
+        ["Path", *comparison.paths],
+        ["Risk score", *[f"{result.risk_score:.1f} ({result.risk_tier})" for result in results]],
+    ]
+    for key, title in comparison.check_rows():
+        rows.append(
+            [
+                title,
+                *[
+                    result.checks[key].severity.upper() if key in result.checks else "-"
+                    for result in results
+                ],
+            ]
+        )
+    return header, rows
+
+
+def _rows_markdown(header: list[str], rows: list[list[str]]) -> str:
+    lines = [
+        f"| {' | '.join(header)} |",
+        "|---|" + "---:|" * (len(header) - 1),
+    ]
+    lines.extend(f"| {' | '.join(row)} |" for row in rows)
+    return "\n".join(lines)
+
+
+def _rows_table_with_rich(header: list[str], rows: list[list[str]]) -> str:
+    from rich.console import Console
+    from rich.table import Table
+
+    buffer = StringIO()
+    console = Console(file=buffer, force_terminal=False, color_system=None, width=200)
+    table = Table(show_header=True, header_style="bold")
+    for column in header:
+        table.add_column(column)
+    for row in rows:
+        table.add_row(*row)
+    console.print(table)
+    return buffer.getvalue().rstrip()
+
+
+def _render_rows(
+    header: list[str],
+    rows: list[list[str]],
+    output_format: Literal["table", "json", "markdown"],
+    payload: Any,
+) -> str:
+    if output_format == "json":
+        return json.dumps(payload, indent=2)
+    if output_format == "markdown" or not _has_rich():
+        return _rows_markdown(header, rows)
+    return _rows_table_with_rich(header, rows)
+
+
+def render_comparison(
+    comparison: Comparison,
+    output_format: Literal["table", "json", "markdown"] = "table",
+) -> str:
+    header, rows = _comparison_rows(comparison)
+    return _render_rows(header, rows, output_format, comparison.to_dict())
+
+
+def render_trend(
+    points: list[TrendPoint],
+    output_format: Literal["table", "json", "markdown"] = "table",
+) -> str:
+    header = ["Period", "Agent", "Adapter", "Scans", "Avg score", "Max score", "Tier"]
+    rows = [
+        [
+            point.period,
+            point.agent_root,
+            point.adapter,
+            str(point.scans),
+            f"{point.risk_score:.1f}",
+            f"{point.max_risk_score:.1f}",
+            point.risk_tier,
+        ]
+        for point in points
+    ]
+    return _render_rows(
+        header, rows, output_format, {"trend": [point.to_dict() for point in points]}
+    )
+
+
+def render_changes(
+    changes: list[CheckChange],
+    output_format: Literal["table", "json", "markdown"] = "table",
+) -> str:
+    header = ["Changed at", "Agent", "Check", "Severity", "Summary"]
+    rows = [
+        [
+            change.changed_at,
+            change.agent_root,
+            change.check_key,
+            f"{change.previous_severity.upper()} -> {change.severity.upper()}",
+            change.summary if change.summary == change.previous_summary
+            else f"{change.previous_summary} -> {change.summary}",
+        ]
+        for change in changes
+    ]
+    return _render_rows(
+        header, rows, output_format, {"changes": [change.to_dict() for change in changes]}
+    )
+
+
+def render_git_history(
+    report: GitHistoryScan,
+    output_format: Literal["table", "json", "markdown"] = "table",
+) -> str:
+    header = ["Commit", "Committed at", "Agent", "Score", "Tier", "Changed checks"]
+    rows: list[list[str]] = []
+    previous: dict[str, dict[str, str]] = {}
+    for scan in report.scans:
+        severities = (
+            {key: check.severity for key, check in scan.result.checks.items()}
+            if scan.result
+            else {}
+        )
+        before = previous.get(scan.agent_root, {})
+        changed = [
+            f"{key}: {before.get(key, '-').upper()} -> {severity.upper()}"
+            for key, severity in severities.items()
+            if before.get(key) != severity
+        ]
+        previous[scan.agent_root] = severities
+        rows.append(
+            [
+                scan.commit[:12],
+                scan.committed_at,
+                scan.agent_root,
+                f"{scan.result.risk_score:.1f}" if scan.result else "-",
+                scan.result.risk_tier if scan.result else "no agent config",
+                ", ".join(changed),
+            ]
+        )
+    return _render_rows(header, rows, output_format, report.to_dict())
+
+
+def render_baseline_diff(
+    diff: BaselineDiff,
+    output_format: Literal["table", "json", "markdown"] = "table",
+) -> str:
+    header = ["Status", "Agent", "Check", "Severity", "Finding"]
+    rows = [
+        [
+            finding.status,
+            finding.agent,
+            finding.check_key,
+            finding.severity.upper()
+            if finding.previous_severity is None
+            else f"{finding.previous_severity.upper()} -> {finding.severity.upper()}",
+            finding.detail,
+        ]
+        for finding in diff.findings
+    ]
+    rendered = _render_rows(header, rows, output_format, diff.to_dict())
+    if output_format == "json":
+        return rendered
+    summary = (
+        f"Score delta: {diff.score_delta:+.1f} "
+        f"({len(diff.added)} added, {len(diff.removed)} removed, {len(diff.changed)} changed)"
+    )
+    return f"{summary}\n\n{rendered}" if rows else summary
+
+
+def render_profile(
+    profile: ScanProfile,
+    output_format: Literal["table", "json", "markdown"] = "table",
+) -> str:
+    header = ["Stage", "Calls", "Wall ms", "CPU ms"]
+    rows = [
+        [name, str(timing.calls), f"{timing.wall_s * 1000:.2f}", f"{timing.cpu_s * 1000:.2f}"]
+        for name, timing in sorted(profile.stages.items(), key=lambda item: -item[1].wall_s)
+    ]
+    rendered = _render_rows(header, rows, output_format, profile.to_dict())
+    if output_format == "json":
+        return rendered
+    counts = (
+        f"Files stat'ed: {profile.files_stat}, read: {profile.files_read} "
+        f"({profile.bytes_read} bytes)"
+    )
+    return f"{rendered}\n\n{counts}"
@@ -22,11 +22,20 @@ def calculate_risk_score(checks: dict[str, CheckResult]) -> float:
     return round(total, 1)
 
 
+# Lower bound of each tier above LOW, ascending.
+TIER_THRESHOLDS = (
+    (3.0, "MEDIUM"),
+    (6.0, "HIGH"),
+    (9.0, "CRITICAL"),
+)
+
+TIERS = ("LOW", *(name for _, name in TIER_THRESHOLDS))
+
+
 def risk_tier(score: float) -> str:
-    if score >= 9.0:
-        return "CRITICAL"
-    if score >= 6.0:
-        return "HIGH"
-    if score >= 3.0:
-        return "MEDIUM"
-    return "LOW"
+    tier = "LOW"
+    for threshold, name in TIER_THRESHOLDS:
+        if score < threshold:
+            break
+        tier = name
+    return tier
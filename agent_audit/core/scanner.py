@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from agent_audit.adapters import detect_adapter
 from agent_audit.checks import (
@@ -10,31 +11,89 @@ from agent_audit.checks import (
     evaluate_shell,
     evaluate_skills,
 )
+from agent_audit.core.cache import ContentCache
 from agent_audit.core.risk import calculate_risk_score, risk_tier
-from agent_audit.types import ScanResult
+from agent_audit.types import CheckResult, ScanResult
+from agent_audit.utils.netclass import load_network_classifier
+from agent_audit.utils.paths import PathResolver
+from agent_audit.utils.profiling import stage
+
+if TYPE_CHECKING:
+    from agent_audit.checks.skill_content import ContentFinding
+    from agent_audit.types import Skill
+    from agent_audit.utils.vfs import VirtualPath
 
 
 class Scanner:
+    def __init__(
+        self,
+        network_rules: str | Path | None = None,
+        skill_cache: ContentCache | None = None,
+    ) -> None:
+        self.network_classifier = load_network_classifier(
+            str(network_rules) if network_rules else None
+        )
+        # Skill content analyses are keyed by content hash, so fleets sharing popular skills
+        # analyze each unique skill once per scanner; pass `ContentCache.default("skills")` to
+        # share them across processes through the on-disk cache.
+        self.skill_cache = skill_cache if skill_cache is not None else ContentCache(None, "skills")
+
     def scan_path(self, path: str | Path) -> ScanResult:
         target = Path(path).expanduser().resolve()
-        adapter = detect_adapter(target)
+        if target.is_dir() and not (target / "oci-layout").is_file():
+            # A plain agent directory; archives, image layouts (vfs.OCI_LAYOUT_FILE) and paths
+            # into them need the virtual filesystem, which is loaded only for them.
+            return self._scan(target, PathResolver())
+        from agent_audit.utils.vfs import open_archive, split_archive_path
+
+        archive = split_archive_path(target)
+        if archive is None:
+            return self._scan(target, PathResolver())
+        # Archives and image layouts are read in place; paths inside them are not host paths,
+        # so allowed paths are normalized lexically instead of resolved against the host.
+        source, member = archive
+        with stage("archive.open"):
+            fs = open_archive(source)
+        with fs:
+            return self.scan_virtual(fs.path(member))
 
-        config = adapter.get_config(target)
-        skills = adapter.get_skills(target)
-        endpoints = adapter.get_endpoints(target)
-        if endpoints:
+    def scan_virtual(self, target: VirtualPath) -> ScanResult:
+        """Scan an agent root inside a `VirtualFS` (an archive, image or git tree)."""
+        return self._scan(target, PathResolver(resolve_symlinks=False))
+
+    def _scan(self, target: Path | VirtualPath, resolver: PathResolver) -> ScanResult:
+        with stage("detect"):
+            adapter = detect_adapter(target)
+
+        with stage("adapter.get_config"):
+            config = adapter.get_config(target)
+        with stage("adapter.get_skills"):
+            skills = adapter.get_skills(target)
+        with stage("adapter.get_endpoints"):
+            endpoints = adapter.get_endpoints(target)
+        if endpoints and endpoints != config.endpoints:
+            # The adapter reported endpoints of its own; the tagged sources no longer match.
             config.endpoints = endpoints
+            config.endpoint_sources = []
 
-        checks = {
-            "filesystem": evaluate_filesystem(config),
-            "network": evaluate_network(config.endpoints),
-            "shell": evaluate_shell(config),
-            "secrets": evaluate_secrets(config),
-            "skills": evaluate_skills(skills),
-        }
+        checks: dict[str, CheckResult] = {}
+        with stage("check.filesystem"):
+            checks["filesystem"] = evaluate_filesystem(config, resolver)
+        with stage("check.network"):
+            checks["network"] = evaluate_network(
+                config.endpoint_sources or config.endpoints, self.network_classifier
+            )
+        with stage("check.shell"):
+            checks["shell"] = evaluate_shell(config)
+        with stage("check.secrets"):
+            checks["secrets"] = evaluate_secrets(config)
+        with stage("check.skills"):
+            content = self._analyze_skill_content(skills, target) if skills else None
+            checks["skills"] = evaluate_skills(skills, content=content)
 
-        score = calculate_risk_score(checks)
-        tier = risk_tier(score)
+        with stage("scoring"):
+            score = calculate_risk_score(checks)
+            tier = risk_tier(score)
 
         return ScanResult(
             agent_name=config.agent_name,
@@ -45,3 +104,11 @@ class Scanner:
             risk_score=score,
             risk_tier=tier,
         )
+
+    def _analyze_skill_content(
+        self, skills: list[Skill], target: Path | VirtualPath
+    ) -> list[list[ContentFinding]]:
+        # The content rules are loaded only for agents that have skills.
+        from agent_audit.checks.skill_content import analyze_skills
+
+        return analyze_skills(skills, target, self.skill_cache)
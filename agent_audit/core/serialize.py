@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import json
+import mmap
+import struct
+from collections.abc import Iterable, Iterator
+from io import BytesIO
+from pathlib import Path
+from typing import BinaryIO
+
+from agent_audit.types import CheckResult, ScanResult
+
+# Compact binary encoding for archiving large numbers of scan results, and loading saved
+# results (archive, JSON or NDJSON) back into ScanResult objects.
+#
+# Stream layout: MAGIC, then one record per ScanResult until EOF. Strings go through a
+# stream-wide intern table (titles, summaries, adapters and tiers repeat across results):
+#   varint 0, varint len, utf-8  -> literal, appended to the table
+#   varint 1, varint len, utf-8  -> literal, table is full
+#   varint n >= 2                -> table[n - 2]
+# Floats are little-endian float64 so scores round-trip exactly. Version 2 follows each check's
+# details with their fingerprints; version 1 archives are still read (fingerprints recomputed).
+
+MAGIC = b"AAR\x02"
+MAGIC_V1 = b"AAR\x01"
+INTERN_LIMIT = 1 << 16
+
+_DOUBLE = struct.Struct("<d")
+
+
+class ArchiveWriter:
+    def __init__(self, stream: BinaryIO) -> None:
+        self.stream = stream
+        self.count = 0
+        self._strings: dict[str, int] = {}
+        stream.write(MAGIC)
+
+    def write(self, result: ScanResult) -> None:
+        out = bytearray()
+        string = self._string
+        string(out, result.agent_name)
+        string(out, result.agent_version)
+        string(out, result.adapter_name)
+        string(out, result.scanned_path)
+        string(out, result.generated_at)
+        out += _DOUBLE.pack(result.risk_score)
+        string(out, result.risk_tier)
+        _varint(out, len(result.checks))
+        for check in result.checks.values():
+            string(out, check.key)
+            string(out, check.title)
+            out += _DOUBLE.pack(check.score)
+            string(out, check.severity)
+            string(out, check.summary)
+            _varint(out, len(check.details))
+            for detail in check.details:
+                string(out, detail)
+            for fingerprint in result.fingerprints_for(check):
+                string(out, fingerprint)
+        self.stream.write(out)
+        self.count += 1
+
+    def write_all(self, results: Iterable[ScanResult]) -> int:
+        for result in results:
+            self.write(result)
+        return self.count
+
+    def _string(self, out: bytearray, value: str) -> None:
+        index = self._strings.get(value)
+        if index is not None:
+            _varint(out, index + 2)
+            return
+        encoded = value.encode("utf-8")
+        if len(self._strings) < INTERN_LIMIT:
+            self._strings[value] = len(self._strings)
+            _varint(out, 0)
+        else:
+            _varint(out, 1)
+        _varint(out, len(encoded))
+        out += encoded
+
+
+class _Reader:
+    def __init__(self, data: bytes | mmap.mmap) -> None:
+        self.data = data
+        self.pos = len(MAGIC)
+        self.fingerprints = data[: len(MAGIC)] == MAGIC
+        self.strings: list[str] = []
+
+    def varint(self) -> int:
+        data = self.data
+        shift = 0
+        value = 0
+        while True:
+            byte = data[self.pos]
+            self.pos += 1
+            value |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return value
+            shift += 7
+
+    def double(self) -> float:
+        (value,) = _DOUBLE.unpack_from(self.data, self.pos)
+        self.pos += 8
+        return value
+
+    def string(self) -> str:
+        token = self.varint()
+        if token >= 2:
+            return self.strings[token - 2]
+        length = self.varint()
+        if self.pos + length > len(self.data):
+            raise IndexError("string runs past end of archive")
+        value = self.data[self.pos : self.pos + length].decode("utf-8")
+        self.pos += length
+        if token == 0:
+            self.strings.append(value)
+        return value
+
+    def result(self) -> ScanResult:
+        string = self.string
+        agent_name = string()
+        agent_version = string()
+        adapter_name = string()
+        scanned_path = string()
+        generated_at = string()
+        risk_score = self.double()
+        tier = string()
+        checks: dict[str, CheckResult] = {}
+        for _ in range(self.varint()):
+            key = string()
+            title = string()
+            score = self.double()
+            severity = string()
+            summary = string()
+            details = [string() for _ in range(self.varint())]
+            fingerprints = [string() for _ in details] if self.fingerprints else []
+            checks[key] = CheckResult(key, title, score, severity, summary, details, fingerprints)
+        return ScanResult(
+            agent_name=agent_name,
+            agent_version=agent_version,
+            adapter_name=adapter_name,
+            scanned_path=scanned_path,
+            checks=checks,
+            risk_score=risk_score,
+            risk_tier=tier,
+            generated_at=generated_at,
+        )
+
+
+def _varint(out: bytearray, value: int) -> None:
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def iter_results(data: bytes | mmap.mmap) -> Iterator[ScanResult]:
+    if data[: len(MAGIC)] not in (MAGIC, MAGIC_V1):
+        raise ValueError("Not an agent-audit result archive (bad magic header)")
+    reader = _Reader(data)
+    try:
+        while reader.pos < len(data):
+            yield reader.result()
+    except (IndexError, struct.error, UnicodeDecodeError) as exc:
+        raise ValueError(f"Truncated or corrupt result archive at byte {reader.pos}") from exc
+
+
+def encode_results(results: Iterable[ScanResult]) -> bytes:
+    buffer = BytesIO()
+    ArchiveWriter(buffer).write_all(results)
+    return buffer.getvalue()
+
+
+def decode_results(data: bytes) -> list[ScanResult]:
+    return list(iter_results(data))
+
+
+def load_results(path: str | Path) -> list[ScanResult]:
+    """Load results saved as a binary archive, a JSON object/array or NDJSON."""
+    target = Path(path)
+    with target.open("rb") as handle:
+        if handle.read(len(MAGIC)) in (MAGIC, MAGIC_V1):
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return list(iter_results(mapped))
+    text = target.read_text(encoding="utf-8")
+    try:
+        payload = json.loads(text)
+    except ValueError:
+        payloads = [json.loads(line) for line in text.splitlines() if line.strip()]
+    else:
+        payloads = payload if isinstance(payload, list) else [payload]
+    return [ScanResult.from_dict(item) for item in payloads]
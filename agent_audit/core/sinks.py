@@ -0,0 +1,277 @@
+from __future__ import annotations
+
+import json
+import socket
+import sqlite3
+import threading
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from time import monotonic
+from typing import TYPE_CHECKING, Literal, Protocol
+
+if TYPE_CHECKING:
+    from agent_audit.core.monitor import MonitorEvent
+
+DropPolicy = Literal["drop_oldest", "drop_newest", "block"]
+DROP_POLICIES = ("drop_oldest", "drop_newest", "block")
+
+
+class EventSink(Protocol):
+    name: str
+
+    def write_batch(self, events: list[MonitorEvent]) -> int:
+        """Deliver a batch from the dispatcher thread; return how many events were written."""
+
+    def close(self) -> None:
+        """Flush and release resources."""
+
+
+class JsonlFileSink:
+    """Appends one JSON object per line, rotating to `<path>.1` ... `<path>.<backups>`."""
+
+    def __init__(self, path: Path, max_bytes: int = 10 * 1024 * 1024, backups: int = 3) -> None:
+        self.name = f"jsonl:{path}"
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._handle = self.path.open("a", encoding="utf-8")
+
+    def write_batch(self, events: list[MonitorEvent]) -> int:
+        self._handle.write("".join(json.dumps(event.to_dict()) + "\n" for event in events))
+        self._handle.flush()
+        if self._handle.tell() >= self.max_bytes:
+            self._rotate()
+        return len(events)
+
+    def _rotate(self) -> None:
+        self._handle.close()
+        if self.backups > 0:
+            for index in range(self.backups - 1, 0, -1):
+                source = self.path.with_name(f"{self.path.name}.{index}")
+                if source.exists():
+                    source.replace(self.path.with_name(f"{self.path.name}.{index + 1}"))
+            self.path.replace(self.path.with_name(f"{self.path.name}.1"))
+            self._handle = self.path.open("a", encoding="utf-8")
+        else:
+            self._handle = self.path.open("w", encoding="utf-8")
+
+    def close(self) -> None:
+        self._handle.close()
+
+
+class DatagramSink:
+    """Sends each event as one JSON datagram to a local Unix socket; never blocks."""
+
+    def __init__(self, path: Path) -> None:
+        self.name = f"unix:{path}"
+        self.path = path
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self._socket.setblocking(False)
+
+    def write_batch(self, events: list[MonitorEvent]) -> int:
+        address = str(self.path)
+        sent = 0
+        for event in events:
+            try:
+                self._socket.sendto(json.dumps(event.to_dict()).encode("utf-8"), address)
+            except BlockingIOError:
+                # Receiver buffer full: drop rather than stall the dispatcher.
+                continue
+            sent += 1
+        return sent
+
+    def close(self) -> None:
+        self._socket.close()
+
+
+class SqliteSink:
+    """Inserts events into an `events` table, one transaction per batch."""
+
+    def __init__(self, path: Path) -> None:
+        self.name = f"sqlite:{path}"
+        self.path = path
+        self._connection: sqlite3.Connection | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        # Opened lazily so the connection belongs to the dispatcher thread.
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(self.path, check_same_thread=False)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS events ("
+                "id INTEGER PRIMARY KEY, timestamp TEXT NOT NULL, kind TEXT NOT NULL, "
+                "target TEXT NOT NULL, severity TEXT NOT NULL, count INTEGER NOT NULL DEFAULT 1)"
+            )
+            columns = {row[1] for row in self._connection.execute("PRAGMA table_info(events)")}
+            if "count" not in columns:
+                # Tables created before coalesced events carried a count.
+                self._connection.execute(
+                    "ALTER TABLE events ADD COLUMN count INTEGER NOT NULL DEFAULT 1"
+                )
+        return self._connection
+
+    def write_batch(self, events: list[MonitorEvent]) -> int:
+        connection = self._connect()
+        with connection:
+            connection.executemany(
+                "INSERT INTO events (timestamp, kind, target, severity, count) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [
+                    (event.timestamp, event.kind, event.target, event.severity, event.count)
+                    for event in events
+                ],
+            )
+        return len(events)
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+
+SINK_KINDS = {"jsonl": JsonlFileSink, "unix": DatagramSink, "sqlite": SqliteSink}
+
+
+def parse_sink(spec: str) -> EventSink:
+    """Build a sink from `kind:path`, e.g. `jsonl:events.jsonl` or `unix:/run/audit.sock`."""
+    kind, separator, path = spec.partition(":")
+    if not separator or not path or kind not in SINK_KINDS:
+        choices = ", ".join(f"{name}:PATH" for name in SINK_KINDS)
+        raise ValueError(f"Invalid sink {spec!r}; expected one of {choices}")
+    return SINK_KINDS[kind](Path(path).expanduser())
+
+
+@dataclass(slots=True)
+class SinkStats:
+    submitted: int = 0
+    written: int = 0
+    dropped: int = 0
+    errors: int = 0
+    batches: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        return asdict(self)
+
+
+class SinkDispatcher:
+    """Bounded queue plus worker thread in front of one sink.
+
+    `submit` never performs I/O. A batch is flushed when `batch_size` events are queued or
+    `flush_interval` seconds have passed. When the queue is full, `drop_oldest` and
+    `drop_newest` discard an event (counted in `stats.dropped`); `block` waits for room before
+    dropping the new event, at most `block_timeout` seconds in total per `submit_many` call
+    (one monitor poll) or per lone `submit`. The sink is closed by the worker thread after its
+    last write.
+    """
+
+    def __init__(
+        self,
+        sink: EventSink,
+        max_queue: int = 10_000,
+        batch_size: int = 256,
+        flush_interval: float = 1.0,
+        policy: DropPolicy = "drop_oldest",
+        block_timeout: float = 0.05,
+    ) -> None:
+        if policy not in DROP_POLICIES:
+            raise ValueError(
+                f"Unknown drop policy {policy!r}; expected one of {', '.join(DROP_POLICIES)}"
+            )
+        self.sink = sink
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.policy = policy
+        self.block_timeout = block_timeout
+        self.stats = SinkStats()
+        self._queue: deque[MonitorEvent] = deque()
+        self._condition = threading.Condition()
+        self._closing = False
+        self._worker = threading.Thread(target=self._run, name=f"sink {sink.name}", daemon=True)
+        self._worker.start()
+
+    def submit(self, event: MonitorEvent, deadline: float | None = None) -> bool:
+        with self._condition:
+            self.stats.submitted += 1
+            if len(self._queue) >= self.max_queue:
+                if self.policy == "block":
+                    if deadline is None:
+                        deadline = monotonic() + self.block_timeout
+                    self._condition.wait_for(
+                        lambda: len(self._queue) < self.max_queue or self._closing,
+                        timeout=max(0.0, deadline - monotonic()),
+                    )
+                if len(self._queue) >= self.max_queue:
+                    if self.policy != "drop_oldest":
+                        self.stats.dropped += 1
+                        return False
+                    self._queue.popleft()
+                    self.stats.dropped += 1
+            self._queue.append(event)
+            if len(self._queue) >= self.batch_size:
+                self._condition.notify_all()
+            return True
+
+    def submit_many(self, events: Iterable[MonitorEvent]) -> int:
+        """Submit events sharing one `block_timeout` budget; return how many were accepted."""
+        deadline = monotonic() + self.block_timeout
+        return sum(self.submit(event, deadline) for event in events)
+
+    def _take_batch(self) -> list[MonitorEvent] | None:
+        with self._condition:
+            deadline = monotonic() + self.flush_interval
+            while not self._closing and len(self._queue) < self.batch_size:
+                remaining = deadline - monotonic()
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+            if not self._queue:
+                return None if self._closing else []
+            count = min(self.batch_size, len(self._queue))
+            batch = [self._queue.popleft() for _ in range(count)]
+            self._condition.notify_all()
+            return batch
+
+    def _run(self) -> None:
+        try:
+            while True:
+                batch = self._take_batch()
+                if batch is None:
+                    return
+                if not batch:
+                    continue
+                try:
+                    written = self.sink.write_batch(batch)
+                except Exception:  # noqa: BLE001 - a failing sink must not stop the others
+                    written = 0
+                    with self._condition:
+                        self.stats.errors += 1
+                with self._condition:
+                    self.stats.batches += 1
+                    self.stats.written += written
+                    self.stats.dropped += len(batch) - written
+        finally:
+            # Closed here so it can never race a write_batch still in progress.
+            try:
+                self.sink.close()
+            except OSError:
+                pass
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Drain the queue and stop the worker, which then closes the sink.
+
+        If the worker is still inside `write_batch` after `timeout`, events left in the queue
+        are counted as dropped; the sink is closed once that write returns.
+        """
+        with self._condition:
+            self._closing = True
+            self._condition.notify_all()
+        self._worker.join(timeout)
+        if self._worker.is_alive():
+            with self._condition:
+                self.stats.dropped += len(self._queue)
+                self._queue.clear()
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import json
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from pathlib import Path
+from types import TracebackType
+from typing import Any, TextIO
+
+from agent_audit import __version__
+from agent_audit.types import CheckResult, ScanResult
+
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+SARIF_LEVELS = {"critical": "error", "high": "error", "medium": "warning", "low": "note"}
+REPORTED_SEVERITIES = frozenset({"critical", "high", "medium"})
+
+_COMPACT = (",", ":")
+
+
+class Projection:
+    """Field projection over `ScanResult.to_dict()` payloads.
+
+    `fields` entries select top-level keys (`risk_score`) or per-check attributes
+    (`checks.severity`); a leading `-` drops a field instead (`-checks.details`).
+    """
+
+    def __init__(self, fields: Iterable[str] | None = None) -> None:
+        self.include: set[str] = set()
+        self.exclude: set[str] = set()
+        for raw in fields or ():
+            for item in raw.split(","):
+                name = item.strip()
+                if name.startswith("-"):
+                    self.exclude.add(name[1:])
+                elif name:
+                    self.include.add(name)
+        self.check_include = {
+            name[len("checks.") :] for name in self.include if name.startswith("checks.")
+        }
+        self.check_exclude = {
+            name[len("checks.") :] for name in self.exclude if name.startswith("checks.")
+        }
+        if self.check_include:
+            self.include.add("checks")
+
+    def keeps(self, name: str) -> bool:
+        if name in self.exclude:
+            return False
+        return not self.include or name in self.include
+
+    def keeps_check_field(self, name: str) -> bool:
+        if name in self.check_exclude:
+            return False
+        return not self.check_include or name in self.check_include
+
+    def apply(self, payload: dict[str, Any]) -> dict[str, Any]:
+        if not (self.include or self.exclude):
+            return payload
+        projected = {key: value for key, value in payload.items() if self.keeps(key)}
+        if "checks" in projected and (self.check_include or self.check_exclude):
+            projected["checks"] = {
+                key: {name: value for name, value in check.items() if self.keeps_check_field(name)}
+                for key, check in projected["checks"].items()
+            }
+        return projected
+
+
+class _StreamWriter(ABC):
+    def __init__(self, stream: TextIO, fields: Iterable[str] | None = None) -> None:
+        self.stream = stream
+        self.projection = Projection(fields)
+        self.count = 0
+        self._closed = False
+
+    def __enter__(self) -> _StreamWriter:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    @abstractmethod
+    def write(self, result: ScanResult) -> None: ...
+
+    def write_all(self, results: Iterable[ScanResult]) -> int:
+        for result in results:
+            self.write(result)
+        return self.count
+
+    def close(self) -> None:
+        self._closed = True
+        self.stream.flush()
+
+
+class NdjsonWriter(_StreamWriter):
+    """One JSON object per line, written and flushed as each result arrives."""
+
+    def write(self, result: ScanResult) -> None:
+        payload = self.projection.apply(result.to_dict())
+        self.stream.write(json.dumps(payload, separators=_COMPACT))
+        self.stream.write("\n")
+        self.stream.flush()
+        self.count += 1
+
+
+class SarifWriter(_StreamWriter):
+    """A single-run SARIF 2.1.0 log whose `results` array is streamed.
+
+    Only checks above low severity are reported; clean checks are not SARIF results. The `tool`
+    object is emitted after `results` (JSON object order is insignificant) so that rules can be
+    collected from the checks actually reported without buffering results.
+    """
+
+    def __init__(self, stream: TextIO, fields: Iterable[str] | None = None) -> None:
+        super().__init__(stream, fields)
+        self._rules: dict[str, str] = {}
+        self.stream.write(
+            f'{{"$schema":{json.dumps(SARIF_SCHEMA)},"version":"2.1.0","runs":[{{"results":['
+        )
+
+    def write(self, result: ScanResult) -> None:
+        for check in result.checks.values():
+            if check.severity.lower() not in REPORTED_SEVERITIES:
+                continue
+            self._rules.setdefault(check.key, check.title)
+            if self.count:
+                self.stream.write(",")
+            self.stream.write(json.dumps(self._sarif_result(result, check), separators=_COMPACT))
+            self.count += 1
+        self.stream.flush()
+
+    def _sarif_result(self, result: ScanResult, check: CheckResult) -> dict[str, Any]:
+        agent = {
+            key: value
+            for key, value in (
+                ("agent_name", result.agent_name),
+                ("agent_version", result.agent_version),
+                ("adapter_name", result.adapter_name),
+                ("risk_score", result.risk_score),
+                ("risk_tier", result.risk_tier),
+                ("generated_at", result.generated_at),
+            )
+            if self.projection.keeps(key)
+        }
+        properties: dict[str, Any] = {**agent, "severity": check.severity, "score": check.score}
+        if self.projection.keeps("checks") and self.projection.keeps_check_field("details"):
+            properties["details"] = check.details
+        return {
+            "ruleId": check.key,
+            "level": SARIF_LEVELS.get(check.severity.lower(), "warning"),
+            "message": {"text": f"{check.title}: {check.summary}"},
+            "locations": [
+                {
+                    "physicalLocation": {
+                        "artifactLocation": {"uri": _artifact_uri(result.scanned_path)}
+                    }
+                }
+            ],
+            "properties": properties,
+        }
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        driver = {
+            "name": "agent-audit",
+            "version": __version__,
+            "informationUri": "https://github.com/ClariSortAi/agent-audit",
+            "rules": [
+                {"id": key, "name": title, "shortDescription": {"text": title}}
+                for key, title in self._rules.items()
+            ],
+        }
+        self.stream.write(f'],"tool":{{"driver":{json.dumps(driver, separators=_COMPACT)}}}}}]}}\n')
+        super().close()
+
+
+def _artifact_uri(scanned_path: str) -> str:
+    path = Path(scanned_path)
+    return path.as_uri() if path.is_absolute() else scanned_path
+
+
+WRITERS: dict[str, type[_StreamWriter]] = {
+    "ndjson": NdjsonWriter,
+    "sarif": SarifWriter,
+}
+
+
+def open_writer(
+    output_format: str, stream: TextIO, fields: Iterable[str] | None = None
+) -> _StreamWriter:
+    return WRITERS[output_format](stream, fields)
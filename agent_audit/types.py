@@ -1,16 +1,77 @@
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, field
+import re
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+# Version of the dict/JSON layout produced by ScanResult.to_dict(). Payloads without a
+# `schema_version` key predate versioning and share the version 1 layout; version 2 adds
+# per-check `fingerprints` (recomputed on demand for version 1 payloads).
+SCHEMA_VERSION = 2
+
+
+def _utc_now() -> str:
+    return datetime.now(tz=timezone.utc).isoformat(timespec="seconds")
+
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_detail(detail: str, root: str = "") -> str:
+    """Detail text with the scanned root replaced, so checkouts at other paths fingerprint alike."""
+    if root:
+        detail = detail.replace(root, "<root>")
+    return _WHITESPACE.sub(" ", detail).strip()
+
+
+# Detail lines that summarize a check (counts, declared lists) rather than report a finding.
+# They change whenever anything is added or removed, so they get no fingerprint.
+SUMMARY_DETAIL_PREFIXES = (
+    "Total installed skills:",
+    "Permission counts:",
+    "Configured endpoints:",
+    "Internal network endpoints:",
+    "Environment secrets referenced:",
+    "Blocked paths declared:",
+)
+
+
+def is_summary_detail(detail: str) -> bool:
+    return detail.startswith(SUMMARY_DETAIL_PREFIXES)
+
+
+def finding_fingerprints(
+    adapter_name: str, check_key: str, details: list[str], root: str = ""
+) -> list[str]:
+    """Stable id per detail from adapter, check key and normalized text.
+
+    Repeated identical details are told apart by their occurrence number. Summary lines (see
+    SUMMARY_DETAIL_PREFIXES) get an empty fingerprint.
+    """
+    import hashlib  # only needed once results are serialized or diffed
+
+    seen: dict[str, int] = {}
+    fingerprints: list[str] = []
+    for detail in details:
+        if is_summary_detail(detail):
+            fingerprints.append("")
+            continue
+        normalized = normalize_detail(detail, root)
+        occurrence = seen.get(normalized, 0)
+        seen[normalized] = occurrence + 1
+        material = f"{adapter_name}\0{check_key}\0{normalized}\0{occurrence}"
+        fingerprints.append(hashlib.sha256(material.encode("utf-8")).hexdigest()[:16])
+    return fingerprints
+
 
 @dataclass(slots=True)
 class Skill:
     name: str
     permissions: list[str] = field(default_factory=list)
     source: str = ""
+    path: str = ""
 
 
 @dataclass(slots=True)
@@ -21,6 +82,39 @@ class CheckResult:
     severity: str
     summary: str
     details: list[str] = field(default_factory=list)
+    # One per detail, empty for summary lines. Derived from the details, so computed on first
+    # use by ScanResult.fingerprints_for() and left out of comparisons.
+    fingerprints: list[str] = field(default_factory=list, compare=False)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "key": self.key,
+            "title": self.title,
+            "score": self.score,
+            "severity": self.severity,
+            "summary": self.summary,
+            "details": list(self.details),
+            "fingerprints": list(self.fingerprints),
+        }
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> CheckResult:
+        return cls(
+            key=str(payload["key"]),
+            title=str(payload.get("title", payload["key"])),
+            score=float(payload.get("score", 0.0)),
+            severity=str(payload.get("severity", "low")),
+            summary=str(payload.get("summary", "")),
+            details=[str(item) for item in payload.get("details", [])],
+            fingerprints=[str(item) for item in payload.get("fingerprints", [])],
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class Endpoint:
+    value: str
+    path: str = ""  # where in the config it was found, e.g. mcpServers.github.args[2]
+    origin: str = "url"  # "url" (config value), "command" (command/args) or "env" (env/headers)
 
 
 @dataclass(slots=True)
@@ -32,6 +126,7 @@ class AgentConfig:
     blocked_paths: list[str] = field(default_factory=list)
     shell_mode: str = "unknown"
     endpoints: list[str] = field(default_factory=list)
+    endpoint_sources: list[Endpoint] = field(default_factory=list)
     env_var_refs: list[str] = field(default_factory=list)
     hardcoded_secrets: list[str] = field(default_factory=list)
     metadata: dict[str, Any] = field(default_factory=dict)
@@ -46,14 +141,47 @@ class ScanResult:
     checks: dict[str, CheckResult]
     risk_score: float
     risk_tier: str
-    generated_at: str = field(
-        default_factory=lambda: datetime.now(tz=timezone.utc).isoformat(timespec="seconds")
-    )
+    generated_at: str = field(default_factory=_utc_now)
+
+    def fingerprints_for(self, check: CheckResult) -> list[str]:
+        """Fingerprints of `check`'s details, computed on first use and kept on the check."""
+        if len(check.fingerprints) != len(check.details):
+            check.fingerprints = finding_fingerprints(
+                self.adapter_name, check.key, check.details, self.scanned_path
+            )
+        return check.fingerprints
 
     def to_dict(self) -> dict[str, Any]:
-        payload = asdict(self)
-        payload["checks"] = {
-            key: asdict(result)
-            for key, result in self.checks.items()
+        for check in self.checks.values():
+            self.fingerprints_for(check)
+        return {
+            "schema_version": SCHEMA_VERSION,
+            "agent_name": self.agent_name,
+            "agent_version": self.agent_version,
+            "adapter_name": self.adapter_name,
+            "scanned_path": self.scanned_path,
+            "checks": {key: result.to_dict() for key, result in self.checks.items()},
+            "risk_score": self.risk_score,
+            "risk_tier": self.risk_tier,
+            "generated_at": self.generated_at,
         }
-        return payload
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> ScanResult:
+        version = int(payload.get("schema_version", 1))
+        if version > SCHEMA_VERSION:
+            raise ValueError(
+                f"Scan result schema version {version} is newer than supported version "
+                f"{SCHEMA_VERSION}"
+            )
+        checks = payload.get("checks", {})
+        return cls(
+            agent_name=str(payload["agent_name"]),
+            agent_version=str(payload.get("agent_version", "unknown")),
+            adapter_name=str(payload["adapter_name"]),
+            scanned_path=str(payload.get("scanned_path", "")),
+            checks={str(key): CheckResult.from_dict(check) for key, check in checks.items()},
+            risk_score=float(payload.get("risk_score", 0.0)),
+            risk_tier=str(payload.get("risk_tier", "LOW")),
+            generated_at=str(payload["generated_at"]) if "generated_at" in payload else _utc_now(),
+        )
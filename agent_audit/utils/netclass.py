@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import ipaddress
+import json
+import re
+from bisect import bisect_right
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+DEFAULT_RULES_PATH = Path(__file__).resolve().parent.parent / "rules" / "network.json"
+
+WILDCARD_HOSTS = {"*", "any", "0.0.0.0", "::"}
+
+_LABEL = ""  # trie key holding the label of a rule ending at that node; never a DNS label
+
+# scheme, then host (bracketed IPv6 or up to the first port/path delimiter). Cheaper than
+# urllib.parse.urlsplit, which dominates when classifying whole fleets.
+_ENDPOINT_RE = re.compile(
+    r"^\s*(?:(?P<scheme>[A-Za-z][A-Za-z0-9+.\-]*)://)?(?:[^@/?#\s]*@)?"
+    r"(?:\[(?P<ipv6>[^\]]*)\]|(?P<host>[^/?#\s]*))"
+)
+
+_CACHE_LIMIT = 65_536
+
+
+class DomainTrie:
+    """Suffix trie over reversed DNS labels; a rule for `example.com` also covers subdomains."""
+
+    def __init__(self) -> None:
+        self._root: dict[str, Any] = {}
+
+    def add(self, domain: str, label: str) -> None:
+        node = self._root
+        host = _normalize_host(domain)
+        if host.startswith("*."):
+            host = host[2:]
+        for part in reversed(host.split(".")):
+            node = node.setdefault(part, {})
+        node[_LABEL] = label
+
+    def lookup(self, host: str) -> str | None:
+        node = self._root
+        found = None
+        for part in reversed(host.split(".")):
+            node = node.get(part)
+            if node is None:
+                break
+            found = node.get(_LABEL, found)
+        return found
+
+
+class CidrIndex:
+    """Sorted, non-overlapping address intervals; the most specific CIDR wins."""
+
+    def __init__(self, networks: list[tuple[str, str]]) -> None:
+        self._tables: dict[int, tuple[list[int], list[int], list[str]]] = {}
+        by_version: dict[int, list[tuple[int, int, str]]] = {4: [], 6: []}
+        for cidr, label in networks:
+            network = ipaddress.ip_network(cidr, strict=False)
+            start = int(network.network_address)
+            by_version[network.version].append((start, start + network.num_addresses - 1, label))
+        for version, intervals in by_version.items():
+            self._tables[version] = _flatten(intervals)
+
+    def lookup(self, address: ipaddress.IPv4Address | ipaddress.IPv6Address) -> str | None:
+        starts, ends, labels = self._tables[address.version]
+        value = int(address)
+        index = bisect_right(starts, value) - 1
+        if index >= 0 and value <= ends[index]:
+            return labels[index]
+        return None
+
+
+def _flatten(intervals: list[tuple[int, int, str]]) -> tuple[list[int], list[int], list[str]]:
+    # CIDR blocks are either nested or disjoint, so a single sweep with a stack of open
+    # blocks yields disjoint segments labelled by the innermost (most specific) block.
+    starts: list[int] = []
+    ends: list[int] = []
+    labels: list[str] = []
+
+    def emit(start: int, end: int, label: str) -> None:
+        if start > end:
+            return
+        if labels and labels[-1] == label and ends[-1] + 1 == start:
+            ends[-1] = end
+            return
+        starts.append(start)
+        ends.append(end)
+        labels.append(label)
+
+    stack: list[tuple[int, str]] = []
+    cursor = 0
+    for start, end, label in sorted(intervals, key=lambda item: (item[0], -item[1])):
+        while stack and stack[-1][0] < start:
+            top_end, top_label = stack.pop()
+            emit(cursor, top_end, top_label)
+            cursor = top_end + 1
+        if stack:
+            emit(cursor, start - 1, stack[-1][1])
+        stack.append((end, label))
+        cursor = start
+    while stack:
+        top_end, top_label = stack.pop()
+        emit(cursor, top_end, top_label)
+        cursor = top_end + 1
+    return starts, ends, labels
+
+
+@dataclass(frozen=True, slots=True)
+class EndpointClass:
+    host: str
+    scheme: str
+    label: str | None
+    is_ip: bool = False
+
+
+class NetworkClassifier:
+    def __init__(self, domains: dict[str, list[str]], networks: dict[str, list[str]]) -> None:
+        self.domains = DomainTrie()
+        for label, patterns in domains.items():
+            for pattern in patterns:
+                self.domains.add(pattern, label)
+        self.networks = CidrIndex(
+            [(cidr, label) for label, cidrs in networks.items() for cidr in cidrs]
+        )
+        self._hosts: dict[str, tuple[str | None, bool]] = {}
+
+    @classmethod
+    def from_rules(cls, *payloads: dict[str, Any]) -> NetworkClassifier:
+        domains: dict[str, list[str]] = {}
+        networks: dict[str, list[str]] = {}
+        for payload in payloads:
+            for label, patterns in (payload.get("domains") or {}).items():
+                domains.setdefault(str(label), []).extend(str(item) for item in patterns)
+            for label, cidrs in (payload.get("networks") or {}).items():
+                networks.setdefault(str(label), []).extend(str(item) for item in cidrs)
+        return cls(domains, networks)
+
+    def classify_host(self, host: str) -> tuple[str | None, bool]:
+        """Return (label, is_ip) for a bare host name or address."""
+        cached = self._hosts.get(host)
+        if cached is not None:
+            return cached
+        if len(self._hosts) >= _CACHE_LIMIT:
+            self._hosts.clear()
+        if host in WILDCARD_HOSTS or host.startswith("*"):
+            result: tuple[str | None, bool] = ("wildcard", False)
+        elif host[:1].isdigit() or ":" in host:
+            try:
+                address = ipaddress.ip_address(host)
+            except ValueError:
+                result = (self.domains.lookup(host), False)
+            else:
+                result = (self.networks.lookup(address), True)
+        else:
+            result = (self.domains.lookup(host), False)
+        self._hosts[host] = result
+        return result
+
+    def classify(self, endpoint: str) -> EndpointClass:
+        match = _ENDPOINT_RE.match(endpoint)
+        scheme = (match.group("scheme") or "").lower() if match else ""
+        host = ""
+        if match:
+            host = match.group("ipv6") or _strip_port(match.group("host") or "")
+        host = _normalize_host(host)
+        if not host:
+            return EndpointClass(host="", scheme=scheme, label=None)
+        label, is_ip = self.classify_host(host)
+        return EndpointClass(host=host, scheme=scheme, label=label, is_ip=is_ip)
+
+
+def _strip_port(host: str) -> str:
+    # Bare IPv6 literals ("::1") carry several colons; only a single colon is a port.
+    if host.count(":") == 1:
+        return host.split(":", 1)[0]
+    return host
+
+
+def _normalize_host(value: str) -> str:
+    return value.strip().lower().rstrip(".")
+
+
+def _read_rules(path: Path) -> dict[str, Any]:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as exc:
+        raise ValueError(f"Could not read network rules from {path}: {exc}") from exc
+    if not isinstance(payload, dict):
+        raise ValueError(f"Network rules in {path} must be a JSON object")
+    return payload
+
+
+@lru_cache(maxsize=8)
+def load_network_classifier(extra_rules: str | None = None) -> NetworkClassifier:
+    """Compile the shipped rules, merged with an optional user rule file, once per process."""
+    payloads = [_read_rules(DEFAULT_RULES_PATH)]
+    if extra_rules:
+        payloads.append(_read_rules(Path(extra_rules).expanduser()))
+    return NetworkClassifier.from_rules(*payloads)
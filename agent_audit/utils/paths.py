@@ -1,7 +1,11 @@
 from __future__ import annotations
 
-from pathlib import Path
+import os
+from pathlib import Path, PurePath
+from typing import TYPE_CHECKING, Any
 
+if TYPE_CHECKING:
+    from agent_audit.utils.vfs import VirtualPath
 
 SENSITIVE_SEGMENTS = {
     ".ssh",
@@ -13,6 +17,12 @@ SENSITIVE_SEGMENTS = {
     "/var",
 }
 
+# Split once: bare names match any path component, rooted entries match a path prefix.
+_SENSITIVE_COMPONENTS = frozenset(segment for segment in SENSITIVE_SEGMENTS if "/" not in segment)
+_SENSITIVE_PREFIXES = tuple(
+    PurePath(segment).parts for segment in SENSITIVE_SEGMENTS if segment.startswith("/")
+)
+
 
 def normalize_path(path: str | Path) -> Path:
     return Path(path).expanduser().resolve()
@@ -24,7 +34,10 @@ def is_unrestricted_path(raw_path: str) -> bool:
 
 
 def references_sensitive_location(raw_path: str) -> bool:
-    return any(segment in raw_path for segment in SENSITIVE_SEGMENTS)
+    parts = PurePath(raw_path.strip()).parts
+    if _SENSITIVE_COMPONENTS.intersection(parts):
+        return True
+    return any(parts[: len(prefix)] == prefix for prefix in _SENSITIVE_PREFIXES)
 
 
 def is_within(base: Path, candidate: Path) -> bool:
@@ -33,3 +46,81 @@ def is_within(base: Path, candidate: Path) -> bool:
         return True
     except ValueError:
         return False
+
+
+class PathResolver:
+    """Memoizes path resolution per (path, root) for the duration of one scan."""
+
+    def __init__(self, resolve_symlinks: bool = True) -> None:
+        self.resolve_symlinks = resolve_symlinks
+        self._cache: dict[tuple[str, str], Path] = {}
+
+    def root(self, root: str | Path | VirtualPath) -> Path:
+        if not isinstance(root, (str, Path)):
+            # A VirtualPath: scope is judged by where the agent root lives inside the image,
+            # not on the host.
+            return self.resolve(str(root.member_path), None)
+        return self.resolve(str(root), None)
+
+    def resolve(self, raw_path: str, root: Path | None) -> Path:
+        key = (raw_path, str(root) if root is not None else "")
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+        candidate = Path(raw_path).expanduser()
+        if root is not None and not candidate.is_absolute():
+            candidate = root / candidate
+        if self.resolve_symlinks:
+            resolved = candidate.resolve()
+        else:
+            resolved = Path(os.path.normpath(candidate))
+        self._cache[key] = resolved
+        return resolved
+
+
+_RULE = ""  # trie key holding the (kind, raw_path) rule ending at a node; never a path component
+
+
+class PathScopeTrie:
+    """Component trie of path rules so "is this path covered?" costs O(path depth)."""
+
+    def __init__(self) -> None:
+        self._root: dict[str, Any] = {}
+
+    def insert(self, path: Path, kind: str, raw_path: str) -> None:
+        node = self._root
+        for part in path.parts:
+            node = node.setdefault(part, {})
+        node.setdefault(_RULE, {})[kind] = raw_path
+
+    def covering(self, path: Path, kind: str) -> str | None:
+        """Return the raw rule of `kind` at `path` or its nearest ancestor, if any."""
+        node = self._root
+        found = None
+        for part in path.parts:
+            node = node.get(part)
+            if node is None:
+                break
+            rules = node.get(_RULE)
+            if rules and kind in rules:
+                found = rules[kind]
+        return found
+
+
+def build_scope_trie(
+    allowed: list[str],
+    blocked: list[str],
+    root: Path,
+    resolver: PathResolver,
+) -> tuple[PathScopeTrie, dict[str, Path]]:
+    """Insert blocked paths into a trie; returns it and the resolved allowed paths to look up."""
+    trie = PathScopeTrie()
+    resolved_allowed: dict[str, Path] = {}
+    for raw_path in blocked:
+        if raw_path.strip():
+            trie.insert(resolver.resolve(raw_path, root), "deny", raw_path)
+    for raw_path in allowed:
+        if is_unrestricted_path(raw_path):
+            continue
+        resolved_allowed[raw_path] = resolver.resolve(raw_path, root)
+    return trie, resolved_allowed
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+from functools import lru_cache
+
+# Known permission names. A dotted name is a child of its prefix; each name also gets a
+# wildcard form (`filesystem.*`) that implies the name and every descendant.
+DEFAULT_PERMISSIONS = (
+    "shell",
+    "exec",
+    "filesystem",
+    "filesystem.read",
+    "filesystem.write",
+    "network",
+    "network.outbound",
+    "network.inbound",
+    "process",
+    "process.spawn",
+)
+
+WILDCARD = "*"
+
+_SEPARATORS = re.compile(r"[:/\s]+")
+
+_CACHE_LIMIT = 65_536
+
+
+def normalize_permission(raw: str) -> str:
+    """`Network:Outbound`, `shell/bash` and ` filesystem.* ` become dotted lowercase names."""
+    name = _SEPARATORS.sub(".", raw.strip().lower())
+    return ".".join(part for part in name.split(".") if part)
+
+
+class PermissionVocabulary:
+    """Interns permission names into bits with wildcard expansion precomputed once.
+
+    `declared(name)` is the bit of the canonical permission a raw name resolves to (unknown
+    names fall back to their nearest known ancestor); `implied(mask)` ORs in everything the
+    declared wildcards cover, so risk checks are a single AND per skill.
+    """
+
+    def __init__(self, names: Iterable[str] = DEFAULT_PERMISSIONS) -> None:
+        self.names: list[str] = []
+        self._bits: dict[str, int] = {}
+        known = list(dict.fromkeys(normalize_permission(name) for name in names))
+        for name in known:
+            self._intern(name)
+        for name in known:
+            self._intern(f"{name}.{WILDCARD}")
+        self._intern(WILDCARD)
+
+        self._expansion: list[int] = []
+        for canonical in self.names:
+            mask = self._bits[canonical]
+            if canonical == WILDCARD:
+                mask = (1 << len(self.names)) - 1
+            elif canonical.endswith(f".{WILDCARD}"):
+                prefix = canonical[: -len(WILDCARD)]
+                base = prefix[:-1]
+                for other, bit in self._bits.items():
+                    if other == base or other.startswith(prefix):
+                        mask |= bit
+            self._expansion.append(mask)
+        self._resolved: dict[str, str | None] = {}
+
+    def _intern(self, name: str) -> None:
+        if name not in self._bits:
+            self._bits[name] = 1 << len(self.names)
+            self.names.append(name)
+
+    def canonical(self, raw: str) -> str | None:
+        cached = self._resolved.get(raw)
+        if cached is not None or raw in self._resolved:
+            return cached
+        name = normalize_permission(raw)
+        resolved: str | None = None
+        if name in self._bits:
+            resolved = name
+        else:
+            wildcard = name.endswith(f".{WILDCARD}")
+            parts = name.split(".")
+            if wildcard:
+                parts = parts[:-1]
+            # Drop trailing components until a known ancestor remains. An unknown wildcard
+            # under a known name stays a wildcard (`network.custom.*` -> `network.*`).
+            while parts and resolved is None:
+                parts = parts[:-1]
+                candidate = ".".join(parts)
+                if wildcard and f"{candidate}.{WILDCARD}" in self._bits:
+                    resolved = f"{candidate}.{WILDCARD}"
+                elif candidate in self._bits:
+                    resolved = candidate
+        if len(self._resolved) < _CACHE_LIMIT:
+            self._resolved[raw] = resolved
+        return resolved
+
+    def bit(self, name: str) -> int:
+        return self._bits[normalize_permission(name)]
+
+    def mask(self, names: Iterable[str]) -> int:
+        """Mask of canonical names (wildcards included) without expansion."""
+        value = 0
+        for name in names:
+            value |= self._bits[normalize_permission(name)]
+        return value
+
+    def covering(self, names: Iterable[str]) -> int:
+        """Mask matching each name and its descendants; `network` also matches `network.outbound`.
+
+        Wildcard names only match the wildcard itself (or `*`), not their plain parent.
+        """
+        value = 0
+        for name in names:
+            canonical = normalize_permission(name)
+            if canonical.endswith(WILDCARD):
+                value |= self._bits[canonical]
+            else:
+                value |= self._expansion[self._bits[f"{canonical}.{WILDCARD}"].bit_length() - 1]
+        return value
+
+    def declared(self, permissions: Iterable[str]) -> tuple[int, list[str]]:
+        """Declared mask plus the normalized names that resolved to no known permission."""
+        value = 0
+        unknown: list[str] = []
+        for raw in permissions:
+            canonical = self.canonical(raw)
+            if canonical is None:
+                unknown.append(normalize_permission(raw))
+            else:
+                value |= self._bits[canonical]
+        return value, unknown
+
+    def implied(self, declared: int) -> int:
+        value = 0
+        expansion = self._expansion
+        while declared:
+            low = declared & -declared
+            value |= expansion[low.bit_length() - 1]
+            declared ^= low
+        return value
+
+    def iter_names(self, mask: int) -> list[str]:
+        names: list[str] = []
+        while mask:
+            low = mask & -mask
+            names.append(self.names[low.bit_length() - 1])
+            mask ^= low
+        return names
+
+
+@lru_cache(maxsize=1)
+def default_vocabulary() -> PermissionVocabulary:
+    return PermissionVocabulary()
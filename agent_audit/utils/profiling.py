@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+# Opt-in per-stage timing for `scan --profile`. Instrumented code calls `stage()` and the
+# `count_*` helpers unconditionally; without an active profile they only do a contextvar lookup.
+
+
+@dataclass(slots=True)
+class StageTiming:
+    calls: int = 0
+    wall_s: float = 0.0
+    cpu_s: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "wall_ms": round(self.wall_s * 1000, 3),
+            "cpu_ms": round(self.cpu_s * 1000, 3),
+        }
+
+
+@dataclass(slots=True)
+class ScanProfile:
+    stages: dict[str, StageTiming] = field(default_factory=dict)
+    files_stat: int = 0
+    files_read: int = 0
+    bytes_read: int = 0
+
+    def record(self, name: str, wall_s: float, cpu_s: float) -> None:
+        timing = self.stages.get(name)
+        if timing is None:
+            timing = self.stages[name] = StageTiming()
+        timing.calls += 1
+        timing.wall_s += wall_s
+        timing.cpu_s += cpu_s
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "stages": {name: timing.to_dict() for name, timing in self.stages.items()},
+            "files_stat": self.files_stat,
+            "files_read": self.files_read,
+            "bytes_read": self.bytes_read,
+        }
+
+
+_ACTIVE: ContextVar[ScanProfile | None] = ContextVar("agent_audit_profile", default=None)
+
+
+@contextmanager
+def profiling(profile: ScanProfile) -> Iterator[ScanProfile]:
+    """Record stages and file counters from this context into `profile`."""
+    token = _ACTIVE.set(profile)
+    try:
+        yield profile
+    finally:
+        _ACTIVE.reset(token)
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """Time the enclosed block as `name`; nested stages are timed inclusively."""
+    profile = _ACTIVE.get()
+    if profile is None:
+        yield
+        return
+    wall = time.perf_counter()
+    cpu = time.process_time()
+    try:
+        yield
+    finally:
+        profile.record(name, time.perf_counter() - wall, time.process_time() - cpu)
+
+
+def count_stat(files: int = 1) -> None:
+    profile = _ACTIVE.get()
+    if profile is not None:
+        profile.files_stat += files
+
+
+def count_read(size: int) -> None:
+    profile = _ACTIVE.get()
+    if profile is not None:
+        profile.files_read += 1
+        profile.bytes_read += size
@@ -0,0 +1,512 @@
+"""Read-only virtual filesystem over tar/zip archives and OCI image layouts.
+
+`VirtualPath` implements the slice of the `pathlib.Path` API that adapters and checks use, so a
+scan can run against an archive without extracting it. Archive members are indexed in one
+streaming pass; only members that pass the retention filter (small text/config files) are kept
+in memory, and reading any other member raises `OSError` like an unreadable file would.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import json
+import posixpath
+import stat as stat_module
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from pathlib import Path, PurePosixPath
+from typing import IO, Any
+
+ARCHIVE_SUFFIXES = (".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tar.xz", ".zip")
+OCI_LAYOUT_FILE = "oci-layout"
+
+RETAINED_SUFFIXES = frozenset(
+    {
+        ".json",
+        ".toml",
+        ".yaml",
+        ".yml",
+        ".md",
+        ".txt",
+        ".sh",
+        ".bash",
+        ".zsh",
+        ".py",
+        ".js",
+        ".mjs",
+        ".cjs",
+        ".ts",
+        ".ps1",
+        ".rb",
+    }
+)
+MAX_RETAINED_BYTES = 1024 * 1024
+MAX_SYMLINK_DEPTH = 8
+
+WHITEOUT_PREFIX = ".wh."
+OPAQUE_WHITEOUT = ".wh..wh..opq"
+
+_LAYER_MEDIA_TYPES = {
+    "application/vnd.oci.image.layer.v1.tar",
+    "application/vnd.oci.image.layer.v1.tar+gzip",
+    "application/vnd.docker.image.rootfs.diff.tar",
+    "application/vnd.docker.image.rootfs.diff.tar.gzip",
+}
+
+
+def retain_member(name: str, size: int) -> bool:
+    """Default retention filter: small files with a config or script suffix."""
+    return size <= MAX_RETAINED_BYTES and PurePosixPath(name).suffix.lower() in RETAINED_SUFFIXES
+
+
+@dataclass(slots=True, frozen=True)
+class VirtualStat:
+    st_size: int
+    st_mtime_ns: int
+    st_mode: int
+
+
+@dataclass(slots=True)
+class _Entry:
+    kind: str  # "file", "dir" or "symlink"
+    size: int = 0
+    mtime_ns: int = 0
+    data: bytes | None = None
+    loader: Callable[[], bytes] | None = None
+    link: str = ""
+
+
+def _normalize(name: str) -> str:
+    """Archive member name -> canonical relative posix path ("" for the root)."""
+    normalized = posixpath.normpath("/" + name.replace("\\", "/")).lstrip("/")
+    return "" if normalized == "." else normalized
+
+
+class VirtualFS:
+    """Directory tree of archive members, keyed by normalized member path."""
+
+    def __init__(self, source: Path) -> None:
+        self.source = source
+        self._entries: dict[str, _Entry] = {"": _Entry("dir")}
+        self._children: dict[str, set[str]] = {"": set()}
+        self._closers: list[Callable[[], None]] = []
+
+    @property
+    def root(self) -> VirtualPath:
+        return VirtualPath(self, "")
+
+    def path(self, member: str) -> VirtualPath:
+        return VirtualPath(self, _normalize(member))
+
+    def path_from_str(self, text: str) -> VirtualPath | None:
+        """Map a `str(VirtualPath)` of this filesystem back to the path object."""
+        prefix = str(self.source)
+        if text == prefix:
+            return self.root
+        if text.startswith(prefix + "/"):
+            return self.path(text[len(prefix) + 1 :])
+        return None
+
+    def close(self) -> None:
+        while self._closers:
+            self._closers.pop()()
+
+    def __enter__(self) -> VirtualFS:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    # Building
+
+    def _ensure_dir(self, member: str) -> None:
+        if member in self._children:
+            return
+        parent, _, name = member.rpartition("/")
+        self._ensure_dir(parent)
+        self._entries[member] = _Entry("dir")
+        self._children[member] = set()
+        self._children[parent].add(name)
+
+    def add(self, name: str, entry: _Entry) -> None:
+        member = _normalize(name)
+        if not member:
+            return
+        if entry.kind == "dir":
+            self._ensure_dir(member)
+            return
+        self.remove(member)
+        parent, _, base = member.rpartition("/")
+        self._ensure_dir(parent)
+        self._entries[member] = entry
+        self._children[parent].add(base)
+
+    def add_file(self, name: str, data: bytes, mtime_ns: int = 0) -> None:
+        self.add(name, _Entry("file", size=len(data), mtime_ns=mtime_ns, data=data))
+
+    def add_symlink(self, name: str, target: str) -> None:
+        self.add(name, _Entry("symlink", link=target))
+
+    def remove(self, member: str) -> None:
+        if member not in self._entries or not member:
+            return
+        for child in list(self._children.get(member, ())):
+            self.remove(f"{member}/{child}")
+        self._children.pop(member, None)
+        del self._entries[member]
+        parent, _, base = member.rpartition("/")
+        self._children[parent].discard(base)
+
+    def clear_dir(self, member: str) -> None:
+        for child in list(self._children.get(member, ())):
+            self.remove(f"{member}/{child}" if member else child)
+
+    # Lookup
+
+    def resolve(self, member: str) -> str | None:
+        """Follow symlinks in every component; None when the path does not exist."""
+        resolved = ""
+        pending = [part for part in member.split("/") if part]
+        hops = 0
+        while pending:
+            part = pending.pop(0)
+            candidate = f"{resolved}/{part}" if resolved else part
+            entry = self._entries.get(candidate)
+            if entry is None:
+                return None
+            if entry.kind == "symlink":
+                hops += 1
+                if hops > MAX_SYMLINK_DEPTH:
+                    return None
+                base = "" if entry.link.startswith("/") else resolved
+                target = _normalize(posixpath.join("/" + base, entry.link))
+                pending = [part for part in target.split("/") if part] + pending
+                resolved = ""
+                continue
+            resolved = candidate
+        return resolved
+
+    def entry(self, member: str) -> _Entry | None:
+        resolved = self.resolve(member)
+        return None if resolved is None else self._entries[resolved]
+
+    def children(self, member: str) -> list[str]:
+        resolved = self.resolve(member)
+        if resolved is None or resolved not in self._children:
+            return []
+        return sorted(self._children[resolved])
+
+
+class VirtualPath:
+    """A path inside a `VirtualFS`; `str()` is the archive path joined with the member path."""
+
+    __slots__ = ("fs", "member")
+
+    def __init__(self, fs: VirtualFS, member: str) -> None:
+        self.fs = fs
+        self.member = member
+
+    def __str__(self) -> str:
+        return f"{self.fs.source}/{self.member}" if self.member else str(self.fs.source)
+
+    def __repr__(self) -> str:
+        return f"VirtualPath({str(self)!r})"
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, VirtualPath) and other.fs is self.fs and other.member == self.member
+        )
+
+    def __hash__(self) -> int:
+        return hash((id(self.fs), self.member))
+
+    def __truediv__(self, other: str | PurePosixPath) -> VirtualPath:
+        return self.joinpath(other)
+
+    def joinpath(self, *others: str | PurePosixPath) -> VirtualPath:
+        member = self.member
+        for other in others:
+            text = str(other)
+            member = _normalize(text if text.startswith("/") else posixpath.join(member, text))
+        return VirtualPath(self.fs, member)
+
+    @property
+    def member_path(self) -> PurePosixPath:
+        """Where this path lives inside the image or archive, as an absolute posix path."""
+        return PurePosixPath("/" + self.member)
+
+    @property
+    def name(self) -> str:
+        return self.member.rpartition("/")[2]
+
+    @property
+    def suffix(self) -> str:
+        return PurePosixPath(self.name).suffix if self.name else ""
+
+    @property
+    def stem(self) -> str:
+        return PurePosixPath(self.name).stem if self.name else ""
+
+    @property
+    def parent(self) -> VirtualPath:
+        return VirtualPath(self.fs, self.member.rpartition("/")[0])
+
+    def expanduser(self) -> VirtualPath:
+        return self
+
+    def resolve(self) -> VirtualPath:
+        resolved = self.fs.resolve(self.member)
+        return self if resolved is None else VirtualPath(self.fs, resolved)
+
+    def is_absolute(self) -> bool:
+        return True
+
+    def relative_to(self, other: VirtualPath) -> PurePosixPath:
+        return self.member_path.relative_to(other.member_path)
+
+    def as_posix(self) -> str:
+        return str(self)
+
+    def exists(self) -> bool:
+        return self.fs.entry(self.member) is not None
+
+    def is_file(self) -> bool:
+        entry = self.fs.entry(self.member)
+        return entry is not None and entry.kind == "file"
+
+    def is_dir(self) -> bool:
+        entry = self.fs.entry(self.member)
+        return entry is not None and entry.kind == "dir"
+
+    def stat(self) -> VirtualStat:
+        entry = self.fs.entry(self.member)
+        if entry is None:
+            raise FileNotFoundError(str(self))
+        mode = stat_module.S_IFDIR if entry.kind == "dir" else stat_module.S_IFREG
+        return VirtualStat(st_size=entry.size, st_mtime_ns=entry.mtime_ns, st_mode=mode)
+
+    def read_bytes(self) -> bytes:
+        entry = self.fs.entry(self.member)
+        if entry is None:
+            raise FileNotFoundError(str(self))
+        if entry.kind != "file":
+            raise IsADirectoryError(str(self))
+        if entry.data is not None:
+            return entry.data
+        if entry.loader is not None:
+            return entry.loader()
+        raise OSError(f"{self}: archive member was not retained")
+
+    def read_text(self, encoding: str = "utf-8", errors: str = "strict") -> str:
+        return self.read_bytes().decode(encoding, errors)
+
+    def iterdir(self) -> Iterator[VirtualPath]:
+        for name in self.fs.children(self.member):
+            yield self / name
+
+    def walk(self) -> Iterator[tuple[VirtualPath, list[str], list[str]]]:
+        """Top-down like `os.walk`; prune by editing the yielded dirnames in place."""
+        dirnames: list[str] = []
+        filenames: list[str] = []
+        for child in self.iterdir():
+            if child.is_dir():
+                dirnames.append(child.name)
+            elif child.is_file():
+                filenames.append(child.name)
+        yield self, dirnames, filenames
+        for name in dirnames:
+            yield from (self / name).walk()
+
+    def glob(self, pattern: str) -> Iterator[VirtualPath]:
+        segments = [segment for segment in pattern.split("/") if segment]
+        yield from self._glob(segments)
+
+    def _glob(self, segments: list[str]) -> Iterator[VirtualPath]:
+        if not segments:
+            yield self
+            return
+        head, rest = segments[0], segments[1:]
+        if head == "**":
+            seen: set[str] = set()
+            for match in self._glob(rest):
+                seen.add(match.member)
+                yield match
+            for child in self.iterdir():
+                if child.is_dir():
+                    for match in child._glob(segments):
+                        if match.member not in seen:
+                            seen.add(match.member)
+                            yield match
+            return
+        for child in self.iterdir():
+            if fnmatch.fnmatchcase(child.name, head):
+                yield from child._glob(rest)
+
+
+# Archive loaders
+
+
+def is_archive(path: Path) -> bool:
+    if path.is_dir():
+        return (path / OCI_LAYOUT_FILE).is_file()
+    return path.is_file() and path.name.lower().endswith(ARCHIVE_SUFFIXES)
+
+
+def split_archive_path(path: Path) -> tuple[Path, str] | None:
+    """Split `image.tar/app/.openclaw` into the archive and the member path inside it.
+
+    Like zipimport paths, the archive is the longest existing prefix; None when `path` does not
+    point into an archive.
+    """
+    candidate = path
+    inner: list[str] = []
+    while not candidate.exists():
+        if candidate.parent == candidate:
+            return None
+        inner.append(candidate.name)
+        candidate = candidate.parent
+    if not is_archive(candidate):
+        return None
+    return candidate, "/".join(reversed(inner))
+
+
+def open_archive(
+    path: Path, retain: Callable[[str, int], bool] = retain_member
+) -> VirtualFS:
+    """Index a tar/zip archive or OCI image layout directory into a `VirtualFS`."""
+    if path.is_dir():
+        return _open_oci_layout(path, retain)
+    if path.name.lower().endswith(".zip"):
+        return _open_zip(path)
+    fs = VirtualFS(path)
+    with path.open("rb") as stream:
+        _apply_tar_layer(fs, stream, retain, whiteouts=False)
+    return fs
+
+
+def _open_zip(path: Path) -> VirtualFS:
+    import zipfile
+
+    fs = VirtualFS(path)
+    try:
+        archive = zipfile.ZipFile(path)
+    except zipfile.BadZipFile as error:
+        raise ValueError(f"Invalid zip archive: {path}") from error
+    fs._closers.append(archive.close)
+    for info in archive.infolist():
+        if info.is_dir():
+            fs.add(info.filename, _Entry("dir"))
+            continue
+        mode = info.external_attr >> 16
+        if stat_module.S_ISLNK(mode):
+            fs.add(
+                info.filename, _Entry("symlink", link=archive.read(info).decode("utf-8", "replace"))
+            )
+            continue
+        fs.add(
+            info.filename,
+            _Entry(
+                "file",
+                size=info.file_size,
+                mtime_ns=_zip_mtime_ns(info.date_time),
+                loader=lambda info=info: archive.read(info),
+            ),
+        )
+    return fs
+
+
+def _zip_mtime_ns(date_time: tuple[int, int, int, int, int, int]) -> int:
+    from datetime import datetime, timezone
+
+    try:
+        return int(datetime(*date_time, tzinfo=timezone.utc).timestamp()) * 1_000_000_000
+    except ValueError:
+        return 0
+
+
+def _apply_tar_layer(
+    fs: VirtualFS, stream: IO[bytes], retain: Callable[[str, int], bool], whiteouts: bool
+) -> None:
+    """Stream one tar (any compression) into `fs`.
+
+    With `whiteouts` (OCI layers) `.wh.<name>` members delete `<name>` from lower layers and
+    `.wh..wh..opq` empties its directory first; both are applied before the layer's own members
+    so a layer can recreate what it hides.
+    """
+    import tarfile
+
+    deletions: list[str] = []
+    opaque: list[str] = []
+    additions: list[tuple[str, _Entry]] = []
+    try:
+        with tarfile.open(fileobj=stream, mode="r|*") as archive:
+            for info in archive:
+                member = _normalize(info.name)
+                parent, _, base = member.rpartition("/")
+                if whiteouts and base == OPAQUE_WHITEOUT:
+                    opaque.append(parent)
+                    continue
+                if whiteouts and base.startswith(WHITEOUT_PREFIX):
+                    deletions.append(f"{parent}/{base[len(WHITEOUT_PREFIX):]}".lstrip("/"))
+                    continue
+                mtime_ns = int(info.mtime) * 1_000_000_000
+                if info.isdir():
+                    additions.append((member, _Entry("dir", mtime_ns=mtime_ns)))
+                elif info.issym():
+                    additions.append((member, _Entry("symlink", link=info.linkname)))
+                elif info.islnk():
+                    additions.append(
+                        (member, _Entry("symlink", link="/" + _normalize(info.linkname)))
+                    )
+                elif info.isfile():
+                    data = None
+                    if retain(member, info.size):
+                        extracted = archive.extractfile(info)
+                        data = extracted.read() if extracted is not None else None
+                    additions.append(
+                        (member, _Entry("file", size=info.size, mtime_ns=mtime_ns, data=data))
+                    )
+    except tarfile.TarError as error:
+        raise ValueError(f"Invalid tar archive: {fs.source}: {error}") from error
+
+    for directory in opaque:
+        fs.clear_dir(directory)
+    for member in deletions:
+        fs.remove(member)
+    for member, entry in additions:
+        fs.add(member, entry)
+
+
+def _read_blob(layout: Path, descriptor: dict[str, Any]) -> Path:
+    algorithm, _, digest = str(descriptor.get("digest", "")).partition(":")
+    if not algorithm or not digest or "/" in algorithm or "/" in digest:
+        raise ValueError(f"Invalid OCI descriptor digest in {layout}")
+    blob = layout / "blobs" / algorithm / digest
+    if not blob.is_file():
+        raise ValueError(f"Missing OCI blob {algorithm}:{digest} in {layout}")
+    return blob
+
+
+def _image_manifest(layout: Path) -> dict[str, Any]:
+    """First image manifest of the layout's index, following nested indexes."""
+    try:
+        document = json.loads((layout / "index.json").read_text(encoding="utf-8"))
+        while "layers" not in document:
+            manifests = document.get("manifests") or []
+            if not manifests:
+                raise ValueError(f"OCI image layout has no manifests: {layout}")
+            document = json.loads(_read_blob(layout, manifests[0]).read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as error:
+        raise ValueError(f"Invalid OCI image layout: {layout}: {error}") from error
+    return document
+
+
+def _open_oci_layout(layout: Path, retain: Callable[[str, int], bool]) -> VirtualFS:
+    fs = VirtualFS(layout)
+    for descriptor in _image_manifest(layout).get("layers", []):
+        media_type = str(descriptor.get("mediaType", ""))
+        if media_type not in _LAYER_MEDIA_TYPES:
+            raise ValueError(f"Unsupported OCI layer media type: {media_type}")
+        with _read_blob(layout, descriptor).open("rb") as stream:
+            _apply_tar_layer(fs, stream, retain, whiteouts=True)
+    return fs
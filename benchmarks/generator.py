@@ -0,0 +1,198 @@
+"""Synthetic agent roots for benchmarking `Scanner.scan_path` on realistic trees."""
+
+from __future__ import annotations
+
+import json
+import random
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+ADAPTERS = ("openclaw", "nanobot", "claude_code", "codex", "mcp_generic")
+
+_PERMISSIONS = [
+    "filesystem.read",
+    "filesystem.write",
+    "network",
+    "network.*",
+    "process.spawn",
+    "shell",
+    "exec",
+    "clipboard",
+]
+_FILLER_SUFFIXES = (".py", ".md", ".txt", ".json", ".ts")
+
+
+@dataclass(slots=True)
+class TreeSpec:
+    adapter: str = "openclaw"
+    depth: int = 3
+    files: int = 50
+    json_kb: int = 4
+    skills: int = 10
+    endpoints: int = 10
+    allow_paths: int = 10
+    seed: int = 0
+
+    def label(self) -> str:
+        return (
+            f"{self.adapter}/d{self.depth}-f{self.files}-j{self.json_kb}k"
+            f"-s{self.skills}-e{self.endpoints}-a{self.allow_paths}"
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def generate_agent_root(root: Path, spec: TreeSpec) -> Path:
+    """Write a synthetic agent root for `spec.adapter` under `root` and return it."""
+    if spec.adapter not in ADAPTERS:
+        raise ValueError(f"Unknown adapter {spec.adapter!r}; expected one of {', '.join(ADAPTERS)}")
+    rng = random.Random(spec.seed)
+    root.mkdir(parents=True, exist_ok=True)
+    _write_filler(root, spec, rng)
+    _WRITERS[spec.adapter](root, spec, rng)
+    return root
+
+
+def _write_filler(root: Path, spec: TreeSpec, rng: random.Random) -> None:
+    # Spread plain project files over a directory chain `depth` levels deep; fuzzy detection
+    # globs walk all of them.
+    directories = [root]
+    current = root
+    for level in range(spec.depth):
+        current = current / f"pkg{level}"
+        current.mkdir(exist_ok=True)
+        directories.append(current)
+    for index in range(spec.files):
+        suffix = _FILLER_SUFFIXES[index % len(_FILLER_SUFFIXES)]
+        target = directories[index % len(directories)] / f"file{index}{suffix}"
+        if suffix == ".json":
+            target.write_text(
+                json.dumps({"name": f"file{index}", "value": rng.random()}), encoding="utf-8"
+            )
+        else:
+            target.write_text(f"# filler {index}\n" * 4, encoding="utf-8")
+
+
+def _endpoints(spec: TreeSpec, rng: random.Random) -> list[str]:
+    hosts = ["api.openai.com", "api.anthropic.com", "api.github.com", "pastebin.com", "10.0.0.5"]
+    return [
+        f"https://{rng.choice(hosts) if index % 3 else f'svc{index}.example.com'}/v{index % 3}"
+        for index in range(spec.endpoints)
+    ]
+
+
+def _allow_paths(spec: TreeSpec) -> list[str]:
+    return [
+        f"./pkg0/area{index}" if index % 5 else f"/srv/shared/{index}"
+        for index in range(spec.allow_paths)
+    ]
+
+
+def _skills(spec: TreeSpec, rng: random.Random) -> list[dict[str, Any]]:
+    return [
+        {"name": f"skill-{index}", "permissions": rng.sample(_PERMISSIONS, k=1 + index % 3)}
+        for index in range(spec.skills)
+    ]
+
+
+def _padding(spec: TreeSpec) -> dict[str, str]:
+    # Inert keys that bring the config file to roughly `json_kb` kilobytes.
+    chunk = "x" * 1000
+    return {f"note{index}": chunk for index in range(spec.json_kb)}
+
+
+def _mcp_servers(spec: TreeSpec) -> dict[str, Any]:
+    return {
+        f"server{index}": {"command": "npx", "args": ["-y", f"@scope/server-{index}"]}
+        for index in range(max(1, spec.endpoints // 4))
+    }
+
+
+def _dump(path: Path, payload: Any) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+
+
+def _write_openclaw(root: Path, spec: TreeSpec, rng: random.Random) -> None:
+    _dump(
+        root / "openclaw.json",
+        {
+            "version": "2.3.1",
+            "allowedPaths": _allow_paths(spec),
+            "blockedPaths": ["~/.ssh"],
+            "permissions": {"shell": "filtered"},
+            "endpoints": _endpoints(spec, rng),
+            "env": ["OPENAI_API_KEY"],
+            **_padding(spec),
+        },
+    )
+    _dump(root / "skills.json", {"skills": _skills(spec, rng)})
+
+
+def _write_nanobot(root: Path, spec: TreeSpec, rng: random.Random) -> None:
+    _dump(
+        root / "nanobot.json",
+        {
+            "agent": "nanobot",
+            "version": "0.4.0",
+            "allowed_paths": _allow_paths(spec),
+            "permissions": {"shell": "restricted"},
+            "endpoints": _endpoints(spec, rng),
+            **_padding(spec),
+        },
+    )
+    _dump(root / "nanobot-skills.json", {"skills": _skills(spec, rng)})
+
+
+def _write_claude_code(root: Path, spec: TreeSpec, rng: random.Random) -> None:
+    _dump(
+        root / ".claude" / "settings.json",
+        {
+            "version": "1.0.0",
+            "permissions": {"allow": _allow_paths(spec), "deny": ["~/.aws"], "shell": "allowlist"},
+            "mcpServers": _mcp_servers(spec),
+            "env": ["ANTHROPIC_API_KEY"],
+            **_padding(spec),
+        },
+    )
+    _dump(root / ".claude" / "skills.json", {"skills": _skills(spec, rng)})
+
+
+def _write_codex(root: Path, spec: TreeSpec, rng: random.Random) -> None:
+    lines = [
+        'version = "0.1.0"',
+        f"endpoints = {json.dumps(_endpoints(spec, rng))}",
+        'env = ["OPENAI_API_KEY"]',
+        *(f'{key} = "{value}"' for key, value in _padding(spec).items()),
+        "",
+        "[permissions]",
+        f"allowed_paths = {json.dumps(_allow_paths(spec))}",
+        'blocked_paths = ["~/.ssh"]',
+        'shell = "filtered"',
+    ]
+    (root / ".codex").mkdir(exist_ok=True)
+    (root / ".codex" / "config.toml").write_text("\n".join(lines) + "\n", encoding="utf-8")
+    _dump(root / ".codex" / "skills.json", {"skills": _skills(spec, rng)})
+
+
+def _write_mcp_generic(root: Path, spec: TreeSpec, rng: random.Random) -> None:
+    _dump(
+        root / "mcp.json",
+        {
+            "version": "1",
+            "allowedPaths": _allow_paths(spec),
+            "mcpServers": _mcp_servers(spec),
+            **_padding(spec),
+        },
+    )
+
+
+_WRITERS = {
+    "openclaw": _write_openclaw,
+    "nanobot": _write_nanobot,
+    "claude_code": _write_claude_code,
+    "codex": _write_codex,
+    "mcp_generic": _write_mcp_generic,
+}
@@ -0,0 +1,46 @@
+"""Endpoint classification benchmark.
+
+Classifies a fleet of hostnames (subdomains of an allowed API domain) and private addresses
+through `NetworkClassifier.classify` and exits non-zero when it exceeds the time budget.
+
+    python -m benchmarks.network [--endpoints 100000] [--budget-ms 1000]
+"""
+
+from __future__ import annotations
+
+import argparse
+from time import perf_counter
+
+from agent_audit.utils.netclass import NetworkClassifier
+
+RULES = {"domains": {"allow": ["api.openai.com"]}, "networks": {"private": ["10.0.0.0/8"]}}
+
+
+def fleet_endpoints(count: int) -> list[str]:
+    half = count // 2
+    endpoints = [f"https://svc{i % 5000}.eu.api.openai.com/v1" for i in range(half)]
+    endpoints += [f"10.{i % 250}.{i % 200}.{i % 100}:443" for i in range(count - half)]
+    return endpoints
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--endpoints", type=int, default=100_000)
+    parser.add_argument("--budget-ms", type=float, default=1000.0)
+    args = parser.parse_args(argv)
+
+    classifier = NetworkClassifier.from_rules(RULES)
+    endpoints = fleet_endpoints(args.endpoints)
+    started = perf_counter()
+    for endpoint in endpoints:
+        classifier.classify(endpoint)
+    elapsed_ms = (perf_counter() - started) * 1000
+    over = elapsed_ms > args.budget_ms
+    rate = len(endpoints) / (elapsed_ms / 1000)
+    print(f"classify {len(endpoints):,} endpoints {elapsed_ms:9.1f} ms  {rate:12,.0f} endpoints/s")
+    print(f"budget {args.budget_ms:.0f} ms: {'OVER' if over else 'ok'}")
+    return 1 if over else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,183 @@
+"""Scanner benchmark over synthetic agent roots.
+
+Generates one tree per adapter and size profile, runs `Scanner.scan_path` under a scan profile
+and compares the per-stage medians with a stored baseline.
+
+    python -m benchmarks.scanner                      # run and compare with baseline.json
+    python -m benchmarks.scanner --update-baseline    # record a new baseline
+    python -m benchmarks.scanner --profile small --adapter codex --iterations 20
+
+Each case also records `calibration_ms`, the median time of a fixed pure-Python workload on the
+machine that ran it. Baseline stages are scaled by the ratio of the two calibrations before they
+are compared, so a baseline recorded on a faster or slower machine still applies. Regenerate the
+baseline with `--update-baseline` after intentional changes to the scan pipeline.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import tempfile
+from collections import defaultdict
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+from agent_audit.core.scanner import Scanner
+from agent_audit.utils.profiling import ScanProfile, profiling
+from benchmarks.generator import ADAPTERS, TreeSpec, generate_agent_root
+
+BASELINE_PATH = Path(__file__).resolve().parent / "baseline.json"
+
+# A stage regresses when its median exceeds the (calibrated) baseline by this factor and by at
+# least MIN_REGRESSION_MS, so sub-millisecond jitter is not reported.
+DEFAULT_THRESHOLD = 1.5
+MIN_REGRESSION_MS = 0.2
+CALIBRATION_ROUNDS = 5
+
+PROFILES: dict[str, dict[str, int]] = {
+    "small": {
+        "depth": 2,
+        "files": 20,
+        "json_kb": 2,
+        "skills": 5,
+        "endpoints": 5,
+        "allow_paths": 5,
+    },
+    "large": {
+        "depth": 6,
+        "files": 2000,
+        "json_kb": 256,
+        "skills": 500,
+        "endpoints": 300,
+        "allow_paths": 300,
+    },
+}
+
+
+def calibrate(rounds: int = CALIBRATION_ROUNDS) -> float:
+    """Median milliseconds of a fixed workload of dict, str and sort operations."""
+    samples: list[float] = []
+    for _ in range(rounds):
+        started = perf_counter()
+        index: dict[str, int] = {}
+        for number in range(50_000):
+            key = f"/work/project/file{number % 997}/{number}.json"
+            index[key] = len(key.split("/"))
+        sorted(index, key=index.__getitem__)
+        samples.append((perf_counter() - started) * 1000.0)
+    return round(statistics.median(samples), 4)
+
+
+def timed_scan(path: Path) -> dict[str, float]:
+    """Run `Scanner.scan_path` on `path`, returning wall milliseconds per profiled stage."""
+    # A fresh scanner, and with it an empty in-memory skill cache, per scan times the
+    # uncached skill content analysis.
+    scanner = Scanner()
+    profile = ScanProfile()
+    started = perf_counter()
+    with profiling(profile):
+        scanner.scan_path(path)
+    timings = {name: timing.wall_s * 1000.0 for name, timing in profile.stages.items()}
+    timings["total"] = (perf_counter() - started) * 1000.0
+    return timings
+
+
+def bench_case(root: Path, spec: TreeSpec, iterations: int) -> dict[str, Any]:
+    target = generate_agent_root(root / spec.label().replace("/", "_"), spec)
+    timed_scan(target)  # warm-up: imports, compiled rules, OS page cache
+    samples: dict[str, list[float]] = defaultdict(list)
+    for _ in range(iterations):
+        for stage, value in timed_scan(target).items():
+            samples[stage].append(value)
+    medians = {stage: round(statistics.median(values), 4) for stage, values in samples.items()}
+    return {
+        "spec": spec.to_dict(),
+        "calibration_ms": calibrate(),
+        "stages_ms": medians,
+        "scans_per_second": round(1000.0 / medians["total"], 1) if medians["total"] else None,
+    }
+
+
+def run(profiles: list[str], adapters: list[str], iterations: int) -> dict[str, dict[str, Any]]:
+    report: dict[str, dict[str, Any]] = {}
+    with tempfile.TemporaryDirectory(prefix="agent-audit-bench-") as tmp:
+        for profile in profiles:
+            for adapter in adapters:
+                spec = TreeSpec(adapter=adapter, **PROFILES[profile])
+                report[f"{profile}/{adapter}"] = bench_case(Path(tmp), spec, iterations)
+    return report
+
+
+def regressions(
+    report: dict[str, dict[str, Any]],
+    baseline: dict[str, dict[str, Any]],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> list[str]:
+    found: list[str] = []
+    for case, result in report.items():
+        recorded = baseline.get(case, {})
+        expected = recorded.get("stages_ms", {})
+        scale = 1.0
+        if recorded.get("calibration_ms") and result.get("calibration_ms"):
+            scale = result["calibration_ms"] / recorded["calibration_ms"]
+        for stage, value in result["stages_ms"].items():
+            reference = expected.get(stage)
+            if reference is None:
+                continue
+            reference *= scale
+            if value > reference * threshold and value - reference > MIN_REGRESSION_MS:
+                found.append(f"{case} {stage}: {value:.2f} ms vs baseline {reference:.2f} ms")
+    return found
+
+
+def _print_report(report: dict[str, dict[str, Any]]) -> None:
+    for case, result in report.items():
+        stages = result["stages_ms"]
+        print(f"{case:<24} total={stages['total']:9.2f} ms  {result['scans_per_second']} scans/s")
+        for stage, value in stages.items():
+            if stage != "total":
+                print(f"    {stage:<24} {value:9.3f} ms")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--profile", action="append", choices=sorted(PROFILES))
+    parser.add_argument("--adapter", action="append", choices=ADAPTERS)
+    parser.add_argument("--iterations", type=int, default=10)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args(argv)
+
+    report = run(args.profile or sorted(PROFILES), args.adapter or list(ADAPTERS), args.iterations)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        _print_report(report)
+
+    if args.update_baseline:
+        baseline = {}
+        if args.baseline.exists():
+            baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        baseline.update(report)
+        args.baseline.write_text(
+            json.dumps(baseline, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+        )
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}; run with --update-baseline to record one.")
+        return 0
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    found = regressions(report, baseline, args.threshold)
+    for line in found:
+        print(f"REGRESSION {line}")
+    return 1 if found else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,67 @@
+"""ScanResult serialization benchmark.
+
+Compares the previous `dataclasses.asdict` based `to_dict()` with the direct serializer, JSON
+round-trips and the compact binary archive.
+
+    python -m benchmarks.serialization [--results 20000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from dataclasses import asdict
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+from agent_audit.core.scanner import Scanner
+from agent_audit.core.serialize import decode_results, encode_results
+from agent_audit.types import ScanResult
+
+FIXTURES = Path(__file__).resolve().parent.parent / "tests" / "fixtures"
+
+
+def asdict_payload(result: ScanResult) -> dict[str, Any]:
+    # The pre-schema-version implementation of ScanResult.to_dict().
+    payload = asdict(result)
+    payload["checks"] = {key: asdict(check) for key, check in result.checks.items()}
+    return payload
+
+
+def _timed(label: str, func: Any, count: int) -> Any:
+    started = perf_counter()
+    value = func()
+    elapsed = perf_counter() - started
+    print(f"{label:<26} {elapsed * 1000:9.1f} ms  {count / elapsed:12,.0f} results/s")
+    return value
+
+
+def run(count: int) -> None:
+    scanner = Scanner()
+    samples = [scanner.scan_path(FIXTURES / name) for name in ("openclaw_basic", "codex_scoped")]
+    results = [samples[index % len(samples)] for index in range(count)]
+
+    _timed("to_dict (asdict)", lambda: [asdict_payload(result) for result in results], count)
+    payloads = _timed("to_dict (direct)", lambda: [result.to_dict() for result in results], count)
+    text = _timed("json.dumps", lambda: "\n".join(json.dumps(item) for item in payloads), count)
+    _timed(
+        "json.loads + from_dict",
+        lambda: [ScanResult.from_dict(json.loads(line)) for line in text.splitlines()],
+        count,
+    )
+    blob = _timed("encode_results (binary)", lambda: encode_results(results), count)
+    _timed("decode_results (binary)", lambda: decode_results(blob), count)
+    print(f"size: ndjson={len(text.encode()):,} bytes  binary={len(blob):,} bytes")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--results", type=int, default=20_000)
+    args = parser.parse_args(argv)
+    run(args.results)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
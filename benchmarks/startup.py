@@ -0,0 +1,116 @@
+"""CLI startup benchmark.
+
+Runs representative `agent-audit` invocations under `python -X importtime`, reports the
+total import time and fails when it exceeds the budget or when a command pulls in a module
+it should not need.
+
+    python -m benchmarks.startup [--budget-ms 120] [--runs 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+FIXTURE = REPO_ROOT / "tests" / "fixtures" / "openclaw_basic"
+
+DEFAULT_BUDGET_MS = 120.0
+
+# Modules each command must not import. rich is only needed for table output, the monitor
+# only for `monitor`, the result types only for commands that scan, the virtual filesystem
+# only for archive targets and tempfile only for the on-disk skill cache.
+COMMANDS: dict[str, tuple[list[str], set[str]]] = {
+    "version": (
+        ["version"],
+        {"rich", "agent_audit.core.monitor", "agent_audit.core.scanner", "agent_audit.types"},
+    ),
+    "scan-json": (
+        ["scan", str(FIXTURE), "--format", "json"],
+        {"rich", "agent_audit.core.monitor", "agent_audit.utils.vfs", "tempfile"},
+    ),
+}
+
+
+@dataclass(slots=True)
+class StartupSample:
+    command: str
+    import_ms: float
+    modules: set[str] = field(default_factory=set)
+
+
+def parse_importtime(stderr: str) -> tuple[float, set[str]]:
+    """Return (total import time in ms, imported module names) from `-X importtime` output."""
+    total_us = 0
+    modules: set[str] = set()
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:") :].split("|")
+        if len(parts) != 3:
+            continue
+        self_us, _cumulative, name = parts
+        try:
+            total_us += int(self_us.strip())
+        except ValueError:
+            # Header row: "self [us] | cumulative | imported package".
+            continue
+        modules.add(name.strip())
+    return total_us / 1000.0, modules
+
+
+def measure(command: str, argv: list[str]) -> StartupSample:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(REPO_ROOT), env.get("PYTHONPATH")]))
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "agent_audit", *argv],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=False,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"agent-audit {' '.join(argv)} failed: {completed.stderr[-500:]}")
+    import_ms, modules = parse_importtime(completed.stderr)
+    return StartupSample(command=command, import_ms=import_ms, modules=modules)
+
+
+def forbidden_imports(sample: StartupSample, forbidden: set[str]) -> set[str]:
+    return {
+        module
+        for module in sample.modules
+        if any(module == name or module.startswith(f"{name}.") for name in forbidden)
+    }
+
+
+def run(budget_ms: float = DEFAULT_BUDGET_MS, runs: int = 5) -> bool:
+    ok = True
+    for command, (argv, forbidden) in COMMANDS.items():
+        samples = [measure(command, argv) for _ in range(runs)]
+        best = min(samples, key=lambda sample: sample.import_ms)
+        leaked = sorted(forbidden_imports(best, forbidden))
+        status = "ok"
+        if best.import_ms > budget_ms:
+            status = "OVER BUDGET"
+            ok = False
+        if leaked:
+            status = f"unexpected imports: {', '.join(leaked)}"
+            ok = False
+        print(f"{command:<10} import={best.import_ms:7.1f} ms budget={budget_ms:.0f} ms  {status}")
+    return ok
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args(argv)
+    return 0 if run(budget_ms=args.budget_ms, runs=args.runs) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import subprocess
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from agent_audit.core.risk import calculate_risk_score, risk_tier
+from agent_audit.core.scanner import Scanner
+from agent_audit.types import CheckResult, ScanResult
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture
+def make_result() -> Callable[..., ScanResult]:
+    """Builds a synthetic `ScanResult`; score and tier follow the checks unless given."""
+
+    def build(
+        path: str,
+        *checks: CheckResult,
+        agent_name: str = "Codex",
+        score: float | None = None,
+        tier: str | None = None,
+        generated_at: str | None = None,
+    ) -> ScanResult:
+        by_key = {check.key: check for check in checks}
+        if score is None:
+            score = calculate_risk_score(by_key)
+        extra = {} if generated_at is None else {"generated_at": generated_at}
+        return ScanResult(
+            agent_name=agent_name,
+            agent_version="1",
+            adapter_name="codex",
+            scanned_path=path,
+            checks=by_key,
+            risk_score=score,
+            risk_tier=tier or risk_tier(score),
+            **extra,
+        )
+
+    return build
+
+
+@pytest.fixture
+def openclaw_result() -> ScanResult:
+    return Scanner().scan_path(FIXTURES / "openclaw_basic")
+
+
+@pytest.fixture
+def comparable() -> Callable[[ScanResult], dict[str, Any]]:
+    """Projects a result onto what two scans of the same agent must share."""
+
+    def project(result: ScanResult) -> dict[str, Any]:
+        payload = result.to_dict()
+        payload.pop("generated_at")
+        payload.pop("scanned_path")
+        return payload
+
+    return project
+
+
+@pytest.fixture
+def git() -> Callable[..., str]:
+    """Runs git in a repository with a fixed test identity and returns its stdout."""
+
+    def run(repo: Path, *args: str) -> str:
+        completed = subprocess.run(
+            ["git", "-C", str(repo), "-c", "user.name=t", "-c", "user.email=t@example.com", *args],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        return completed.stdout
+
+    return run
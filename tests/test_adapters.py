@@ -1,6 +1,10 @@
+import json
+import sys
 from pathlib import Path
 
 from agent_audit.adapters import detect_adapter
+from agent_audit.adapters.helpers import extract_endpoints
+from agent_audit.checks.network import evaluate_network
 
 
 FIXTURES = Path(__file__).parent / "fixtures"
@@ -14,3 +18,45 @@ def test_detects_openclaw_fixture() -> None:
 def test_detects_codex_fixture() -> None:
     adapter = detect_adapter(FIXTURES / "codex_scoped")
     assert adapter.name == "codex"
+
+
+def test_extract_endpoints_skips_command_words_and_tags_paths() -> None:
+    servers = {
+        "github": {
+            "command": "npx",
+            "args": ["-y", "@scope/server", "--port", "3000", "--api=https://api.github.com/v3,"],
+            "env": {"BASE_URL": "http://10.0.0.5:8080/x", "DEBUG": "1"},
+        },
+        "remote": {"url": "https://mcp.example.com/sse"},
+    }
+    endpoints = extract_endpoints(servers, "mcpServers")
+    assert [(e.value, e.path, e.origin) for e in endpoints] == [
+        ("https://api.github.com/v3", "mcpServers.github.args[4]", "command"),
+        ("http://10.0.0.5:8080/x", "mcpServers.github.env.BASE_URL", "env"),
+        ("https://mcp.example.com/sse", "mcpServers.remote.url", "url"),
+    ]
+
+
+def test_extract_endpoints_keeps_bare_hosts_and_wildcards() -> None:
+    values = ["*", "api.openai.com", "0.0.0.0:8080", "[::1]:80", "2.3.1", "stdio"]
+    endpoints = extract_endpoints({"allow list": values}, "network")
+    assert [e.value for e in endpoints] == ["*", "api.openai.com", "0.0.0.0:8080", "[::1]:80"]
+    assert endpoints[1].path == 'network["allow list"][1]'
+
+
+def test_extract_endpoints_handles_deep_nesting() -> None:
+    tree: object = "https://deep.example.com"
+    for _ in range(sys.getrecursionlimit() * 2):
+        tree = {"next": [tree]}
+    (endpoint,) = extract_endpoints(tree, "endpoints")
+    assert endpoint.value == "https://deep.example.com"
+    assert endpoint.path.endswith(".next[0]")
+
+
+def test_mcp_command_servers_report_no_endpoints(tmp_path: Path) -> None:
+    servers = {"fs": {"command": "npx", "args": ["-y", "@scope/fs", "--port", "8080"]}}
+    (tmp_path / "mcp.json").write_text(json.dumps({"mcpServers": servers}), encoding="utf-8")
+    config = detect_adapter(tmp_path).get_config(tmp_path)
+    assert config.endpoints == []
+    result = evaluate_network(config.endpoint_sources)
+    assert result.details == []
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import asyncio
+import shutil
+import threading
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from agent_audit.core.async_scan import scan_many_async, scan_path_async
+from agent_audit.core.scanner import Scanner
+from agent_audit.types import ScanResult
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+class SlowScanner(Scanner):
+    def __init__(self, delay: float, slow: set[str] | None = None) -> None:
+        super().__init__()
+        self.delay = delay
+        self.slow = slow
+        self.lock = threading.Lock()
+        self.release = threading.Event()  # set to end slow scans before their delay elapses
+        self.running = 0
+        self.peak = 0
+
+    def scan_path(self, path: str | Path) -> ScanResult:
+        with self.lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        try:
+            if self.slow is None or Path(path).name in self.slow:
+                self.release.wait(self.delay)
+            return super().scan_path(path)
+        finally:
+            with self.lock:
+                self.running -= 1
+
+
+def test_scan_path_async_matches_sync_result(
+    comparable: Callable[[ScanResult], dict],
+) -> None:
+    scanner = Scanner()
+    result = asyncio.run(scan_path_async(FIXTURES / "openclaw_basic", scanner))
+    assert isinstance(result, ScanResult)
+    assert comparable(result) == comparable(scanner.scan_path(FIXTURES / "openclaw_basic"))
+
+
+def test_event_loop_stays_responsive_during_scan() -> None:
+    async def run() -> int:
+        ticks = 0
+
+        async def ticker() -> None:
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        task = asyncio.create_task(ticker())
+        await scan_path_async(FIXTURES / "codex_scoped", SlowScanner(0.2))
+        task.cancel()
+        return ticks
+
+    assert asyncio.run(run()) >= 5
+
+
+def test_scan_many_async_orders_dedupes_and_limits_concurrency(tmp_path: Path) -> None:
+    scanner = SlowScanner(0.05)
+    openclaw = FIXTURES / "openclaw_basic"
+    codex = FIXTURES / "codex_scoped"
+    copy = shutil.copytree(codex, tmp_path / "codex_copy")
+    paths = [openclaw, codex, openclaw, copy]
+    results = asyncio.run(scan_many_async(paths, scanner, concurrency=2))
+    assert [result.adapter_name for result in results] == ["openclaw", "codex", "openclaw", "codex"]
+    assert results[0] is results[2]
+    assert scanner.peak == 2
+
+
+def test_timeout_and_errors_returned_in_place() -> None:
+    scanner = SlowScanner(60.0, slow={"codex_scoped"})
+    paths = [FIXTURES / "openclaw_basic", FIXTURES / "codex_scoped", "/tmp/aa-does-not-exist"]
+    try:
+        results = asyncio.run(scan_many_async(paths, scanner, timeout=0.1, return_exceptions=True))
+        # The timed-out scan is still blocked, so the results did not wait for it.
+        assert scanner.running == 1
+    finally:
+        scanner.release.set()
+    assert isinstance(results[0], ScanResult)
+    assert isinstance(results[1], TimeoutError) and "timed out" in str(results[1])
+    assert isinstance(results[2], ValueError)
+
+
+def test_first_failure_cancels_remaining_scans() -> None:
+    scanner = SlowScanner(0.2, slow={"openclaw_basic"})
+    paths = ["/tmp/aa-does-not-exist", FIXTURES / "openclaw_basic"]
+    with pytest.raises(ValueError, match="Could not detect"):
+        asyncio.run(scan_many_async(paths, scanner, concurrency=1))
+
+
+def test_cancelling_the_caller_stops_waiting() -> None:
+    scanner = SlowScanner(60.0)
+
+    async def run() -> None:
+        task = asyncio.create_task(scan_many_async([FIXTURES / "codex_scoped"], scanner))
+        while not scanner.running:
+            await asyncio.sleep(0.01)
+        task.cancel()
+        await task
+
+    try:
+        with pytest.raises(asyncio.CancelledError):
+            asyncio.run(run())
+        # The scan is still blocked, so cancellation did not wait for it.
+        assert scanner.running == 1
+    finally:
+        scanner.release.set()
+
+
+def test_concurrency_must_be_positive() -> None:
+    with pytest.raises(ValueError, match="concurrency"):
+        asyncio.run(scan_many_async([FIXTURES / "codex_scoped"], concurrency=0))
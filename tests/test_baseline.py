@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import json
+import shutil
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from agent_audit.cli import app
+from agent_audit.core.baseline import diff_results
+from agent_audit.core.scanner import Scanner
+from agent_audit.core.serialize import decode_results, encode_results
+from agent_audit.types import CheckResult, ScanResult
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def _shell_result(
+    path: str, details: list[str], severity: str = "medium", score: float = 5.0
+) -> ScanResult:
+    return ScanResult(
+        agent_name="Codex",
+        agent_version="1",
+        adapter_name="codex",
+        scanned_path=path,
+        checks={"shell": CheckResult("shell", "Shell", score, severity, "summary", details)},
+        risk_score=score,
+        risk_tier="MEDIUM",
+    )
+
+
+def test_fingerprints_are_stable_across_checkout_locations(tmp_path: Path) -> None:
+    first = shutil.copytree(FIXTURES / "openclaw_basic", tmp_path / "a" / "agent")
+    second = shutil.copytree(FIXTURES / "openclaw_basic", tmp_path / "b" / "agent")
+    scanner = Scanner()
+    left, right = scanner.scan_path(first), scanner.scan_path(second)
+    # Fingerprints are only computed once something serializes or diffs the result.
+    assert all(check.fingerprints == [] for check in left.checks.values())
+    for key, check in left.checks.items():
+        fingerprints = left.fingerprints_for(check)
+        assert len(fingerprints) == len(check.details)
+        assert fingerprints == right.fingerprints_for(right.checks[key])
+    assert left.checks["filesystem"].fingerprints != left.checks["shell"].fingerprints
+
+
+def test_repeated_details_get_distinct_fingerprints() -> None:
+    result = _shell_result("/x", ["same", "same", "other"])
+    fingerprints = result.fingerprints_for(result.checks["shell"])
+    assert len(set(fingerprints)) == 3
+
+
+def test_fingerprints_round_trip_through_json_and_archive() -> None:
+    result = Scanner().scan_path(FIXTURES / "codex_scoped")
+    expected = result.fingerprints_for(result.checks["shell"])
+    payload = result.to_dict()
+    assert payload["schema_version"] == 2
+    assert payload["checks"]["shell"]["fingerprints"] == expected
+    assert ScanResult.from_dict(payload).checks["shell"].fingerprints == expected
+    assert decode_results(encode_results([result]))[0].checks["shell"].fingerprints == expected
+
+    # Version 1 payloads carry no fingerprints; they are recomputed on demand.
+    payload["schema_version"] = 1
+    del payload["checks"]["shell"]["fingerprints"]
+    loaded = ScanResult.from_dict(payload)
+    assert loaded.checks == result.checks
+    assert loaded.fingerprints_for(loaded.checks["shell"]) == expected
+
+
+def test_diff_reports_added_removed_and_changed() -> None:
+    before = [_shell_result("/repo/a", ["keep", "drop"]), _shell_result("/repo/b", ["steady"])]
+    after = [
+        _shell_result("/repo/a", ["keep", "new"], severity="high", score=7.0),
+        _shell_result("/repo/b", ["steady"]),
+    ]
+    diff = diff_results(before, after)
+    assert [(finding.status, finding.detail) for finding in diff.findings] == [
+        ("changed", "keep"),
+        ("added", "new"),
+        ("removed", "drop"),
+    ]
+    assert diff.changed[0].previous_severity == "medium"
+    assert diff.score_delta == 2.0
+    assert diff.introduces_risk
+
+
+def test_diff_pairs_single_results_across_paths() -> None:
+    diff = diff_results(
+        [_shell_result("/ci/old/agent", ["x"])], [_shell_result("/ci/new/agent", ["x"])]
+    )
+    assert diff.findings == []
+    assert not diff.introduces_risk
+
+
+def test_diff_of_large_fleet_is_by_fingerprint() -> None:
+    before = [_shell_result(f"/fleet/{index}", [f"finding {index}"]) for index in range(5000)]
+    after = before[1:] + [_shell_result("/fleet/new", ["finding new"])]
+    diff = diff_results(before, after)
+    assert [(finding.status, finding.agent) for finding in diff.findings] == [
+        ("added", "/fleet/new"),
+        ("removed", "/fleet/0"),
+    ]
+
+
+def test_cli_baseline_exits_nonzero_only_on_new_risk(tmp_path: Path) -> None:
+    agent = shutil.copytree(FIXTURES / "codex_scoped", tmp_path / "agent")
+    runner = CliRunner()
+    saved = runner.invoke(app, ["scan", str(agent), "--format", "json"])
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(saved.stdout, encoding="utf-8")
+
+    unchanged = runner.invoke(app, ["scan", str(agent), "--baseline", str(baseline)])
+    assert unchanged.exit_code == 0
+    assert unchanged.stdout.strip() == "Score delta: +0.0 (0 added, 0 removed, 0 changed)"
+
+    config = agent / ".codex" / "config.toml"
+    config.write_text(
+        config.read_text(encoding="utf-8").replace('"./src"', '"/"'), encoding="utf-8"
+    )
+    worse = runner.invoke(
+        app, ["scan", str(agent), "--baseline", str(baseline), "--format", "json"]
+    )
+    assert worse.exit_code == 1
+    payload = json.loads(worse.stdout)
+    assert payload["introduces_risk"] is True
+    assert payload["score_delta"] > 0
+    assert any(
+        finding["detail"] == "Unrestricted path detected: /" for finding in payload["findings"]
+    )
+
+
+def test_cli_baseline_errors(tmp_path: Path) -> None:
+    runner = CliRunner()
+    missing = runner.invoke(
+        app, ["scan", str(FIXTURES / "codex_scoped"), "--baseline", str(tmp_path / "nope.json")]
+    )
+    assert missing.exit_code == 2
+    assert "Could not load baseline" in missing.stderr
+    streamed = runner.invoke(
+        app, ["scan", str(FIXTURES / "codex_scoped"), "--baseline", "x.json", "--format", "sarif"]
+    )
+    assert streamed.exit_code == 2
+
+
+def test_removing_a_skill_does_not_introduce_risk(tmp_path: Path) -> None:
+    agent = shutil.copytree(FIXTURES / "openclaw_basic", tmp_path / "agent")
+    scanner = Scanner()
+    before = scanner.scan_path(agent)
+    manifest = agent / "skills.json"
+    payload = json.loads(manifest.read_text(encoding="utf-8"))
+    payload["skills"] = [skill for skill in payload["skills"] if skill["name"] != "deploy-agent"]
+    manifest.write_text(json.dumps(payload), encoding="utf-8")
+
+    diff = diff_results([before], [scanner.scan_path(agent)])
+    assert diff.added == []
+    assert any("deploy-agent" in finding.detail for finding in diff.removed)
+    assert not any(finding.detail.startswith("Total installed skills") for finding in diff.findings)
+    assert diff.score_delta <= 0
+    assert not diff.introduces_risk
+
+
+def test_severity_rise_without_new_finding_is_reported() -> None:
+    before = [_shell_result("/repo/a", ["Configured endpoints: 1"], severity="low", score=2.0)]
+    after = [_shell_result("/repo/a", ["Configured endpoints: 2"], severity="medium", score=4.0)]
+    diff = diff_results(before, after)
+    assert [(finding.status, finding.fingerprint) for finding in diff.findings] == [("changed", "")]
+    assert diff.introduces_risk
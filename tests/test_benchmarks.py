@@ -0,0 +1,53 @@
+from pathlib import Path
+
+import pytest
+
+from agent_audit.adapters import detect_adapter
+from agent_audit.core.scanner import Scanner
+from benchmarks.generator import ADAPTERS, TreeSpec, generate_agent_root
+from benchmarks.monitor import bench_case as bench_monitor
+from benchmarks.scanner import regressions, timed_scan
+
+
+@pytest.mark.parametrize("adapter", ADAPTERS)
+def test_generated_roots_detect_as_their_adapter(tmp_path: Path, adapter: str) -> None:
+    spec = TreeSpec(adapter=adapter, depth=2, files=12, skills=3, endpoints=4, allow_paths=3)
+    root = generate_agent_root(tmp_path / adapter, spec)
+    assert detect_adapter(root).name == adapter
+    config = detect_adapter(root).get_config(root)
+    assert len(config.allowed_paths) == 3
+    assert len(list(root.rglob("file*"))) == 12
+
+
+def test_generated_skills_and_endpoints_follow_spec(tmp_path: Path) -> None:
+    spec = TreeSpec(adapter="openclaw", skills=7, endpoints=9)
+    result = Scanner().scan_path(generate_agent_root(tmp_path / "agent", spec))
+    assert "Total installed skills: 7" in result.checks["skills"].details
+    assert "Configured endpoints: 9" in result.checks["network"].details
+
+
+def test_timed_scan_reports_every_stage(tmp_path: Path) -> None:
+    timings = timed_scan(generate_agent_root(tmp_path / "agent", TreeSpec(adapter="codex")))
+    assert {"detect", "adapter.get_config", "check.secrets", "scoring", "total"} <= set(timings)
+
+
+def test_regressions_ignore_small_absolute_changes() -> None:
+    baseline = {"small/codex": {"stages_ms": {"detect": 0.1, "get_config": 10.0}}}
+    report = {"small/codex": {"stages_ms": {"detect": 0.25, "get_config": 20.0}}}
+    assert regressions(report, baseline) == [
+        "small/codex get_config: 20.00 ms vs baseline 10.00 ms"
+    ]
+
+
+def test_regressions_scale_baseline_by_calibration() -> None:
+    baseline = {"small/codex": {"calibration_ms": 10.0, "stages_ms": {"detect": 4.0}}}
+    slower_host = {"small/codex": {"calibration_ms": 20.0, "stages_ms": {"detect": 7.0}}}
+    assert regressions(slower_host, baseline) == []
+    same_host = {"small/codex": {"calibration_ms": 10.0, "stages_ms": {"detect": 7.0}}}
+    assert regressions(same_host, baseline) == ["small/codex detect: 7.00 ms vs baseline 4.00 ms"]
+
+
+def test_monitor_benchmark_counts_first_poll_events() -> None:
+    row = bench_monitor(50, ticks=2, churn=3)
+    # 49 EXEC + 50 * (4 files + 1 socket); the root's own exec is never reported.
+    assert row["first_poll_events"] == 49 + 50 * 5
@@ -26,8 +26,32 @@ def test_compare_json_output() -> None:
     )
     assert result.exit_code == 0
     payload = json.loads(result.stdout)
-    assert payload["left"]["name"] == "OpenClaw"
-    assert payload["right"]["name"] == "Codex"
+    assert payload["agents"][0]["name"] == "OpenClaw"
+    assert payload["agents"][1]["name"] == "Codex"
+
+
+def test_compare_markdown_has_column_per_path() -> None:
+    runner = CliRunner()
+    result = runner.invoke(
+        app,
+        [
+            "compare",
+            str(FIXTURES / "openclaw_basic"),
+            str(FIXTURES / "codex_scoped"),
+            str(FIXTURES / "openclaw_basic"),
+            "--format",
+            "markdown",
+        ],
+    )
+    assert result.exit_code == 0
+    assert result.stdout.splitlines()[0] == "| Metric | Agent 1 | Agent 2 | Agent 3 |"
+    assert "| Skills / Plugins | HIGH | MEDIUM | HIGH |" in result.stdout
+
+
+def test_compare_requires_two_paths() -> None:
+    runner = CliRunner()
+    result = runner.invoke(app, ["compare", str(FIXTURES / "codex_scoped")])
+    assert result.exit_code != 0
 
 
 def test_scan_table_output_not_duplicated() -> None:
@@ -45,6 +69,26 @@ def test_scan_table_output_not_duplicated() -> None:
     assert result.stdout.count("agent-audit scan ::") == 1
 
 
+def test_scan_ndjson_streams_one_line_per_path() -> None:
+    runner = CliRunner()
+    result = runner.invoke(
+        app,
+        [
+            "scan",
+            str(FIXTURES / "openclaw_basic"),
+            str(FIXTURES / "codex_scoped"),
+            "--format",
+            "ndjson",
+            "--fields",
+            "adapter_name,checks.severity",
+        ],
+    )
+    assert result.exit_code == 0
+    lines = [json.loads(line) for line in result.stdout.splitlines()]
+    assert [line["adapter_name"] for line in lines] == ["openclaw", "codex"]
+    assert lines[1]["checks"]["shell"] == {"severity": "medium"}
+
+
 def test_scan_unknown_path_returns_user_error() -> None:
     runner = CliRunner()
     result = runner.invoke(app, ["scan", "/tmp/aa-does-not-exist"])
@@ -96,6 +140,40 @@ def test_monitor_exec_json_output() -> None:
     assert payload["command"] == "sleep 1"
 
 
+def test_monitor_ships_events_to_sinks(tmp_path: Path) -> None:
+    runner = CliRunner()
+    result = runner.invoke(
+        app,
+        [
+            "monitor",
+            "--exec",
+            "sleep 1",
+            "--duration",
+            "1",
+            "--interval",
+            "0.2",
+            "--format",
+            "json",
+            "--sink",
+            f"jsonl:{tmp_path / 'events.jsonl'}",
+            "--sink",
+            f"sqlite:{tmp_path / 'events.db'}",
+        ],
+    )
+    assert result.exit_code == 0
+    payload = json.loads(result.stdout)
+    stats = payload["sinks"][f"jsonl:{tmp_path / 'events.jsonl'}"]
+    assert stats["written"] == len(payload["events"])
+    assert (tmp_path / "events.db").exists() or not payload["events"]
+
+
+def test_monitor_rejects_unknown_sink() -> None:
+    runner = CliRunner()
+    result = runner.invoke(app, ["monitor", "--pid", str(os.getpid()), "--sink", "kafka:x"])
+    assert result.exit_code == 2
+    assert "Invalid sink" in result.stderr
+
+
 def test_monitor_requires_pid_or_exec() -> None:
     runner = CliRunner()
     result = runner.invoke(app, ["monitor", "--duration", "1"])
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from agent_audit.core.coalesce import EventCoalescer, directory_prefix
+from agent_audit.core.monitor import MonitorEvent, ProcessMonitor
+from agent_audit.core.procfs import SyntheticProcFS
+
+
+def _read(target: str, severity: str = "low", pid: int = 10, at: float = 0.0) -> MonitorEvent:
+    return MonitorEvent(kind="READ", target=target, severity=severity, pid=pid, observed_at=at)
+
+
+def test_directory_prefix_depth() -> None:
+    assert directory_prefix("/work/app/node_modules/lodash/index.js", 3) == "/work/app/node_modules"
+    assert directory_prefix("/work/a.txt", 3) == "/work"
+    assert directory_prefix("/a.txt", 3) == "/"
+
+
+def test_rolls_up_routine_events_and_passes_high_through() -> None:
+    coalescer = EventCoalescer(window_seconds=5.0, depth=3)
+    reads = [_read(f"/work/app/node_modules/pkg{index}/index.js") for index in range(1000)]
+    secret = _read("/home/user/.ssh/id_rsa", severity="critical")
+
+    assert coalescer.add([*reads, secret], now=0.0) == [secret]
+    assert coalescer.add([], now=4.9) == []
+    (rollup,) = coalescer.add([], now=5.0)
+    assert (rollup.kind, rollup.target, rollup.count) == ("READ", "/work/app/node_modules", 1000)
+    assert rollup.to_dict()["count"] == 1000
+    assert len(coalescer) == 0
+
+
+def test_groups_split_by_severity_and_process() -> None:
+    coalescer = EventCoalescer(depth=1)
+    coalescer.add(
+        [
+            _read("/work/a", pid=1),
+            _read("/work/b", pid=2),
+            _read("/work/c", severity="medium", pid=1),
+        ],
+        now=0.0,
+    )
+    assert len(coalescer) == 3
+    # A group that stayed alone is emitted as the original event.
+    assert {event.target for event in coalescer.flush()} == {"/work/a", "/work/b", "/work/c"}
+
+
+def test_state_is_bounded() -> None:
+    coalescer = EventCoalescer(depth=1, max_groups=2)
+    emitted = coalescer.add([_read(f"/dir{index}/file") for index in range(5)], now=0.0)
+    assert [event.target for event in emitted] == ["/dir0/file", "/dir1/file", "/dir2/file"]
+    assert len(coalescer) == 2
+
+
+def test_invalid_settings() -> None:
+    with pytest.raises(ValueError):
+        EventCoalescer(window_seconds=0)
+    with pytest.raises(ValueError):
+        EventCoalescer(depth=0)
+
+
+def test_monitor_coalesces_and_summary_counts_rollups(tmp_path: Path) -> None:
+    backend = SyntheticProcFS()
+    backend.spawn(100, 1, "npm install")
+    for fd in range(3, 503):
+        backend.open(100, fd, str(tmp_path / "node_modules" / f"pkg{fd}" / "package.json"))
+    backend.open(100, 600, "/home/user/.aws/credentials")
+
+    monitor = ProcessMonitor(
+        pid=100,
+        project_root=tmp_path,
+        backend=backend,
+        maps=False,
+        coalescer=EventCoalescer(window_seconds=60.0, depth=len(tmp_path.parts)),
+    )
+    polled = monitor.poll()
+    assert [event.target for event in polled] == ["/home/user/.aws/credentials"]
+
+    (rollup,) = monitor.flush()
+    assert rollup.target == str(tmp_path / "node_modules")
+    assert rollup.count == 500
+    summary = monitor.session.summarize()
+    assert summary.events == 501
+    assert summary.alerts_high == 1
@@ -0,0 +1,38 @@
+from pathlib import Path
+
+from agent_audit.core.compare import compare_paths
+from agent_audit.core.scanner import Scanner
+from agent_audit.types import CheckResult, ScanResult
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+class CountingScanner(Scanner):
+    def __init__(self) -> None:
+        super().__init__()
+        self.scanned: list[Path] = []
+
+    def scan_path(self, path: str | Path) -> ScanResult:
+        self.scanned.append(Path(path))
+        return super().scan_path(path)
+
+
+def test_each_path_is_scanned_once() -> None:
+    scanner = CountingScanner()
+    openclaw = FIXTURES / "openclaw_basic"
+    codex = FIXTURES / "codex_scoped"
+    comparison = compare_paths([openclaw, codex, openclaw, codex / "."], scanner=scanner)
+    assert len(scanner.scanned) == 2
+    assert [result.adapter_name for result in comparison.results] == [
+        "openclaw",
+        "codex",
+        "openclaw",
+        "codex",
+    ]
+
+
+def test_extra_checks_become_rows() -> None:
+    comparison = compare_paths([FIXTURES / "openclaw_basic", FIXTURES / "codex_scoped"])
+    comparison.results[1].checks["custom"] = CheckResult("custom", "Custom", 1.0, "low", "")
+    assert comparison.check_rows()[-1] == ("custom", "Custom")
+    assert comparison.to_dict()["agents"][1]["checks"]["custom"] == "low"
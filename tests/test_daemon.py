@@ -0,0 +1,99 @@
+import json
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from agent_audit.adapters import helpers
+from agent_audit.cli import app
+from agent_audit.core.client import request, try_forward
+from agent_audit.core.daemon import DaemonServer, ScanService
+from agent_audit.core.scanner import Scanner
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture
+def daemon(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    monkeypatch.setattr(helpers, "_parse_cache", None)
+    socket_path = tmp_path / "aa.sock"
+    server = DaemonServer(socket_path, ScanService())
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield socket_path
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def test_scan_and_discover_over_socket(daemon: Path) -> None:
+    response = request(
+        daemon, {"op": "scan", "paths": [str(FIXTURES / "codex_scoped")], "format": "json"}
+    )
+    assert response["ok"]
+    assert json.loads(response["output"])["adapter_name"] == "codex"
+
+    response = request(
+        daemon, {"op": "discover", "paths": [str(FIXTURES / "openclaw_basic"), "/tmp/aa-none"]}
+    )
+    assert [item["adapter"] for item in json.loads(response["output"])] == ["openclaw", None]
+
+
+def test_errors_are_returned_not_raised(daemon: Path) -> None:
+    response = request(daemon, {"op": "scan", "paths": ["/tmp/aa-does-not-exist"]})
+    assert response == {
+        "ok": False,
+        "error": "Could not detect supported agent at /tmp/aa-does-not-exist",
+        "code": 2,
+    }
+    assert request(daemon, {"op": "nope"})["ok"] is False
+
+
+def test_malformed_and_failing_requests_get_error_responses(
+    daemon: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    assert request(daemon, {"op": "scan", "paths": "/tmp/aa"}) == {
+        "ok": False,
+        "error": "'paths' must be a list of strings",
+        "code": 2,
+    }
+    assert request(daemon, {"op": "scan", "paths": [1]})["code"] == 2
+
+    def _boom(self: Scanner, path: str) -> None:
+        raise OSError("disk on fire")
+
+    monkeypatch.setattr(Scanner, "scan_path", _boom)
+    response = request(daemon, {"op": "scan", "paths": [str(FIXTURES / "codex_scoped")]})
+    assert response == {"ok": False, "error": "OSError: disk on fire", "code": 1}
+    # The connection and the server survive the failure.
+    assert request(daemon, {"op": "ping"})["ok"] is True
+
+
+def test_concurrent_clients_share_parse_cache(daemon: Path) -> None:
+    payload = {
+        "op": "compare",
+        "paths": [str(FIXTURES / "openclaw_basic"), str(FIXTURES / "codex_scoped")],
+    }
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        responses = list(pool.map(lambda _: request(daemon, payload), range(16)))
+    assert all(response["ok"] for response in responses)
+    stats = request(daemon, {"op": "ping"})["stats"]
+    assert stats["parse_cache_hits"] > stats["parse_cache_misses"]
+
+
+def test_cli_forwards_when_socket_exists(daemon: Path) -> None:
+    runner = CliRunner()
+    result = runner.invoke(
+        app,
+        ["scan", str(FIXTURES / "codex_scoped"), "--format", "json", "--socket", str(daemon)],
+    )
+    assert result.exit_code == 0
+    assert json.loads(result.stdout)["adapter_name"] == "codex"
+    assert request(daemon, {"op": "ping"})["stats"]["requests"] == 2
+
+
+def test_missing_socket_falls_back_to_local(tmp_path: Path) -> None:
+    assert try_forward(tmp_path / "missing.sock", {"op": "ping"}) is None
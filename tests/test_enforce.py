@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import json
+import signal
+import sys
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from agent_audit.cli import app
+from agent_audit.core.enforce import EnforcementRule, Enforcer, parse_rule
+from agent_audit.core.monitor import ProcessMonitor
+from agent_audit.core.procfs import SyntheticProcFS
+
+
+def _tree() -> SyntheticProcFS:
+    backend = SyntheticProcFS()
+    backend.spawn(100, 1, "agent --serve")
+    backend.spawn(101, 100, "node worker.js")
+    backend.spawn(102, 101, "python tool.py")
+    return backend
+
+
+@pytest.mark.parametrize(
+    ("spec", "expected"),
+    [
+        ("critical:kill", EnforcementRule("critical", "kill")),
+        ("READ/high:stop:tree", EnforcementRule("high", "stop", "tree", "READ")),
+        (" network/Medium:Stop ", EnforcementRule("medium", "stop", "process", "NETWORK")),
+    ],
+)
+def test_parse_rule(spec: str, expected: EnforcementRule) -> None:
+    assert parse_rule(spec) == expected
+
+
+@pytest.mark.parametrize(
+    "spec", ["critical", "severe:kill", "high:pause", "high:kill:group", "open/high:kill"]
+)
+def test_parse_rule_rejects_invalid(spec: str) -> None:
+    with pytest.raises(ValueError, match="Invalid enforce rule"):
+        parse_rule(spec)
+
+
+def test_kill_offending_process_within_the_same_poll() -> None:
+    backend = _tree()
+    backend.open(102, 3, "/home/user/.ssh/id_rsa")
+    monitor = ProcessMonitor(pid=100, backend=backend, enforce=[parse_rule("critical:kill")])
+
+    monitor.poll()
+    assert backend.signals == [(102, signal.SIGKILL)]
+    assert 102 not in backend.processes
+
+    summary = monitor.session.summarize()
+    assert summary.enforced == 1
+    assert (
+        summary.max_enforcement_latency_ms is not None and summary.max_enforcement_latency_ms >= 0
+    )
+    [action] = monitor.session.enforcement
+    assert (action.event_pid, action.event_target, action.signalled) == (
+        102,
+        "/home/user/.ssh/id_rsa",
+        [102],
+    )
+
+
+def test_tree_stop_signals_root_first_and_only_once() -> None:
+    backend = _tree()
+    backend.open(101, 3, "/etc/shadow")
+    backend.open(102, 4, "/home/user/.aws/credentials")
+    monitor = ProcessMonitor(
+        pid=100, backend=backend, enforce=[parse_rule("read/critical:stop:tree")], enforce_tree=True
+    )
+
+    monitor.poll()
+    assert backend.signals == [(100, signal.SIGSTOP), (101, signal.SIGSTOP), (102, signal.SIGSTOP)]
+    assert len(monitor.session.enforcement) == 1
+
+    monitor.enforcer.release()
+    assert backend.processes == {}
+
+
+def test_first_matching_rule_wins_and_kind_filters() -> None:
+    backend = _tree()
+    backend.connect(101, 5, "93.184.216.34:443")
+    backend.open(102, 3, "/etc/passwd")
+    rules = [parse_rule("network/medium:stop"), parse_rule("high:kill")]
+    monitor = ProcessMonitor(pid=100, backend=backend, enforce=rules)
+
+    monitor.poll()
+    assert sorted(backend.signals) == [(101, signal.SIGSTOP), (102, signal.SIGKILL)]
+
+
+def test_tree_rules_require_ownership() -> None:
+    with pytest.raises(ValueError, match="--exec"):
+        Enforcer([parse_rule("critical:kill:tree")], SyntheticProcFS())
+
+
+def test_cli_enforce_kills_exec_child(tmp_path: Path) -> None:
+    script = "import time; handle = open('/etc/hostname'); time.sleep(10)"
+    result = CliRunner().invoke(
+        app,
+        [
+            "monitor",
+            "--exec",
+            f"{sys.executable} -c \"{script}\"",
+            "--duration",
+            "3",
+            "--interval",
+            "0.1",
+            "--no-maps",
+            "--enforce",
+            "read/critical:kill",
+            "--format",
+            "json",
+        ],
+    )
+    assert result.exit_code == 0
+    payload = json.loads(result.stdout)
+    assert payload["summary"]["enforced"] >= 1
+    assert payload["enforcement"][0]["event"]["target"] == "/etc/hostname"
+    assert payload["summary"]["max_enforcement_latency_ms"] is not None
+
+
+def test_cli_rejects_tree_rules_without_exec() -> None:
+    result = CliRunner().invoke(app, ["monitor", "--pid", "1", "--enforce", "critical:kill:tree"])
+    assert result.exit_code == 2
+    assert "--exec" in result.stderr
@@ -0,0 +1,63 @@
+from pathlib import Path
+
+import pytest
+
+from agent_audit.checks.filesystem import evaluate_filesystem
+from agent_audit.types import AgentConfig
+from agent_audit.utils.paths import PathResolver, references_sensitive_location
+
+
+def _config(root: Path, allowed: list[str], blocked: list[str] | None = None) -> AgentConfig:
+    return AgentConfig(
+        agent_name="test",
+        agent_version="1",
+        root_path=root,
+        allowed_paths=allowed,
+        blocked_paths=blocked or [],
+    )
+
+
+def test_sensitive_match_is_component_based() -> None:
+    assert references_sensitive_location("/var/log")
+    assert references_sensitive_location("~/.ssh/id_rsa")
+    assert not references_sensitive_location("/variant/data")
+    assert not references_sensitive_location("./my.envrc")
+
+
+def test_scoped_paths_are_low(tmp_path: Path) -> None:
+    result = evaluate_filesystem(_config(tmp_path, [".", "./src"]))
+    assert result.severity == "low"
+
+
+def test_out_of_scope_path_is_high(tmp_path: Path) -> None:
+    result = evaluate_filesystem(_config(tmp_path, ["./src", "/opt/shared"]))
+    assert result.severity == "high"
+    assert "Path exceeds project scope: /opt/shared" in result.details
+
+
+def test_allowed_path_shadowed_by_deny_is_not_counted(tmp_path: Path) -> None:
+    result = evaluate_filesystem(_config(tmp_path, ["./src", "~/.ssh/keys"], ["~/.ssh"]))
+    assert result.severity == "low"
+    assert any(
+        detail.startswith("Allowed path shadowed by blocked path: ~/.ssh/keys")
+        for detail in result.details
+    )
+
+
+def test_resolver_memoizes_per_path_and_root(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls: list[Path] = []
+    original = Path.resolve
+
+    def _counting_resolve(self: Path, strict: bool = False) -> Path:
+        calls.append(self)
+        return original(self, strict)
+
+    monkeypatch.setattr(Path, "resolve", _counting_resolve)
+    resolver = PathResolver()
+    first = resolver.resolve("./src", tmp_path)
+    assert resolver.resolve("./src", tmp_path) == first
+    assert len(calls) == 1
+    resolver.resolve("./src", tmp_path / "other")
+    assert len(calls) == 2
@@ -0,0 +1,67 @@
+import random
+from collections.abc import Callable
+
+import pytest
+
+from agent_audit.core import fleet
+from agent_audit.core.fleet import CheckMatrix, score_fleet
+from agent_audit.core.risk import WEIGHTS
+from agent_audit.types import CheckResult, ScanResult
+
+
+def _checks(scores: dict[str, float]) -> list[CheckResult]:
+    return [CheckResult(key, key, score, "low", "") for key, score in scores.items()]
+
+
+def _fleet(make_result: Callable[..., ScanResult], size: int) -> list[ScanResult]:
+    rng = random.Random(7)
+    steps = [0.0, 1.5, 2.0, 4.0, 5.0, 6.5, 7.0, 7.5, 9.0, 10.0]
+    return [
+        make_result(f"/agents/{index}", *_checks({key: rng.choice(steps) for key in WEIGHTS}))
+        for index in range(size)
+    ]
+
+
+@pytest.fixture(params=[True, False], ids=["numpy", "array"])
+def backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> None:
+    if request.param and not fleet.HAS_NUMPY:
+        pytest.skip("numpy not installed")
+    monkeypatch.setattr(fleet, "HAS_NUMPY", request.param)
+
+
+def test_batch_scores_match_single_result_path(
+    backend: None, make_result: Callable[..., ScanResult]
+) -> None:
+    results = _fleet(make_result, 2000)
+    report = score_fleet(results)
+    assert report.scores == [result.risk_score for result in results]
+    assert report.tiers == [result.risk_tier for result in results]
+    assert sum(report.tier_histogram.values()) == len(results)
+
+
+def test_missing_checks_are_skipped(backend: None, make_result: Callable[..., ScanResult]) -> None:
+    results = [
+        make_result("/agents/0", *_checks({"shell": 10.0})),
+        make_result("/agents/1", *_checks({"shell": 0.0, "filesystem": 10.0})),
+    ]
+    matrix = CheckMatrix.from_results(results)
+    assert matrix.scores() == [2.5, 2.5]
+    assert matrix.report().percentiles["filesystem"] == {"p50": 10.0, "p90": 10.0, "p99": 10.0}
+
+
+def test_percentiles_and_top_n(backend: None, make_result: Callable[..., ScanResult]) -> None:
+    results = [
+        make_result(f"/agents/{index}", *_checks({"shell": float(index)})) for index in range(11)
+    ]
+    report = CheckMatrix.from_results(results).report(top_n=2)
+    assert report.percentiles["shell"]["p50"] == 5.0
+    assert report.percentiles["shell"]["p90"] == 9.0
+    assert report.top == [("/agents/10", 2.5), ("/agents/9", 2.2)]
+
+
+def test_rescore_with_alternative_weights(
+    backend: None, make_result: Callable[..., ScanResult]
+) -> None:
+    matrix = CheckMatrix.from_results(_fleet(make_result, 50))
+    shell_only = matrix.report(weights={"shell": 1.0})
+    assert shell_only.scores == [round(value, 1) for value in matrix.column("shell")]
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import json
+import shutil
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from agent_audit.cli import app
+from agent_audit.core.githistory import GitObjectReader, scan_git_history
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+
+
+def _commit(git: Callable[..., str], repo: Path, message: str) -> str:
+    git(repo, "add", "-A")
+    git(repo, "commit", "-qm", message)
+    return git(repo, "rev-parse", "HEAD").strip()
+
+
+@pytest.fixture
+def repo(tmp_path: Path, git: Callable[..., str]) -> Path:
+    git(tmp_path, "init", "-q")
+    api = tmp_path / "services" / "api"
+    shutil.copytree(FIXTURES / "codex_scoped", api)
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "app.py").write_text("print('hi')\n", encoding="utf-8")
+    _commit(git, tmp_path, "add api agent")
+
+    (tmp_path / "src" / "app.py").write_text("print('changed')\n", encoding="utf-8")
+    _commit(git, tmp_path, "unrelated change")
+
+    config = api / ".codex" / "config.toml"
+    original = config.read_text(encoding="utf-8")
+    config.write_text(
+        original.replace('shell = "filtered"', 'shell = "unrestricted"'), encoding="utf-8"
+    )
+    shutil.copytree(FIXTURES / "openclaw_basic", tmp_path / "tools" / "bot")
+    _commit(git, tmp_path, "open up shell")
+
+    config.write_text(original, encoding="utf-8")
+    _commit(git, tmp_path, "revert shell")
+
+    shutil.rmtree(api / ".codex")
+    _commit(git, tmp_path, "remove agent")
+    return tmp_path
+
+
+def test_scores_each_state_change_once(repo: Path) -> None:
+    report = scan_git_history(repo, ["services/api", "tools/bot"])
+    assert report.commits == 4
+    timeline = [(scan.subject, scan.agent_root, scan.reused) for scan in report.scans]
+    assert timeline == [
+        ("add api agent", "services/api", False),
+        ("open up shell", "services/api", False),
+        ("open up shell", "tools/bot", False),
+        ("revert shell", "services/api", True),
+        ("remove agent", "services/api", False),
+    ]
+    api = [scan for scan in report.scans if scan.agent_root == "services/api"]
+    assert [scan.result.checks["shell"].severity if scan.result else None for scan in api] == [
+        "medium",
+        "critical",
+        "medium",
+        None,
+    ]
+    assert api[0].result is api[2].result
+    assert api[0].result.scanned_path == str(repo / "services" / "api")
+    assert report.unique_states == 4
+    # Five distinct blobs: two codex configs, the codex skills manifest and the openclaw pair.
+    assert report.blobs_read == 5
+
+
+def test_max_count_seeds_state_from_parent(repo: Path) -> None:
+    report = scan_git_history(repo, [repo / "services" / "api"], max_count=2)
+    assert [scan.subject for scan in report.scans] == ["revert shell", "remove agent"]
+    assert report.scans[0].result is not None
+    assert report.scans[0].result.checks["shell"].severity == "medium"
+
+
+def test_object_reader_reports_missing_objects(repo: Path, git: Callable[..., str]) -> None:
+    blob = git(repo, "rev-parse", "HEAD:src/app.py").strip()
+    with GitObjectReader(repo) as reader:
+        objects = dict(reader.read_many([blob, "f" * 40]))
+    assert objects == {blob: b"print('changed')\n", "f" * 40: None}
+
+
+def test_rejects_paths_outside_repo(repo: Path, tmp_path_factory: pytest.TempPathFactory) -> None:
+    with pytest.raises(ValueError, match="outside the repository"):
+        scan_git_history(repo, [tmp_path_factory.mktemp("elsewhere")])
+
+
+def test_cli_scan_history_json(repo: Path) -> None:
+    result = CliRunner().invoke(
+        app, ["scan-history", str(repo), "--paths", "services/api", "--format", "json"]
+    )
+    assert result.exit_code == 0
+    payload = json.loads(result.stdout)
+    assert [scan["subject"] for scan in payload["scans"]] == [
+        "add api agent",
+        "open up shell",
+        "revert shell",
+        "remove agent",
+    ]
+    assert payload["scans"][-1]["result"] is None
+
+
+def test_cli_scan_history_markdown_shows_transitions(repo: Path) -> None:
+    result = CliRunner().invoke(
+        app, ["scan-history", str(repo), "--paths", "services/api", "--format", "markdown"]
+    )
+    assert result.exit_code == 0
+    assert "shell: MEDIUM -> CRITICAL" in result.stdout
+    assert "no agent config" in result.stdout
@@ -0,0 +1,199 @@
+import json
+import sqlite3
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from agent_audit.cli import app
+from agent_audit.core.history import HISTORY_SCHEMA_VERSION, HistoryStore
+from agent_audit.core.monitor import MonitorEvent, MonitorSummary
+from agent_audit.core.scanner import Scanner
+from agent_audit.types import CheckResult, ScanResult
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def _scan(root: str, when: str, shell: str, score: float = 5.0) -> ScanResult:
+    return ScanResult(
+        agent_name="Codex",
+        agent_version="1",
+        adapter_name="codex",
+        scanned_path=root,
+        checks={
+            "shell": CheckResult("shell", "Shell", score, shell, f"shell {shell}"),
+            "secrets": CheckResult("secrets", "Secrets", 0.0, "low", "none"),
+        },
+        risk_score=score,
+        risk_tier="MEDIUM",
+        generated_at=when,
+    )
+
+
+def test_changes_reports_transitions_per_root_and_check(tmp_path: Path) -> None:
+    with HistoryStore(tmp_path / "history.db") as store:
+        store.record_scans(
+            [
+                _scan("/team/a", "2026-01-01T00:00:00+00:00", "medium"),
+                _scan("/team/b", "2026-01-01T00:00:00+00:00", "medium"),
+                _scan("/team/a", "2026-02-01T00:00:00+00:00", "medium"),
+                _scan("/team/a", "2026-03-01T00:00:00+00:00", "critical", score=9.0),
+                _scan("/team/b", "2026-03-02T00:00:00+00:00", "medium"),
+            ],
+            batch_size=2,
+        )
+        changes = store.changes(check_key="shell")
+        assert [(c.agent_root, c.changed_at, c.previous_at) for c in changes] == [
+            ("/team/a", "2026-03-01T00:00:00+00:00", "2026-02-01T00:00:00+00:00")
+        ]
+        assert (changes[0].previous_severity, changes[0].severity) == ("medium", "critical")
+        assert changes[0].adapter == "codex"
+        assert store.changes(agent_root="/team/b") == []
+        assert store.changes(check_key="shell", since="2026-03-01T12:00:00") == []
+
+
+def test_changes_compare_the_first_scan_in_range_with_an_earlier_one(tmp_path: Path) -> None:
+    with HistoryStore(tmp_path / "history.db") as store:
+        store.record_scans(
+            [
+                _scan("/team/a", "2026-01-01T00:00:00+00:00", "low"),
+                _scan("/team/a", "2026-02-01T00:00:00+00:00", "high"),
+                _scan("/team/a", "2026-03-01T00:00:00+00:00", "high"),
+            ]
+        )
+        (change,) = store.changes(check_key="shell", since="2026-01-15")
+        assert (change.changed_at, change.previous_at) == (
+            "2026-02-01T00:00:00+00:00",
+            "2026-01-01T00:00:00+00:00",
+        )
+        assert store.changes(check_key="shell", adapter="codex", since="2026-01-15") == [change]
+        assert store.changes(check_key="shell", until="2026-01-15") == []
+
+
+def test_trend_buckets_scores(tmp_path: Path) -> None:
+    with HistoryStore(tmp_path / "history.db") as store:
+        store.record_scans(
+            [
+                _scan("/team/a", "2026-01-01T00:00:00+00:00", "medium", score=4.0),
+                _scan("/team/a", "2026-01-15T00:00:00+00:00", "medium", score=6.0),
+                _scan("/team/a", "2026-02-01T00:00:00+00:00", "critical", score=9.0),
+            ]
+        )
+        monthly = store.trend(agent_root="/team/a", bucket="month")
+        assert [(p.period, p.scans, p.risk_score, p.max_risk_score) for p in monthly] == [
+            ("2026-01", 2, 5.0, 6.0),
+            ("2026-02", 1, 9.0, 9.0),
+        ]
+        assert len(store.trend(bucket="scan")) == 3
+        assert len(store.trend(bucket="scan", limit=1)) == 1
+        with pytest.raises(ValueError, match="Unknown bucket"):
+            store.trend(bucket="year")
+
+
+def test_trend_tier_is_from_latest_scan_in_period(tmp_path: Path) -> None:
+    # Recorded out of order; the peak score is not the latest scan.
+    scans = [
+        ("2026-01-20T00:00:00+00:00", 2.0, "LOW"),
+        ("2026-01-10T00:00:00+00:00", 9.0, "HIGH"),
+        ("2026-01-01T00:00:00+00:00", 5.0, "MEDIUM"),
+    ]
+    with HistoryStore(tmp_path / "history.db") as store:
+        store.record_scans(
+            replace(_scan("/team/a", when, "medium", score), risk_tier=tier)
+            for when, score, tier in scans
+        )
+        (point,) = store.trend(agent_root="/team/a", bucket="month")
+        assert (point.scans, point.max_risk_score, point.risk_tier) == (3, 9.0, "LOW")
+
+
+def test_failed_batch_is_rolled_back(tmp_path: Path) -> None:
+    store = HistoryStore(tmp_path / "history.db")
+    broken = replace(_scan("/team/a", "2026-01-01T00:00:00+00:00", "low"), risk_score=None)
+    with pytest.raises(sqlite3.IntegrityError):
+        store.record_scans([_scan("/team/a", "2026-01-01T00:00:00+00:00", "low"), broken])
+    assert store.trend(bucket="scan") == []
+    store.close()
+
+
+def test_newer_schema_is_rejected(tmp_path: Path) -> None:
+    HistoryStore(tmp_path / "history.db").close()
+    with sqlite3.connect(tmp_path / "history.db") as connection:
+        connection.execute("UPDATE meta SET value = '99' WHERE key = 'schema_version'")
+    with pytest.raises(ValueError, match="schema 99"):
+        HistoryStore(tmp_path / "history.db")
+
+
+def test_record_session(tmp_path: Path) -> None:
+    with HistoryStore(tmp_path / "history.db") as store:
+        events = [
+            MonitorEvent(kind="EXEC", target="curl x", severity="high"),
+            MonitorEvent(kind="READ", target="/work/node_modules", severity="low", count=500),
+        ]
+        session_id = store.record_session(
+            42, "agent run", "2026-01-01T00:00:00+00:00", "2026-01-01T00:01:00+00:00", events,
+            MonitorSummary(events=501, alerts_high=1, alerts_medium=0),
+        )
+    with sqlite3.connect(tmp_path / "history.db") as connection:
+        assert connection.execute("SELECT pid, alerts_high FROM sessions").fetchall() == [(42, 1)]
+        rows = connection.execute("SELECT session_id, kind, count FROM session_events").fetchall()
+        assert rows == [(session_id, "EXEC", 1), (session_id, "READ", 500)]
+
+
+def test_version_1_database_is_migrated(tmp_path: Path) -> None:
+    HistoryStore(tmp_path / "history.db").close()
+    with sqlite3.connect(tmp_path / "history.db") as connection:
+        connection.execute("ALTER TABLE session_events DROP COLUMN count")
+        connection.execute("UPDATE meta SET value = '1' WHERE key = 'schema_version'")
+    with HistoryStore(tmp_path / "history.db") as store:
+        store.record_session(
+            1,
+            None,
+            "2026-01-01T00:00:00+00:00",
+            "2026-01-01T00:00:01+00:00",
+            [MonitorEvent(kind="READ", target="/work", severity="low", count=7)],
+            MonitorSummary(events=7, alerts_high=0, alerts_medium=0),
+        )
+    with sqlite3.connect(tmp_path / "history.db") as connection:
+        assert connection.execute("SELECT count FROM session_events").fetchall() == [(7,)]
+        version = connection.execute("SELECT value FROM meta WHERE key = 'schema_version'")
+        assert version.fetchone() == (str(HISTORY_SCHEMA_VERSION),)
+
+
+def test_cli_records_scans_and_answers_queries(tmp_path: Path) -> None:
+    runner = CliRunner()
+    db = tmp_path / "history.db"
+    target = FIXTURES / "codex_scoped"
+    for _ in range(2):
+        result = runner.invoke(app, ["scan", str(target), "--format", "json", "--history", str(db)])
+        assert result.exit_code == 0
+
+    trend = runner.invoke(
+        app, ["history", "trend", "--db", str(db), "--root", str(target), "--format", "json"]
+    )
+    assert trend.exit_code == 0
+    [point] = json.loads(trend.stdout)["trend"]
+    assert point["scans"] == 2
+    assert point["adapter"] == "codex"
+
+    changes = runner.invoke(app, ["history", "changes", "--db", str(db), "--format", "json"])
+    assert changes.exit_code == 0
+    assert json.loads(changes.stdout) == {"changes": []}
+
+    table = runner.invoke(app, ["history", "changes", "--db", str(db)])
+    assert table.exit_code == 0
+
+
+def test_cli_history_missing_database(tmp_path: Path) -> None:
+    result = CliRunner().invoke(app, ["history", "trend", "--db", str(tmp_path / "none.db")])
+    assert result.exit_code == 2
+    assert "does not exist" in result.stderr
+
+
+def test_scanner_results_round_trip_into_history(tmp_path: Path) -> None:
+    result = Scanner().scan_path(FIXTURES / "openclaw_basic")
+    with HistoryStore(tmp_path / "history.db") as store:
+        store.record_scans([result])
+        [point] = store.trend(bucket="scan")
+    assert point.agent_root == result.scanned_path
+    assert point.risk_score == round(result.risk_score, 2)
@@ -7,8 +7,12 @@ from agent_audit.core.monitor import (
     MonitorEvent,
     ProcessMonitor,
     SessionMonitor,
+    _collect_descendants,
+    _parse_maps,
+    _parse_ppid,
     _severity_for_file,
 )
+from agent_audit.core.procfs import RealProcFS, SyntheticProcFS
 
 
 def test_monitor_summary_counts_alerts() -> None:
@@ -52,3 +56,135 @@ def test_iter_fd_paths_handles_permission_error(monkeypatch: pytest.MonkeyPatch)
 
     monkeypatch.setattr(Path, "iterdir", _raise_permission)
     assert monitor._iter_fd_paths(os.getpid()) == []
+
+
+def _synthetic_tree() -> SyntheticProcFS:
+    backend = SyntheticProcFS()
+    backend.spawn(100, 1, "agent --serve")
+    backend.spawn(101, 100, "node worker.js")
+    backend.spawn(102, 101, "curl https://example.com")
+    backend.spawn(200, 1, "unrelated daemon")
+    return backend
+
+
+def test_synthetic_backend_collects_whole_tree() -> None:
+    monitor = ProcessMonitor(pid=100, backend=_synthetic_tree())
+    events = monitor.poll()
+
+    execs = {event.target: event.severity for event in events if event.kind == "EXEC"}
+    assert execs == {"node worker.js": "medium", "curl https://example.com": "high"}
+
+
+def test_synthetic_backend_file_and_socket_events(tmp_path: Path) -> None:
+    backend = _synthetic_tree()
+    backend.open(101, 3, str(tmp_path / "src" / "index.js"))
+    backend.open(101, 4, str(tmp_path / "out.log"), write=True)
+    backend.open(102, 5, "/home/user/.ssh/id_rsa")
+    backend.connect(102, 6, "93.184.216.34:443")
+    backend.connect(200, 7, "10.0.0.1:22")
+
+    monitor = ProcessMonitor(pid=100, project_root=tmp_path, backend=backend)
+    events = {(event.kind, event.target): event.severity for event in monitor.poll()}
+
+    assert events[("READ", str(tmp_path / "src" / "index.js"))] == "low"
+    assert events[("WRITE", str(tmp_path / "out.log"))] == "medium"
+    assert events[("READ", "/home/user/.ssh/id_rsa")] == "critical"
+    assert events[("NETWORK", "tcp://93.184.216.34:443")] == "medium"
+    assert ("NETWORK", "tcp://10.0.0.1:22") not in events
+
+
+def test_synthetic_backend_scripted_ticks() -> None:
+    backend = _synthetic_tree()
+    backend.at(1, lambda fs: fs.spawn(103, 102, "ssh deploy@host"))
+    backend.at(2, lambda fs: fs.connect(103, 3, "127.0.0.1:8080"))
+    backend.at(3, lambda fs: fs.exit(100))
+
+    monitor = ProcessMonitor(pid=100, backend=backend)
+    assert len(monitor.poll()) == 2
+    assert monitor.poll() == []
+
+    backend.advance()
+    assert [(event.kind, event.target) for event in monitor.poll()] == [("EXEC", "ssh deploy@host")]
+    backend.advance()
+    assert [(event.target, event.severity) for event in monitor.poll()] == [
+        ("tcp://127.0.0.1:8080", "low")
+    ]
+    backend.advance()
+    assert monitor.poll() == []
+    assert monitor.run(duration_seconds=1.0, interval_seconds=0.01) == []
+
+
+def test_synthetic_tree_generator_shape() -> None:
+    backend = SyntheticProcFS.tree(100, root_pid=1000, fanout=4, files_per_process=2)
+    monitor = ProcessMonitor(pid=1000, backend=backend)
+    events = monitor.poll()
+
+    kinds = [event.kind for event in events]
+    assert kinds.count("EXEC") == 99
+    assert kinds.count("NETWORK") == 100
+    assert kinds.count("READ") + kinds.count("WRITE") == 200
+
+
+def test_real_procfs_reads_current_process() -> None:
+    backend = RealProcFS()
+    if not backend.exists(os.getpid()):
+        pytest.skip("procfs not available")
+    assert os.getpid() in backend.pids()
+    assert _parse_ppid(backend.stat(os.getpid())) == os.getppid()
+    assert _collect_descendants(backend, os.getppid()) >= {os.getppid(), os.getpid()}
+
+
+def test_mapped_files_emit_events_and_unchanged_maps_are_skipped(tmp_path: Path) -> None:
+    backend = _synthetic_tree()
+    backend.mmap(101, "/usr/lib/x86_64-linux-gnu/libc.so.6", "r-xp")
+    backend.mmap(101, str(tmp_path / "state.db"), "rw-s")
+    backend.mmap(101, "/opt/models/cache.bin", "rw-p")
+    backend.mmap(101, "/opt/node/bin/node", "r-xp")
+    backend.mmap(101, "/opt/node/share/icudt.dat", "r--p")
+
+    monitor = ProcessMonitor(pid=100, project_root=tmp_path, backend=backend)
+    events = {
+        (event.kind, event.target): event.severity
+        for event in monitor.poll()
+        if event.kind != "EXEC"
+    }
+    assert events == {
+        ("READ", "/usr/lib/x86_64-linux-gnu/libc.so.6"): "low",
+        ("WRITE", str(tmp_path / "state.db")): "medium",
+        ("READ", "/opt/models/cache.bin"): "medium",
+        ("READ", "/opt/node/bin/node"): "low",
+        ("READ", "/opt/node/share/icudt.dat"): "medium",
+    }
+    parsed = monitor.maps_parsed
+
+    assert monitor.poll() == []
+    assert monitor.maps_parsed == parsed
+
+    backend.munmap(101, "/opt/models/cache.bin")
+    backend.mmap(101, "/home/user/.aws/credentials")
+    assert [(event.kind, event.target, event.severity) for event in monitor.poll()] == [
+        ("READ", "/home/user/.aws/credentials", "critical")
+    ]
+    assert monitor.maps_parsed == parsed + 1
+
+
+def test_maps_tracking_can_be_disabled() -> None:
+    backend = _synthetic_tree()
+    backend.mmap(102, "/srv/data.sqlite", "rw-s")
+    monitor = ProcessMonitor(pid=100, backend=backend, maps=False)
+    assert all(event.kind == "EXEC" for event in monitor.poll())
+    assert monitor.maps_parsed == 0
+
+
+def test_parse_maps_skips_anonymous_and_strips_deleted() -> None:
+    raw = (
+        b"55d0-55d1 r--p 00000000 08:01 42  /usr/bin/python3.11\n"
+        b"55d1-55d2 r-xp 00001000 08:01 42  /usr/bin/python3.11\n"
+        b"55d2-55d3 rw-p 00000000 00:00 0  [heap]\n"
+        b"7f00-7f01 rw-s 00000000 00:05 99  /dev/shm/buffer (deleted)\n"
+        b"7f02-7f03 r--p 00000000 00:00 0 \n"
+    )
+    assert _parse_maps(raw) == {
+        ("/usr/bin/python3.11", False, True),
+        ("/dev/shm/buffer", True, False),
+    }
@@ -0,0 +1,66 @@
+import json
+from pathlib import Path
+
+from agent_audit.checks.network import evaluate_network
+from agent_audit.types import Endpoint
+from agent_audit.utils.netclass import NetworkClassifier, load_network_classifier
+from benchmarks.network import RULES, fleet_endpoints
+
+
+def test_subdomains_inherit_domain_rules() -> None:
+    classifier = load_network_classifier()
+    assert classifier.classify("https://eu.api.openai.com/v1").label == "allow"
+    assert classifier.classify("abc.ngrok-free.app").label == "deny"
+    assert classifier.classify("https://openai.com").label is None
+
+
+def test_hostname_containing_any_is_not_wildcard() -> None:
+    result = evaluate_network(["https://company.example.com"])
+    assert result.severity == "medium"
+    assert evaluate_network(["*"]).severity == "critical"
+    assert evaluate_network(["0.0.0.0:8080"]).severity == "critical"
+
+
+def test_ip_ranges_use_most_specific_cidr() -> None:
+    classifier = load_network_classifier()
+    assert classifier.classify("http://169.254.169.254/latest").label == "metadata"
+    assert classifier.classify("169.254.10.1").label == "link_local"
+    assert classifier.classify("10.1.2.3:5432").label == "private"
+    assert classifier.classify("[::1]:8080").label == "loopback"
+    assert classifier.classify("http://localhost:11434/api").label == "loopback"
+    assert classifier.classify("app.localhost").label == "loopback"
+    assert classifier.classify("8.8.8.8").label is None
+
+
+def test_metadata_endpoint_is_high_risk() -> None:
+    result = evaluate_network(["https://169.254.169.254"])
+    assert result.severity == "high"
+
+
+def test_user_rules_are_merged(tmp_path: Path) -> None:
+    rules = tmp_path / "rules.json"
+    rules.write_text(
+        json.dumps(
+            {"domains": {"allow": ["corp.example"]}, "networks": {"allow": ["10.20.0.0/16"]}}
+        ),
+        encoding="utf-8",
+    )
+    classifier = load_network_classifier(str(rules))
+    assert classifier.classify("https://llm.corp.example").label == "allow"
+    assert classifier.classify("10.20.1.1").label == "allow"
+    assert classifier.classify("10.21.1.1").label == "private"
+
+
+def test_classifies_large_fleet() -> None:
+    # Timing lives in benchmarks/network.py; this only checks the labels at fleet scale.
+    classifier = NetworkClassifier.from_rules(RULES)
+    labels = [classifier.classify(endpoint).label for endpoint in fleet_endpoints(100_000)]
+    assert labels.count("allow") == 50_000
+    assert labels.count("private") == 50_000
+
+
+def test_endpoint_details_do_not_depend_on_config_position() -> None:
+    first = evaluate_network([Endpoint("http://api.example.com", "endpoints[0]")])
+    moved = evaluate_network([Endpoint("http://api.example.com", "endpoints[3]")])
+    assert first.details == moved.details
+    assert "Non-TLS endpoint: http://api.example.com" in first.details
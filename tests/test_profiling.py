@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import json
+import pstats
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from agent_audit.adapters import detect_adapter
+from agent_audit.adapters.helpers import find_files
+from agent_audit.cli import app
+from agent_audit.core.scanner import Scanner
+from agent_audit.utils.profiling import ScanProfile, count_read, profiling, stage
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def test_stages_are_noops_without_profile() -> None:
+    with stage("detect"):
+        count_read(10)
+    profile = ScanProfile()
+    with profiling(profile):
+        with stage("detect"):
+            count_read(10)
+        with stage("detect"):
+            pass
+    with stage("detect"):
+        count_read(10)
+    assert profile.stages["detect"].calls == 2
+    assert (profile.files_read, profile.bytes_read) == (1, 10)
+
+
+def test_scan_records_stages_and_file_counts() -> None:
+    profile = ScanProfile()
+    with profiling(profile):
+        Scanner().scan_path(FIXTURES / "openclaw_basic")
+    for name in ("detect", "adapter.get_config", "check.network", "check.skills", "scoring"):
+        assert profile.stages[name].calls == 1
+    assert profile.stages["detect"].wall_s >= profile.stages["detect.signatures"].wall_s
+    assert profile.files_stat > 0
+    assert profile.files_read > 0
+    assert profile.bytes_read > 0
+
+
+def test_fuzzy_detection_counts_walked_entries(tmp_path: Path) -> None:
+    nested = tmp_path / "deploy" / "agents"
+    nested.mkdir(parents=True)
+    for index in range(50):
+        (nested / f"notes{index}.txt").write_text("x", encoding="utf-8")
+    (nested / "team-nanobot.json").write_text('{"agent": "nanobot"}', encoding="utf-8")
+    assert list(find_files(tmp_path, "*nanobot*.json")) == [nested / "team-nanobot.json"]
+
+    profile = ScanProfile()
+    with profiling(profile):
+        assert detect_adapter(tmp_path).name == "nanobot"
+    assert profile.files_stat >= 50
+
+
+def test_scan_profile_in_json_and_pstats(tmp_path: Path) -> None:
+    pstats_path = tmp_path / "scan.pstats"
+    result = CliRunner().invoke(
+        app,
+        [
+            "scan",
+            str(FIXTURES / "openclaw_basic"),
+            "--format",
+            "json",
+            "--profile-out",
+            str(pstats_path),
+        ],
+    )
+    assert result.exit_code == 0
+    payload = json.loads(result.stdout)
+    assert payload["results"]["adapter_name"] == "openclaw"
+    assert payload["profile"]["stages"]["render"]["calls"] == 1
+    assert payload["profile"]["files_read"] > 0
+    assert pstats.Stats(str(pstats_path)).total_calls > 0
+
+
+def test_scan_profile_table_goes_to_stderr() -> None:
+    result = CliRunner().invoke(
+        app, ["scan", str(FIXTURES / "codex_scoped"), "--format", "markdown", "--profile"]
+    )
+    assert result.exit_code == 0
+    assert "| Stage |" in result.stderr
+    assert "Files stat'ed:" in result.stderr
+    assert "| Stage |" not in result.stdout
@@ -0,0 +1,121 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from agent_audit.adapters import AdapterRegistry, AdapterSpec, Signature, match_adapter
+from agent_audit.adapters import registry as registry_module
+from agent_audit.adapters.registry import BUILTIN_SPECS, FUZZY_CONFIDENCE, _existing_files
+
+
+@pytest.mark.parametrize("spec", BUILTIN_SPECS, ids=lambda spec: spec.name)
+def test_builtin_signatures_match_adapter_candidates(spec: AdapterSpec) -> None:
+    adapter = spec.load()
+    assert adapter.name == spec.name
+    assert [signature.path for signature in spec.signatures] == adapter._config_candidates
+
+
+def test_exact_signature_beats_earlier_fuzzy_match(tmp_path: Path) -> None:
+    (tmp_path / ".codex").mkdir()
+    (tmp_path / ".codex" / "config.toml").write_text("", encoding="utf-8")
+    (tmp_path / "notes-openclaw-export.json").write_text("{}", encoding="utf-8")
+
+    match = match_adapter(tmp_path)
+    assert match.adapter.name == "codex"
+    assert match.confidence == 1.0
+
+
+def test_fuzzy_fallback_reports_lower_confidence(tmp_path: Path) -> None:
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "my-openclaw-profile.json").write_text("{}", encoding="utf-8")
+
+    match = match_adapter(tmp_path)
+    assert match.adapter.name == "openclaw"
+    assert match.confidence == FUZZY_CONFIDENCE
+
+
+def test_weak_signature_is_confirmed_by_adapter(tmp_path: Path) -> None:
+    (tmp_path / "config.json").write_text(json.dumps({"agent": "something-else"}), encoding="utf-8")
+    (tmp_path / "mcp.json").write_text("{}", encoding="utf-8")
+    assert match_adapter(tmp_path).adapter.name == "mcp_generic"
+
+    (tmp_path / "config.json").write_text(json.dumps({"agent": "nanobot"}), encoding="utf-8")
+    assert match_adapter(tmp_path).adapter.name == "mcp_generic"  # 0.9 beats the 0.6 signature
+    (tmp_path / "mcp.json").unlink()
+    match = match_adapter(tmp_path)
+    assert (match.adapter.name, match.confidence) == ("nanobot", 0.6)
+
+
+def test_undetectable_path_raises(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="Could not detect"):
+        match_adapter(tmp_path)
+
+
+def test_existing_files_only_lists_present_directories(tmp_path: Path) -> None:
+    (tmp_path / ".claude").mkdir()
+    (tmp_path / ".claude" / "settings.json").write_text("{}", encoding="utf-8")
+    (tmp_path / "codex.toml").mkdir()  # a directory is not a signature hit
+    found = _existing_files(tmp_path, [".claude/settings.json", "codex.toml", ".codex/config.toml"])
+    assert found == {".claude/settings.json"}
+
+
+def test_specs_load_lazily(tmp_path: Path) -> None:
+    spec = AdapterSpec(
+        name="openclaw",
+        target="agent_audit.adapters.openclaw:OpenClawAdapter",
+        signatures=(Signature("openclaw.json"),),
+    )
+    unused = AdapterSpec(name="broken", target="agent_audit.adapters.does_not_exist:Adapter")
+    registry = AdapterRegistry([spec, unused], entry_points=False)
+    (tmp_path / "openclaw.json").write_text("{}", encoding="utf-8")
+
+    assert registry.match(tmp_path).adapter.name == "openclaw"
+    assert unused._adapter is None
+
+
+def test_plugins_are_only_discovered_without_full_confidence_hit(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls: list[None] = []
+    monkeypatch.setattr(registry_module, "_entry_point_specs", lambda: calls.append(None) or [])
+    (tmp_path / "exact").mkdir()
+    (tmp_path / "exact" / "openclaw.json").write_text("{}", encoding="utf-8")
+    (tmp_path / "weak").mkdir()
+    (tmp_path / "weak" / "mcp.json").write_text('{"mcpServers": {}}', encoding="utf-8")
+
+    registry = AdapterRegistry()
+    assert registry.match(tmp_path / "exact").adapter.name == "openclaw"
+    assert calls == []
+    assert registry.match(tmp_path / "weak").adapter.name == "mcp_generic"
+    assert calls == [None]
+
+
+class _RaisingAdapter:
+    name = "raising"
+
+    def detect(self, path: Path) -> bool:
+        raise RuntimeError("plugin bug")
+
+
+def test_broken_plugins_are_logged_and_skipped(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    unloadable = AdapterSpec(
+        name="unloadable",
+        target="agent_audit.adapters.does_not_exist:Adapter",
+        signatures=(Signature("nanobot.json"),),
+    )
+    raising = AdapterSpec(name="raising", target=f"{__name__}:_RaisingAdapter")
+    registry = AdapterRegistry([unloadable, raising, *BUILTIN_SPECS], entry_points=False)
+    (tmp_path / "nanobot.json").write_text('{"agent": "nanobot"}', encoding="utf-8")
+
+    assert registry.match(tmp_path).adapter.name == "nanobot"
+    messages = [record.getMessage() for record in caplog.records]
+    assert any("Skipping adapter unloadable" in message for message in messages)
+    assert [adapter.name for adapter in registry.adapters()][0] == "raising"
+
+    (tmp_path / "nanobot.json").unlink()
+    (tmp_path / "deploy-nanobot.json").write_text("{}", encoding="utf-8")
+    assert registry.match(tmp_path).adapter.name == "nanobot"
+    messages = [record.getMessage() for record in caplog.records]
+    assert any("Skipping adapter raising: detect() failed" in message for message in messages)
@@ -0,0 +1,76 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from agent_audit.core import serialize
+from agent_audit.core.scanner import Scanner
+from agent_audit.core.serialize import decode_results, encode_results, load_results
+from agent_audit.types import SCHEMA_VERSION, ScanResult
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def _results() -> list[ScanResult]:
+    scanner = Scanner()
+    return [scanner.scan_path(FIXTURES / name) for name in ("openclaw_basic", "codex_scoped")]
+
+
+def test_dict_round_trip() -> None:
+    for result in _results():
+        payload = json.loads(json.dumps(result.to_dict()))
+        assert payload["schema_version"] == SCHEMA_VERSION
+        assert ScanResult.from_dict(payload) == result
+
+
+def test_unversioned_payload_is_accepted() -> None:
+    payload = _results()[0].to_dict()
+    del payload["schema_version"]
+    assert ScanResult.from_dict(payload).risk_score == payload["risk_score"]
+
+
+def test_newer_schema_is_rejected() -> None:
+    payload = _results()[0].to_dict()
+    payload["schema_version"] = SCHEMA_VERSION + 1
+    with pytest.raises(ValueError, match="newer than supported"):
+        ScanResult.from_dict(payload)
+
+
+def test_binary_round_trip_and_size() -> None:
+    results = _results() * 50
+    blob = encode_results(results)
+    assert decode_results(blob) == results
+    ndjson = "\n".join(json.dumps(result.to_dict()) for result in results)
+    assert len(blob) < len(ndjson) / 4
+
+
+def test_binary_round_trip_past_intern_limit(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(serialize, "INTERN_LIMIT", 8)
+    result = _results()[1]
+    results = []
+    for index in range(20):
+        copy = ScanResult.from_dict(result.to_dict())
+        copy.scanned_path = f"/agents/{index}"
+        results.append(copy)
+    assert decode_results(encode_results(results)) == results
+
+
+def test_corrupt_archive_raises_value_error() -> None:
+    blob = encode_results(_results())
+    with pytest.raises(ValueError):
+        decode_results(blob[:-3])
+    with pytest.raises(ValueError, match="bad magic"):
+        decode_results(b"nope")
+
+
+def test_load_results_detects_format(tmp_path: Path) -> None:
+    results = _results()
+    archive = tmp_path / "results.bin"
+    archive.write_bytes(encode_results(results))
+    ndjson = tmp_path / "results.ndjson"
+    ndjson.write_text("\n".join(json.dumps(item.to_dict()) for item in results), encoding="utf-8")
+    single = tmp_path / "result.json"
+    single.write_text(json.dumps(results[0].to_dict(), indent=2), encoding="utf-8")
+    assert load_results(archive) == results
+    assert load_results(ndjson) == results
+    assert load_results(single) == results[:1]
@@ -0,0 +1,183 @@
+import json
+import socket
+import sqlite3
+import threading
+from pathlib import Path
+from time import perf_counter
+
+import pytest
+
+from agent_audit.core.monitor import MonitorEvent, SessionMonitor
+from agent_audit.core.sinks import (
+    DatagramSink,
+    JsonlFileSink,
+    SinkDispatcher,
+    SqliteSink,
+    parse_sink,
+)
+
+
+def _events(count: int) -> list[MonitorEvent]:
+    return [
+        MonitorEvent(kind="READ", target=f"/work/file{index}", severity="low")
+        for index in range(count)
+    ]
+
+
+class _BlockedSink:
+    name = "blocked"
+
+    def __init__(self) -> None:
+        self.release = threading.Event()
+        self.received: list[MonitorEvent] = []
+
+        self.closed = threading.Event()
+
+    def write_batch(self, events: list[MonitorEvent]) -> int:
+        self.release.wait(5)
+        self.received.extend(events)
+        return len(events)
+
+    def close(self) -> None:
+        self.closed.set()
+
+
+def test_session_fans_out_to_file_socket_and_sqlite(tmp_path: Path) -> None:
+    receiver = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    receiver.bind(str(tmp_path / "events.sock"))
+    receiver.settimeout(2)
+
+    session = SessionMonitor(
+        [
+            JsonlFileSink(tmp_path / "events.jsonl"),
+            DatagramSink(tmp_path / "events.sock"),
+            SqliteSink(tmp_path / "events.db"),
+        ]
+    )
+    for event in _events(3):
+        session.record(event)
+    session.close()
+
+    lines = (tmp_path / "events.jsonl").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["target"] for line in lines] == [
+        "/work/file0",
+        "/work/file1",
+        "/work/file2",
+    ]
+    datagrams = [json.loads(receiver.recv(65536)) for _ in range(3)]
+    assert datagrams[0]["kind"] == "READ"
+    with sqlite3.connect(tmp_path / "events.db") as connection:
+        assert connection.execute("SELECT COUNT(*) FROM events").fetchone() == (3,)
+    assert all(stats.written == 3 and stats.dropped == 0 for stats in session.sink_stats().values())
+    receiver.close()
+
+
+def test_sqlite_sink_records_coalesced_counts(tmp_path: Path) -> None:
+    path = tmp_path / "events.db"
+    with sqlite3.connect(path) as connection:
+        # A table created before events carried a count.
+        connection.execute(
+            "CREATE TABLE events (id INTEGER PRIMARY KEY, timestamp TEXT NOT NULL, "
+            "kind TEXT NOT NULL, target TEXT NOT NULL, severity TEXT NOT NULL)"
+        )
+    sink = SqliteSink(path)
+    rollup = MonitorEvent(kind="READ", target="/work/node_modules", severity="low", count=500)
+    assert sink.write_batch([rollup, *_events(1)]) == 2
+    sink.close()
+    with sqlite3.connect(path) as connection:
+        counts = connection.execute("SELECT count FROM events ORDER BY id").fetchall()
+    assert counts == [(500,), (1,)]
+
+
+def test_jsonl_sink_rotates(tmp_path: Path) -> None:
+    sink = JsonlFileSink(tmp_path / "events.jsonl", max_bytes=200, backups=2)
+    for _ in range(6):
+        sink.write_batch(_events(2))
+    sink.close()
+    assert (tmp_path / "events.jsonl.1").exists()
+    assert (tmp_path / "events.jsonl.2").exists()
+    assert not (tmp_path / "events.jsonl.3").exists()
+
+
+def test_missing_datagram_receiver_counts_errors(tmp_path: Path) -> None:
+    dispatcher = SinkDispatcher(DatagramSink(tmp_path / "nobody.sock"), flush_interval=0.01)
+    for event in _events(4):
+        dispatcher.submit(event)
+    dispatcher.close()
+    assert dispatcher.stats.errors >= 1
+    assert dispatcher.stats.dropped == 4
+    assert dispatcher.stats.written == 0
+
+
+@pytest.mark.parametrize(
+    ("policy", "expected_first"),
+    [("drop_oldest", "/work/file2"), ("drop_newest", "/work/file0"), ("block", "/work/file0")],
+)
+def test_full_queue_applies_drop_policy_without_blocking(policy: str, expected_first: str) -> None:
+    sink = _BlockedSink()
+    dispatcher = SinkDispatcher(sink, max_queue=3, batch_size=100, flush_interval=60, policy=policy)
+
+    started = perf_counter()
+    accepted = [dispatcher.submit(event) for event in _events(5)]
+    assert perf_counter() - started < 1.0
+    assert accepted.count(True) == (5 if policy == "drop_oldest" else 3)
+    assert dispatcher.stats.dropped == 2
+
+    sink.release.set()
+    dispatcher.close()
+    assert sink.received[0].target == expected_first
+    assert dispatcher.stats.written == 3
+
+
+def test_block_policy_waits_at_most_block_timeout_per_poll() -> None:
+    sink = _BlockedSink()
+    dispatcher = SinkDispatcher(
+        sink, max_queue=1, batch_size=100, flush_interval=60, policy="block", block_timeout=0.1
+    )
+    started = perf_counter()
+    assert dispatcher.submit_many(_events(10)) == 1
+    # One shared budget rather than 0.1 s for each of the nine events that did not fit.
+    assert perf_counter() - started < 0.5
+    assert dispatcher.stats.dropped == 9
+    sink.release.set()
+    dispatcher.close()
+
+
+def test_close_timeout_does_not_close_sink_under_a_running_write() -> None:
+    sink = _BlockedSink()
+    dispatcher = SinkDispatcher(sink, batch_size=2, flush_interval=60)
+    dispatcher.submit_many(_events(5))
+    for _ in range(100):
+        if len(dispatcher._queue) == 3:
+            break
+        threading.Event().wait(0.01)
+
+    dispatcher.close(timeout=0.05)
+    # The first batch is still inside write_batch; the queued rest is given up.
+    assert not sink.closed.is_set()
+    assert dispatcher.stats.dropped == 3
+    sink.release.set()
+    assert sink.closed.wait(2)
+    assert [event.target for event in sink.received] == ["/work/file0", "/work/file1"]
+    assert dispatcher.stats.written == 2
+
+
+def test_dispatcher_flushes_on_batch_size_and_interval() -> None:
+    sink = _BlockedSink()
+    sink.release.set()
+    dispatcher = SinkDispatcher(sink, batch_size=2, flush_interval=0.05)
+    for event in _events(3):
+        dispatcher.submit(event)
+    for _ in range(100):
+        if len(sink.received) == 3:
+            break
+        threading.Event().wait(0.01)
+    assert len(sink.received) == 3
+    assert dispatcher.stats.batches == 2
+    dispatcher.close()
+
+
+def test_parse_sink_rejects_unknown_kinds(tmp_path: Path) -> None:
+    assert isinstance(parse_sink(f"sqlite:{tmp_path / 'x.db'}"), SqliteSink)
+    with pytest.raises(ValueError, match="Invalid sink"):
+        parse_sink("kafka:topic")
@@ -0,0 +1,64 @@
+import pytest
+
+from agent_audit.checks.skills import evaluate_skills
+from agent_audit.types import Skill
+from agent_audit.utils.permissions import PermissionVocabulary, normalize_permission
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ("Network.Outbound", "network.outbound"),
+        ("shell:bash", "shell.bash"),
+        ("filesystem/write", "filesystem.write"),
+        (" Filesystem.* ", "filesystem.*"),
+    ],
+)
+def test_normalize_permission(raw: str, expected: str) -> None:
+    assert normalize_permission(raw) == expected
+
+
+def test_vocabulary_resolves_nearest_known_ancestor() -> None:
+    vocabulary = PermissionVocabulary()
+    assert vocabulary.canonical("shell:bash") == "shell"
+    assert vocabulary.canonical("network.outbound.https") == "network.outbound"
+    assert vocabulary.canonical("network.custom.*") == "network.*"
+    assert vocabulary.canonical("telemetry") is None
+
+
+def test_wildcard_expansion_implies_subtree() -> None:
+    vocabulary = PermissionVocabulary()
+    declared, _ = vocabulary.declared(["filesystem.*"])
+    implied = set(vocabulary.iter_names(vocabulary.implied(declared)))
+    assert {"filesystem", "filesystem.read", "filesystem.write", "filesystem.*"} <= implied
+    assert "network" not in implied
+
+    everything, _ = vocabulary.declared(["*"])
+    assert vocabulary.implied(everything) == (1 << len(vocabulary.names)) - 1
+
+
+def test_skill_risk_uses_hierarchy() -> None:
+    result = evaluate_skills(
+        [
+            Skill(name="wild", permissions=["Filesystem.*"]),
+            Skill(name="shell", permissions=["shell:bash"]),
+            Skill(name="fetch", permissions=["Network.Outbound"]),
+            Skill(name="plain", permissions=["filesystem", "telemetry"]),
+        ]
+    )
+    assert result.severity == "high"
+    assert "High-risk skill: wild (filesystem.*)" in result.details
+    assert "High-risk skill: shell (shell)" in result.details
+    assert "Medium-risk skill: fetch (network.outbound)" in result.details
+    assert not any("plain" in line for line in result.details)
+
+
+def test_skill_permission_counts_across_skills() -> None:
+    skills = [
+        Skill(name=f"s{index}", permissions=["filesystem.read", "Network"]) for index in range(3)
+    ]
+    skills.append(Skill(name="x", permissions=["network", "custom-thing"]))
+    result = evaluate_skills(skills)
+    assert result.severity == "medium"
+    assert "Permission counts: network=4, filesystem.read=3, custom-thing=1" in result.details
+    assert result.details[-1] == "Total installed skills: 4"
@@ -0,0 +1,21 @@
+from benchmarks.startup import COMMANDS, forbidden_imports, measure, parse_importtime
+
+
+def test_parse_importtime_sums_self_time() -> None:
+    stderr = "\n".join(
+        [
+            "import time: self [us] | cumulative | imported package",
+            "import time:       500 |        500 |   json.decoder",
+            "import time:      1500 |       2000 | json",
+        ]
+    )
+    total_ms, modules = parse_importtime(stderr)
+    assert total_ms == 2.0
+    assert modules == {"json", "json.decoder"}
+
+
+def test_cli_commands_do_not_import_unneeded_modules() -> None:
+    for command, (argv, forbidden) in COMMANDS.items():
+        sample = measure(command, argv)
+        assert "agent_audit.cli" in sample.modules
+        assert forbidden_imports(sample, forbidden) == set()
@@ -0,0 +1,77 @@
+import io
+import json
+import sys
+from pathlib import Path
+
+from agent_audit.core.scanner import Scanner
+from agent_audit.core.streaming import NdjsonWriter, Projection, SarifWriter
+from agent_audit.types import ScanResult
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+class _NullStream(io.TextIOBase):
+    def write(self, text: str) -> int:
+        return len(text)
+
+
+def test_ndjson_writes_one_line_per_result(openclaw_result: ScanResult) -> None:
+    buffer = io.StringIO()
+    result = openclaw_result
+    with NdjsonWriter(buffer, fields=["-checks.details"]) as writer:
+        writer.write_all([result, result])
+    lines = buffer.getvalue().splitlines()
+    assert len(lines) == 2
+    payload = json.loads(lines[0])
+    assert payload["risk_tier"] == result.risk_tier
+    assert "details" not in payload["checks"]["shell"]
+
+
+def test_projection_selects_fields(openclaw_result: ScanResult) -> None:
+    payload = openclaw_result.to_dict()
+    projected = Projection(["agent_name,checks.severity"]).apply(payload)
+    assert set(projected) == {"agent_name", "checks"}
+    assert projected["checks"]["shell"] == {"severity": "critical"}
+
+
+def test_sarif_is_valid_json_with_rules_for_seen_checks(openclaw_result: ScanResult) -> None:
+    buffer = io.StringIO()
+    result = openclaw_result
+    with SarifWriter(buffer, fields=["-checks.details"]) as writer:
+        writer.write(result)
+    log = json.loads(buffer.getvalue())
+    run = log["runs"][0]
+    assert log["version"] == "2.1.0"
+    assert {rule["id"] for rule in run["tool"]["driver"]["rules"]} == set(result.checks)
+    assert len(run["results"]) == len(result.checks)
+    assert "details" not in run["results"][0]["properties"]
+
+
+def test_sarif_reports_only_checks_with_findings() -> None:
+    buffer = io.StringIO()
+    result = Scanner().scan_path(FIXTURES / "codex_scoped")
+    with SarifWriter(buffer) as writer:
+        writer.write(result)
+    run = json.loads(buffer.getvalue())["runs"][0]
+    # filesystem and network are low (clean) for this fixture.
+    assert [item["ruleId"] for item in run["results"]] == ["shell", "secrets", "skills"]
+    assert [rule["id"] for rule in run["tool"]["driver"]["rules"]] == ["shell", "secrets", "skills"]
+    assert writer.count == 3
+
+
+def test_empty_sarif_log_is_valid() -> None:
+    buffer = io.StringIO()
+    SarifWriter(buffer).close()
+    assert json.loads(buffer.getvalue())["runs"][0]["results"] == []
+
+
+def test_writers_do_not_retain_results(openclaw_result: ScanResult) -> None:
+    result = openclaw_result
+    before = sys.getrefcount(result)
+    with SarifWriter(_NullStream()) as sarif, NdjsonWriter(_NullStream()) as ndjson:
+        for _ in range(100):
+            sarif.write(result)
+            ndjson.write(result)
+        assert sys.getrefcount(result) == before
+    assert sarif.count == 100 * len(result.checks)
+    assert ndjson.count == 100